@@ -0,0 +1,78 @@
+"""일반 스키마와 대량 적재 모드(외래 키/보조 인덱스를 적재 후 추가)의 적재 시간 비교
+
+    poetry run python benchmarks/bench_bulk_load.py --matches 2000
+
+.env의 MySQL 서버에 벤치마크 전용 데이터베이스(--database, 기본 ER_Dataset_bench)를 방식마다 새로 만들어
+같은 경기를 write_matches로 적재한다. 대량 적재 모드는 적재 시간과 finalize_db(무결성 검사 + 제약/인덱스 추가) 시간을 따로 보고한다.
+외래 키가 가리키는 정적 테이블(캐릭터, 장비, 특성)에는 경기에 나온 ID만 넣는다. 끝나면 벤치마크 데이터베이스를 삭제한다.
+"""
+import argparse
+from time import perf_counter
+from payloads import get_payloads
+from parsing import TABLE_COLUMNS, parse_match_rows
+from init_db import init_db, finalize_db, read_foreign_keys, connect_database
+from db_utils import write_matches
+
+def insert_referenced_ids(conn, match_rows: list) -> None:
+    """경기 테이블의 외래 키가 가리키는 정적 테이블에 ID만 채움 (나머지 컬럼은 sql_mode=''의 암묵적 기본값)"""
+    with conn.cursor() as cursor:
+        cursor.execute("SET SESSION sql_mode = ''")
+        for foreign_key in read_foreign_keys():
+            if foreign_key.ref_table in TABLE_COLUMNS or foreign_key.table not in TABLE_COLUMNS:
+                continue
+            index = TABLE_COLUMNS[foreign_key.table].index(foreign_key.columns[0])
+            ids = {row[index] for rows in match_rows for row in rows[foreign_key.table]} - {None}
+            if ids:
+                cursor.executemany(
+                    f"INSERT IGNORE INTO {foreign_key.ref_table} ({foreign_key.ref_columns[0]}) VALUES (%s)",
+                    [(value,) for value in ids])
+        cursor.execute("SET SESSION sql_mode = DEFAULT")
+
+def load(database: str, items: list, bulk_load: bool) -> tuple:
+    """스키마를 새로 만들고 경기를 적재. (적재 시간, finalize 시간) 초"""
+    init_db(bulk_load=bulk_load, database=database)
+    conn = connect_database(database)
+    try:
+        insert_referenced_ids(conn, [rows for _, rows in items])
+        start = perf_counter()
+        saved = write_matches(conn, items)
+        elapsed = perf_counter() - start
+    finally:
+        conn.close()
+    failed = sum(1 for success in saved.values() if not success)
+    if failed:
+        print(f"  warning: {failed} matches failed to load")
+    finalize = 0.0
+    if bulk_load:
+        start = perf_counter()
+        orphans = finalize_db(database)
+        finalize = perf_counter() - start
+        if orphans:
+            print(f"  warning: orphan rows {orphans}")
+    return elapsed, finalize
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대량 적재 모드 벤치마크 (MySQL 필요)")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--matches", type=int, default=2000, help="적재할 경기 수")
+    parser.add_argument("--database", default="ER_Dataset_bench", help="벤치마크용으로 만들었다가 삭제할 데이터베이스")
+    args = parser.parse_args()
+
+    payloads, kind = get_payloads(args.matches, args.source)
+    items = [(data["userGames"][0]["gameId"], parse_match_rows(data)) for data in payloads]
+    total_rows = sum(len(table_rows) for _, rows in items for table_rows in rows.values())
+    print(f"{len(items)} {kind} matches, {total_rows} rows")
+
+    try:
+        normal, _ = load(args.database, items, bulk_load=False)
+        print(f"normal schema  load {normal:8.2f}s  {total_rows / normal:10,.0f} rows/s")
+        bulk, finalize = load(args.database, items, bulk_load=True)
+        print(f"bulk-load mode load {bulk:8.2f}s  {total_rows / bulk:10,.0f} rows/s  "
+              f"+ finalize {finalize:.2f}s = {bulk + finalize:.2f}s ({normal / (bulk + finalize):.2f}x)")
+    finally:
+        conn = connect_database()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"DROP DATABASE IF EXISTS {args.database}")
+        finally:
+            conn.close()
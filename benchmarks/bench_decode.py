@@ -0,0 +1,54 @@
+"""경기 응답 본문 → 행 튜플까지의 경기당 시간 비교
+
+    poetry run python benchmarks/bench_decode.py                 # data_raw 아카이브의 경기 사용
+    poetry run python benchmarks/bench_decode.py --source ./dumps # *.json 경기 파일 디렉토리 사용
+
+현재 경로(json.loads로 전체 응답을 딕셔너리로 만든 뒤 파싱)와 decoding.decode_match
+(msgspec, 파서가 읽는 필드만 디코딩)의 디코딩+파싱 시간과 파서 프로세스로 넘어가는 크기를 비교한다.
+"""
+import json
+import pickle
+import argparse
+from time import perf_counter
+from payloads import get_payloads
+from decoding import MatchResponse, msgspec
+from parsing import parse_match_rows
+
+def best_of(func, bodies: list, repeat: int) -> float:
+    """repeat번 측정한 뒤 가장 빠른 경기당 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for body in bodies:
+            func(body)
+        best = min(best, perf_counter() - start)
+    return best / len(bodies)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="경기 응답 디코딩 벤치마크")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--limit", type=int, default=1000, help="사용할 경기 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    if msgspec is None:
+        raise SystemExit("msgspec is not installed (pip install msgspec)")
+    decode_match = msgspec.json.Decoder(MatchResponse).decode
+
+    payloads, kind = get_payloads(args.limit, args.source)
+    bodies = [json.dumps(data, ensure_ascii=False).encode("utf-8") for data in payloads]
+    for body in bodies:
+        assert parse_match_rows(decode_match(body)) == parse_match_rows(json.loads(body)), "typed decode changes parsed rows"
+    print(f"{len(bodies)} {kind} matches ({sum(map(len, bodies)) / len(bodies) / 1024:.1f} KiB/match), parsed rows identical")
+
+    std_decode = best_of(json.loads, bodies, args.repeat)
+    fast_decode = best_of(decode_match, bodies, args.repeat)
+    std_total = best_of(lambda body: parse_match_rows(json.loads(body)), bodies, args.repeat)
+    fast_total = best_of(lambda body: parse_match_rows(decode_match(body)), bodies, args.repeat)
+    print(f"decode        json.loads: {std_decode * 1e6:8.1f} us/match, msgspec: {fast_decode * 1e6:8.1f} us/match  ({std_decode / fast_decode:.2f}x)")
+    print(f"decode+parse  json.loads: {std_total * 1e6:8.1f} us/match, msgspec: {fast_total * 1e6:8.1f} us/match  ({std_total / fast_total:.2f}x)")
+
+    # 디코딩된 경기는 pickle로 파서 프로세스에 넘어감
+    std_size = sum(len(pickle.dumps(json.loads(body))) for body in bodies) / len(bodies)
+    fast_size = sum(len(pickle.dumps(decode_match(body))) for body in bodies) / len(bodies)
+    print(f"pickled decoded match: json.loads {std_size / 1024:.1f} KiB, msgspec {fast_size / 1024:.1f} KiB")
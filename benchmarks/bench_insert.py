@@ -0,0 +1,55 @@
+"""경기 행 적재 방식별 처리량(rows/s) 비교: executemany(기존) / values(다중 행 INSERT) / load_data(LOAD DATA LOCAL INFILE)
+
+    poetry run python benchmarks/bench_insert.py --matches 500
+
+.env의 MySQL에 접속해 매치 테이블과 같은 구조의 임시 테이블(CREATE TEMPORARY TABLE ... LIKE)을 만들고
+같은 행을 방식별로 적재한다. 임시 테이블이라 실제 데이터는 건드리지 않으며, load_data는 서버의 local_infile=ON이 필요하다.
+"""
+import argparse
+from time import perf_counter
+import pymysql
+from payloads import get_payloads
+from parsing import TABLE_COLUMNS, MatchBatch, RowBatch, parse_match_rows
+from db_utils import (
+    DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME, BULK_LOADERS, insert_batch, get_max_allowed_packet,
+    get_denormalized_columns,
+)
+
+def load_once(conn, match_batch: MatchBatch, loader: str) -> float:
+    """임시 테이블을 비우고 배치 전체를 적재해 커밋까지 걸린 시간(초)"""
+    with conn.cursor() as cursor:
+        for table in TABLE_COLUMNS:
+            cursor.execute(f"TRUNCATE TABLE bench_{table}")
+    conn.commit()
+    start = perf_counter()
+    for batch in match_batch.batches():
+        insert_batch(conn, RowBatch(f"bench_{batch.table}", batch.columns, batch.rows), loader)
+    conn.commit()
+    return perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="경기 행 적재 방식 벤치마크 (MySQL 필요)")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--matches", type=int, default=500, help="적재할 경기 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    parser.add_argument("--loaders", default=",".join(BULK_LOADERS), help="비교할 적재 방식 (쉼표로 구분)")
+    args = parser.parse_args()
+
+    payloads, kind = get_payloads(args.matches, args.source)
+    match_batch = MatchBatch(get_denormalized_columns())
+    for data in payloads:
+        match_batch.add(data["userGames"][0]["gameId"], parse_match_rows(data))
+    total_rows = sum(len(batch) for batch in match_batch.batches())
+
+    conn = pymysql.connect(host=DB_HOST, port=DB_PORT, user=DB_USER, password=DB_PASSWORD, database=DB_NAME,
+                           charset="utf8mb4", autocommit=False, local_infile=True)
+    try:
+        with conn.cursor() as cursor:
+            for table in TABLE_COLUMNS:
+                cursor.execute(f"CREATE TEMPORARY TABLE bench_{table} LIKE {table}")
+        print(f"{len(payloads)} {kind} matches, {total_rows} rows, max_allowed_packet={get_max_allowed_packet(conn)}")
+        for loader in args.loaders.split(","):
+            best = min(load_once(conn, match_batch, loader) for _ in range(args.repeat))
+            print(f"{loader:12s} {total_rows / best:12,.0f} rows/s  ({best:.2f}s)")
+    finally:
+        conn.close()
@@ -0,0 +1,75 @@
+"""Parquet 출력의 쓰기 속도 / 파일 크기와 분석 쿼리(캐릭터별 승률) 전체 스캔 시간 측정
+
+    poetry run python benchmarks/bench_parquet.py --limit 5000
+    poetry run python benchmarks/bench_parquet.py --limit 5000 --mysql   # 같은 쿼리를 MySQL에서도 실행
+
+--mysql을 주면 .env의 DB에 있는 match_user_basic / match_team_info로 같은 집계를 실행해 비교한다.
+"""
+import os
+import argparse
+import tempfile
+from time import perf_counter
+from payloads import get_payloads
+from parsing import parse_match_rows
+from parquet_sink import ParquetSink
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+WIN_RATE_SQL = """
+SELECT b.character_id, COUNT(*) AS games, AVG(t.team_ranking = 1) AS win_rate, AVG(b.total_damage_to_player) AS avg_damage
+FROM match_user_basic b JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id
+GROUP BY b.character_id
+"""
+
+def parquet_win_rate(root: str):
+    basic = ds.dataset(os.path.join(root, "match_user_basic"), partitioning="hive").to_table(
+        columns=["match_id", "team_id", "character_id", "total_damage_to_player"])
+    teams = ds.dataset(os.path.join(root, "match_team_info"), partitioning="hive").to_table(
+        columns=["match_id", "team_id", "team_ranking"])
+    # schema.sql에서 두 테이블의 team_id 타입이 달라 조인 전에 맞춤
+    teams = teams.set_column(1, "team_id", teams["team_id"].cast(basic.schema.field("team_id").type))
+    joined = basic.join(teams, ["match_id", "team_id"])
+    joined = joined.append_column("win", pc.equal(joined["team_ranking"], 1))
+    return joined.group_by("character_id").aggregate([
+        ("match_id", "count"), ("win", "mean"), ("total_damage_to_player", "mean"),
+    ])
+
+def directory_size(root: str) -> int:
+    return sum(os.path.getsize(os.path.join(dirpath, name)) for dirpath, _, names in os.walk(root) for name in names)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parquet 출력 벤치마크")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--limit", type=int, default=2000, help="사용할 경기 수")
+    parser.add_argument("--mysql", action="store_true", help="같은 집계를 MySQL에서도 실행")
+    args = parser.parse_args()
+
+    payloads, kind = get_payloads(args.limit, args.source)
+    match_rows = [parse_match_rows(data) for data in payloads]
+    root = tempfile.mkdtemp(prefix="parquet_bench_")
+    sink = ParquetSink(root)
+
+    start = perf_counter()
+    for rows in match_rows:
+        sink.add(rows)
+    sink.flush()
+    elapsed = perf_counter() - start
+    size = directory_size(root)
+    print(f"{len(match_rows)} {kind} matches: {sink.rows_written / elapsed:,.0f} rows/s written, "
+          f"{size / len(match_rows) / 1024:.1f} KiB/match on disk ({root})")
+
+    start = perf_counter()
+    result = parquet_win_rate(root)
+    print(f"parquet win rate by character: {perf_counter() - start:.3f}s ({result.num_rows} characters)")
+
+    if args.mysql:
+        from db_utils import get_db_connection
+        conn = get_db_connection()
+        try:
+            with conn.cursor() as cursor:
+                start = perf_counter()
+                cursor.execute(WIN_RATE_SQL)
+                rows = cursor.fetchall()
+                print(f"mysql   win rate by character: {perf_counter() - start:.3f}s ({len(rows)} characters)")
+        finally:
+            conn.close()
@@ -0,0 +1,116 @@
+"""테이블별 parse_* 함수 14개를 차례로 호출하던 예전 방식(legacy_parsing.parse_match_data, 기준선)과
+userGames를 한 번만 순회하는 parse_match_rows(match_spec을 버전별로 컴파일한 행 튜플 추출, 파이프라인이 사용)의 경기당 파싱 시간 비교
+
+    poetry run python benchmarks/bench_parse.py                  # data_raw 아카이브의 경기 사용
+    poetry run python benchmarks/bench_parse.py --source ./dumps  # *.json 경기 파일 디렉토리 사용
+    poetry run python benchmarks/bench_parse.py --update-fixture  # match_spec을 의도적으로 바꾼 뒤 기대 결과 갱신
+
+기록된 경기가 없으면 가짜 경기로 측정한다. 측정 전에 모든 경기의 두 방식 결과가 같은지 확인하고,
+고정된 가짜 경기(버전 44, 46)의 파싱 결과가 fixtures/parse_expected.json에 저장된 기대 결과와 같은지도 확인한다.
+"""
+import os
+import json
+import pickle
+import argparse
+from time import perf_counter
+from payloads import get_payloads, synthetic_match
+from parsing import TABLE_COLUMNS, compile_match_extractor, parse_match_rows
+from legacy_parsing import parse_match_data
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "parse_expected.json")
+# (gameId, versionMajor). 버전별 분기(versionMajor <= 44)도 확인
+FIXTURE_CASES = ((1_000_000, 44), (1_000_001, 46))
+
+def to_json(rows: dict) -> dict:
+    """행 튜플을 fixture와 비교할 수 있는 JSON 값으로 변환 (튜플 → 리스트, datetime → ISO 문자열)"""
+    return json.loads(json.dumps(rows, default=lambda value: value.isoformat()))
+
+def write_fixture(path: str = FIXTURE_PATH) -> None:
+    """FIXTURE_CASES의 현재 파싱 결과를 기대 결과로 저장 (diff를 보기 쉽게 한 줄에 행 하나)"""
+    lines = ['{"cases": [']
+    for i, (game_id, version) in enumerate(FIXTURE_CASES):
+        expected = to_json(parse_match_rows(synthetic_match(game_id, version=version)))
+        lines.append(f' {{"game_id": {game_id}, "version": {version}, "expected": {{')
+        for j, (table, rows) in enumerate(expected.items()):
+            lines.append(f'  "{table}": [')
+            lines.extend(f"   {json.dumps(row, ensure_ascii=False)}{',' if k < len(rows) - 1 else ''}" for k, row in enumerate(rows))
+            lines.append(f"  ]{',' if j < len(expected) - 1 else ''}")
+        lines.append(f" }}}}{',' if i < len(FIXTURE_CASES) - 1 else ''}")
+    lines.append("]}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+def check_fixture(path: str = FIXTURE_PATH) -> None:
+    """FIXTURE_CASES의 파싱 결과가 저장된 기대 결과와 같은지 확인
+
+    Raises:
+        AssertionError: 테이블의 행이 기대 결과와 다를 때 발생
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        cases = json.load(f)["cases"]
+    for case in cases:
+        actual = to_json(parse_match_rows(synthetic_match(case["game_id"], version=case["version"])))
+        assert list(actual) == list(case["expected"]), f"tables differ: {list(actual)}"
+        for table, rows in case["expected"].items():
+            assert actual[table] == rows, f"{table} rows differ from {os.path.basename(path)} (version {case['version']})"
+
+def check_legacy(data: dict) -> None:
+    """parse_match_rows의 행 튜플이 기준선 parse_match_data의 딕셔너리(TABLE_COLUMNS 순서)와 같은지 확인
+
+    Raises:
+        AssertionError: 컬럼 순서나 행이 다를 때 발생
+    """
+    expected = parse_match_data(data)
+    rows = parse_match_rows(data)
+    assert list(rows) == list(expected), f"tables differ: {list(rows)}"
+    for table, table_rows in rows.items():
+        dicts = expected[table] if isinstance(expected[table], list) else [expected[table]]
+        assert all(tuple(d) == TABLE_COLUMNS[table] for d in dicts), f"{table} column order differs"
+        assert table_rows == [tuple(d.values()) for d in dicts], f"{table} rows differ (gameId {data['userGames'][0]['gameId']})"
+
+def best_of(func, payloads: list, repeat: int) -> float:
+    """repeat번 측정한 뒤 가장 빠른 경기당 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for data in payloads:
+            func(data)
+        best = min(best, perf_counter() - start)
+    return best / len(payloads)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="경기 파싱 벤치마크")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--limit", type=int, default=1000, help="사용할 경기 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--update-fixture", action="store_true", help="현재 파싱 결과로 fixtures/parse_expected.json을 다시 만듦")
+    args = parser.parse_args()
+
+    if args.update_fixture:
+        write_fixture()
+        print(f"wrote {FIXTURE_PATH}")
+    check_fixture()
+    print(f"{len(FIXTURE_CASES)} fixture matches identical to {os.path.basename(FIXTURE_PATH)}")
+
+    payloads, kind = get_payloads(args.limit, args.source)
+    for data in payloads:
+        check_legacy(data)
+    print(f"{len(payloads)} {kind} matches, outputs identical to the legacy parser")
+
+    legacy = best_of(parse_match_data, payloads, args.repeat)
+    rows = best_of(parse_match_rows, payloads, args.repeat)
+    print(f"legacy per-table parse_*:  {legacy * 1e6:8.1f} us/match")
+    print(f"parse_match_rows (tuples): {rows * 1e6:8.1f} us/match  ({legacy / rows:.2f}x)")
+
+    # 버전별 추출 함수는 프로세스마다 한 번만 컴파일
+    versions = sorted({data["userGames"][0]["versionMajor"] for data in payloads})
+    start = perf_counter()
+    for version in versions:
+        compile_match_extractor(version)
+    print(f"compile_match_extractor:   {(perf_counter() - start) / len(versions) * 1e3:8.2f} ms/version ({versions})")
+
+    # 파서 프로세스 → 적재 단계로 넘어가는 크기
+    dict_size = sum(len(pickle.dumps(parse_match_data(data))) for data in payloads) / len(payloads)
+    rows_size = sum(len(pickle.dumps(parse_match_rows(data))) for data in payloads) / len(payloads)
+    print(f"pickled per match: legacy dicts {dict_size / 1024:.1f} KiB, row tuples {rows_size / 1024:.1f} KiB")
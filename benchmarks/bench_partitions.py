@@ -0,0 +1,174 @@
+"""기본 스키마와 파티션 스키마(db/schema_partitioned.sql)의 버전별 분석 쿼리 시간 비교
+
+    poetry run python benchmarks/bench_partitions.py --matches 1000000 --versions 10
+
+스키마마다 벤치마크 전용 데이터베이스를 만들고, 쿼리에 쓰는 테이블(match_info, match_team_info,
+match_user_basic, match_user_equipment)에만 가짜 경기 행을 적재한다. 나머지 NOT NULL 컬럼은 sql_mode=''의
+암묵적 기본값으로 채운다. 경기 ID는 버전 순으로 증가하고 경기당 8팀 24명이다.
+측정 항목은 마지막 버전의 캐릭터별 승률과 무기 선택률(최소 --repeat회), 가장 오래된 버전 삭제
+(기본 스키마: DELETE, 파티션 스키마: DROP PARTITION)다. 끝나면 두 데이터베이스를 삭제한다.
+"""
+import os
+import random
+import argparse
+from time import perf_counter
+import payloads  # noqa: F401  (scripts 경로 추가)
+from init_db import init_db, connect_database
+from db_utils import insert_values
+from partitions import add_version_partition, drop_version_partition
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "db")
+CHUNK_MATCHES = 5000
+
+QUERIES = {
+    "default": {
+        "win_rate": """
+            SELECT b.character_id, COUNT(*), AVG(t.team_ranking = 1)
+            FROM match_info m
+            JOIN match_user_basic b ON b.match_id = m.match_id
+            JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id
+            WHERE m.version_major = %s GROUP BY b.character_id""",
+        "pick_rate": """
+            SELECT e.equipment_weapon, COUNT(*)
+            FROM match_info m JOIN match_user_equipment e ON e.match_id = m.match_id
+            WHERE m.version_major = %s GROUP BY e.equipment_weapon""",
+    },
+    "partitioned": {
+        "win_rate": """
+            SELECT b.character_id, COUNT(*), AVG(t.team_ranking = 1)
+            FROM match_user_basic b
+            JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id AND t.version_major = b.version_major
+            WHERE b.version_major = %s GROUP BY b.character_id""",
+        "pick_rate": """
+            SELECT equipment_weapon, COUNT(*) FROM match_user_equipment
+            WHERE version_major = %s GROUP BY equipment_weapon""",
+    },
+}
+
+def generate_chunk(r: random.Random, start: int, count: int, version: int, partitioned: bool) -> dict:
+    """경기 count개의 테이블별 행. 파티션 스키마면 match_info 외의 행 끝에 version_major를 붙임"""
+    tail = (version,) if partitioned else ()
+    rows = {"match_info": [], "match_team_info": [], "match_user_basic": [], "match_user_equipment": []}
+    for match_id in range(start, start + count):
+        rows["match_info"].append((match_id, 3, 31, version))
+        ranking = list(range(1, 9))
+        r.shuffle(ranking)
+        for team_id in range(1, 9):
+            rows["match_team_info"].append((match_id, team_id, ranking[team_id - 1]) + tail)
+            for slot in range(3):
+                user_id = r.randrange(1, 2_000_000)
+                rows["match_user_basic"].append(
+                    (match_id, user_id, team_id, r.randrange(1, 80), r.randrange(1000, 40000)) + tail)
+                rows["match_user_equipment"].append((match_id, user_id, r.randrange(101101, 101400)) + tail)
+    return rows
+
+def load(database: str, schema: str, matches: int, versions: list) -> float:
+    """스키마로 데이터베이스를 새로 만들고 가짜 경기를 적재. 적재 시간(초)"""
+    partitioned = schema == "partitioned"
+    init_db(database=database, schema_path=os.path.join(SCHEMA_DIR, "schema_partitioned.sql" if partitioned else "schema.sql"))
+    conn = connect_database(database)
+    columns = {
+        "match_info": ("match_id", "match_mode", "season_id", "version_major"),
+        "match_team_info": ("match_id", "team_id", "team_ranking"),
+        "match_user_basic": ("match_id", "user_id", "team_id", "character_id", "total_damage_to_player"),
+        "match_user_equipment": ("match_id", "user_id", "equipment_weapon"),
+    }
+    if partitioned:
+        columns = {table: cols if table == "match_info" else cols + ("version_major",) for table, cols in columns.items()}
+    r = random.Random(0)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET SESSION sql_mode = ''")
+            cursor.execute("SET SESSION foreign_key_checks = 0")
+        if partitioned:
+            for version in versions:
+                add_version_partition(conn, version)
+        start = perf_counter()
+        per_version = matches // len(versions)
+        match_id = 1
+        for version in versions:
+            for offset in range(0, per_version, CHUNK_MATCHES):
+                count = min(CHUNK_MATCHES, per_version - offset)
+                conn.begin()
+                for table, rows in generate_chunk(r, match_id, count, version, partitioned).items():
+                    insert_values(conn, table, columns[table], rows, mode="insert")
+                conn.commit()
+                match_id += count
+            print(f"  {schema}: loaded version {version} ({match_id - 1} matches)")
+        with conn.cursor() as cursor:
+            for table in columns:
+                cursor.execute(f"ANALYZE TABLE {table}")
+        return perf_counter() - start
+    finally:
+        conn.close()
+
+def run_queries(database: str, schema: str, version: int, repeat: int) -> dict:
+    """쿼리별 최소 실행 시간(초)"""
+    conn = connect_database(database)
+    timings = {}
+    try:
+        with conn.cursor() as cursor:
+            for name, sql in QUERIES[schema].items():
+                best = None
+                for _ in range(repeat):
+                    start = perf_counter()
+                    cursor.execute(sql, (version,))
+                    cursor.fetchall()
+                    elapsed = perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                timings[name] = best
+                cursor.execute("EXPLAIN " + sql, (version,))
+                explain_columns = [column[0] for column in cursor.description]
+                plan = [dict(zip(explain_columns, row)) for row in cursor.fetchall()]
+                print(f"  {schema} {name}: " + "; ".join(
+                    f"{step['table']} partitions={step.get('partitions')} key={step['key']} rows={step['rows']}" for step in plan))
+    finally:
+        conn.close()
+    return timings
+
+def drop_oldest(database: str, schema: str, version: int) -> float:
+    """가장 오래된 버전의 경기를 삭제하는 시간(초)"""
+    conn = connect_database(database)
+    try:
+        start = perf_counter()
+        if schema == "partitioned":
+            drop_version_partition(conn, version)
+        else:
+            with conn.cursor() as cursor:
+                for table in ("match_user_equipment", "match_user_basic", "match_team_info"):
+                    cursor.execute(
+                        f"DELETE c FROM {table} c JOIN match_info m ON m.match_id = c.match_id WHERE m.version_major = %s",
+                        (version,))
+                cursor.execute("DELETE FROM match_info WHERE version_major = %s", (version,))
+        return perf_counter() - start
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="파티션 스키마 분석 쿼리 벤치마크 (MySQL 필요)")
+    parser.add_argument("--matches", type=int, default=1_000_000, help="생성할 경기 수")
+    parser.add_argument("--versions", type=int, default=10, help="경기를 나눌 게임 버전 수")
+    parser.add_argument("--repeat", type=int, default=3, help="쿼리 반복 횟수")
+    parser.add_argument("--database", default="ER_Dataset_bench", help="벤치마크용으로 만들었다가 삭제할 데이터베이스 이름 접두사")
+    args = parser.parse_args()
+
+    versions = list(range(47 - args.versions, 47))
+    results = {}
+    try:
+        for schema in ("default", "partitioned"):
+            database = f"{args.database}_{schema}"
+            load_time = load(database, schema, args.matches, versions)
+            timings = run_queries(database, schema, versions[-1], args.repeat)
+            timings["drop_oldest"] = drop_oldest(database, schema, versions[0])
+            results[schema] = timings
+            print(f"{schema:12s} load {load_time:8.1f}s  " + "  ".join(f"{name} {t:.3f}s" for name, t in timings.items()))
+        for name in results["default"]:
+            print(f"{name:12s} {results['default'][name] / results['partitioned'][name]:6.1f}x faster with partitions")
+    finally:
+        conn = connect_database()
+        try:
+            with conn.cursor() as cursor:
+                for schema in ("default", "partitioned"):
+                    cursor.execute(f"DROP DATABASE IF EXISTS {args.database}_{schema}")
+        finally:
+            conn.close()
@@ -0,0 +1,62 @@
+"""SQLite 백엔드(STORAGE_BACKEND=sqlite)의 경기 적재 처리량 측정
+
+    poetry run python benchmarks/bench_storage.py --matches 2000
+
+임시 디렉토리에 데이터베이스 파일을 방식마다 새로 만들어 같은 경기를 write_matches로 적재한다.
+커밋 단위(경기마다 커밋 / DB_COMMIT_MATCHES개씩 커밋)와 SQLITE_SYNCHRONOUS(FULL / NORMAL)의 조합을 비교한다.
+정적 테이블(캐릭터, 장비, 특성)은 비워 두므로 벤치마크 커넥션에서는 외래 키 검사를 끈다. MySQL 서버는 필요 없다.
+"""
+import os
+import argparse
+import tempfile
+from time import perf_counter
+
+BENCH_DIR = tempfile.mkdtemp(prefix="er_bench_")
+os.environ["STORAGE_BACKEND"] = "sqlite"
+os.environ["sqlite_path"] = os.path.join(BENCH_DIR, "bench.sqlite3")
+# init_schema가 지우는 match_id 인덱스 파일도 임시 디렉토리를 사용
+os.environ["known_ids_path"] = os.path.join(BENCH_DIR, "known_match_ids.bin")
+
+from payloads import get_payloads  # noqa: E402
+from parsing import parse_match_rows  # noqa: E402
+from storage import get_storage_backend  # noqa: E402
+from db_utils import get_db_connection, write_matches, DB_COMMIT_MATCHES  # noqa: E402
+import sqlite_backend  # noqa: E402
+
+def load(items: list, synchronous: str, commit_matches: int) -> float:
+    """데이터베이스를 새로 만들고 경기를 적재. 적재 시간(초)"""
+    sqlite_backend.SQLITE_SYNCHRONOUS = synchronous
+    backend = get_storage_backend()
+    backend.init_schema()
+    conn = get_db_connection()
+    with conn.cursor() as cursor:
+        cursor.execute("PRAGMA foreign_keys = OFF")
+    start = perf_counter()
+    saved = write_matches(conn, items, commit_matches=commit_matches)
+    elapsed = perf_counter() - start
+    failed = sum(1 for success in saved.values() if not success)
+    if failed:
+        print(f"  warning: {failed} matches failed to load")
+    return elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite 백엔드 적재 벤치마크")
+    parser.add_argument("--source", default=None, help="경기 JSON 파일 디렉토리 (기본: data_raw 아카이브)")
+    parser.add_argument("--matches", type=int, default=2000, help="적재할 경기 수")
+    args = parser.parse_args()
+
+    payloads, kind = get_payloads(args.matches, args.source)
+    items = [(data["userGames"][0]["gameId"], parse_match_rows(data)) for data in payloads]
+    total_rows = sum(len(table_rows) for _, rows in items for table_rows in rows.values())
+    print(f"{len(items)} {kind} matches, {total_rows} rows -> {os.environ['sqlite_path']}")
+
+    try:
+        for synchronous in ("FULL", "NORMAL"):
+            for label, commit_matches in (("per-match commit", 1), (f"{DB_COMMIT_MATCHES} matches/commit", DB_COMMIT_MATCHES)):
+                elapsed = load(items, synchronous, commit_matches)
+                print(f"synchronous={synchronous:6s} {label:20s} {elapsed:8.2f}s  "
+                      f"{len(items) / elapsed:8,.0f} matches/s  {total_rows / elapsed:10,.0f} rows/s")
+    finally:
+        for name in os.listdir(BENCH_DIR):
+            os.remove(os.path.join(BENCH_DIR, name))
+        os.rmdir(BENCH_DIR)
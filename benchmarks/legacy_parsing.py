@@ -0,0 +1,569 @@
+"""벤치마크 기준선: 테이블별 parse_* 함수 14개를 차례로 호출하던 예전 parse_match_data (딕셔너리 출력)
+
+scripts/parsing.py에서 삭제한 구현을 그대로 고정해 둔 사본이다. bench_parse.py가 parse_match_rows와의
+속도 비교와 결과 일치 확인에만 사용하며, 파이프라인에서는 쓰지 않는다. 수정하지 않는다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Any
+
+def parse_match_info(data: dict) -> dict:
+    """매치 데이터에서 주요 정보를 파싱하여 match_info 딕셔너리로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Raises:
+        ValueError: 'userGames' 데이터가 없거나 비어 있을 때 발생
+
+    Returns:
+        dict: 매치 정보가 담긴 딕셔너리 (match_id, start_dtm, match_mode 등 포함)
+    """
+    if not data.get("userGames") or len(data["userGames"]) == 0:
+        raise ValueError("No user games data found in the input")
+
+    # 첫 번째 user data를 사용
+    user_json = data["userGames"][0]
+    start_dtm = datetime.strptime(user_json["startDtm"], "%Y-%m-%dT%H:%M:%S.%f%z")
+    play_time = min(data["userGames"], key=lambda u: u["gameRank"])["playTime"]
+
+    match_expire_dtm = start_dtm + timedelta(seconds=play_time)
+    match_info = {
+        "match_id": user_json["gameId"],
+        "start_dtm": start_dtm,
+        "match_mode": user_json["matchingTeamMode"],
+        "season_id": user_json["seasonId"],
+        "version_major": user_json["versionMajor"],
+        "version_minor": user_json["versionMinor"],
+        "weather_main": user_json["mainWeather"],
+        "weather_sub": user_json["subWeather"],
+        "match_size": len(data["userGames"]),
+        "match_avg_mmr": user_json["mmrAvg"],
+        "match_expire_dtm": match_expire_dtm
+    }
+
+    return match_info
+
+def parse_match_team_info(data: dict) -> List[dict]:
+    """매치 데이터에서 팀별 주요 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 팀의 주요 정보를 담은 딕셔너리의 리스트
+    """
+    team_info_list = []
+    processed_team_ids = set()
+
+    for user_json in data.get("userGames", []):
+        team_id = user_json["teamNumber"]
+
+        # Team id가 이미 있을 경우 skip
+        if team_id in processed_team_ids:
+            continue
+
+        match_id = user_json["gameId"]
+
+        is_older_version = user_json["versionMajor"] <= 44
+
+        team_info = {
+            "match_id": match_id,
+            "team_id": team_id,
+            "team_ranking": user_json["gameRank"],
+            "escape_state": user_json["escapeState"],
+            "player_down": user_json["teamDown"],
+            "team_elimination_count": user_json["teamElimination"]
+        }
+
+        if is_older_version:
+            team_info.update({
+                "team_down_in_auto_reserrection": user_json.get("teamDownInAutoResurrection", 0),
+                "team_down_after_auto_reserrection": user_json.get("teamDownDeactiveAutoResurrection", 0),
+                "team_repeat_down_in_auto_reserrection": user_json.get("teamRepeatDownInAutoResurrection", 0),
+                "team_repeat_down_after_auto_reserrection": user_json.get("teamRepeatDownDeactiveAutoResurrection", 0)
+            })
+        else:
+            team_info.update({
+                "team_down_in_auto_reserrection": user_json.get("teamDownCanNotEliminate", 0),
+                "team_down_after_auto_reserrection": user_json.get("teamDownCanEliminate", 0),
+                "team_repeat_down_in_auto_reserrection": user_json.get("teamRepeatDownCanNotEliminate", 0),
+                "team_repeat_down_after_auto_reserrection": user_json.get("teamRepeatDownCanEliminate", 0)
+            })
+
+        team_info_list.append(team_info)
+        processed_team_ids.add(team_id)
+
+    return team_info_list
+
+def parse_match_user_basic(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 기본 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 기본 정보를 담은 딕셔너리의 리스트
+    """
+    user_basic_list = []
+
+    for user_json in data.get("userGames", []):
+        user_basic = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "team_id": user_json["teamNumber"],
+            "except_premade_team": user_json["exceptPreMadeTeam"],
+            "character_id": user_json["characterNum"],
+            "skin_id": user_json["skinCode"],
+            "character_level": user_json["characterLevel"],
+            "total_kill": user_json["playerKill"],
+            "total_death": user_json["playerDeaths"],
+            "total_assist": user_json["playerAssistant"],
+            "weapon_type": user_json["bestWeapon"],
+            "weapon_level": user_json["bestWeaponLevel"],
+            "play_time": user_json["playTime"],
+            "watch_time": user_json["watchTime"],
+            "total_damage_to_player": user_json["damageToPlayer"],
+            "total_damage_from_player": user_json["damageFromPlayer"],
+            "total_heal": user_json["healAmount"],
+            "heal_to_team": user_json["teamRecover"],
+            "use_loop_count": user_json["useHyperLoop"],
+            "user_security_console_count": user_json["useSecurityConsole"],
+            "route_id": user_json["routeIdOfStart"],
+            "start_place": int(user_json["placeOfStart"]),
+            "emotion_count": user_json["useEmoticonCount"],
+            "fishing_count": user_json["fishingCount"],
+            "tactical_skill_id": user_json["tacticalSkillGroup"],
+            "tactical_skill_level": user_json["tacticalSkillLevel"],
+            "tactical_skill_count": user_json["tacticalSkillUseCount"],
+            "credit_revival_count": user_json["creditRevivalCount"],
+            "credit_revival_other_count": user_json["creditRevivedOthersCount"],
+        }
+
+        user_basic_list.append(user_basic)
+
+    return user_basic_list
+
+def parse_match_user_equipment(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 장비 및 첫 획득 장비 정보를 파싱하여 딕셔너리 리스트로 반환합니다.
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 장비 정보를 담은 딕셔너리의 리스트
+    """
+    def none_if_zero(val):
+        # 리스트일 경우 마지막 값을 사용
+        if isinstance(val, list):
+            if not val:
+                return None
+            val = val[-1]
+        # 0 또는 "0"이면 None, 아니면 원래 값
+        return None if val == 0 or val == "0" else val
+
+    user_equipment_list = []
+
+    for user_json in data.get("userGames", []):
+        equipment_data = user_json.get("equipment", {})
+        equip_first_log = user_json.get("equipFirstItemForLog", {})
+
+        equipment = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "equipment_weapon": none_if_zero(equipment_data.get("0")),
+            "equipment_chest": none_if_zero(equipment_data.get("1")),
+            "equipment_head": none_if_zero(equipment_data.get("2")),
+            "equipment_arm": none_if_zero(equipment_data.get("3")),
+            "equipment_leg": none_if_zero(equipment_data.get("4")),
+            "first_equipment_weapon": none_if_zero(equip_first_log.get("0", [None])),
+            "first_equipment_chest": none_if_zero(equip_first_log.get("1", [None])),
+            "first_equipment_head": none_if_zero(equip_first_log.get("2", [None])),
+            "first_equipment_arm": none_if_zero(equip_first_log.get("3", [None])),
+            "first_equipment_leg": none_if_zero(equip_first_log.get("4", [None]))
+        }
+
+        user_equipment_list.append(equipment)
+
+    return user_equipment_list
+
+def parse_match_user_stat(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 스탯을 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 스탯 정보를 담은 딕셔너리의 리스트
+    """
+    user_stat_list = []
+
+    for user_json in data.get("userGames", []):
+        user_stat = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "hp": user_json["maxHp"],
+            "sp": user_json["maxSp"],
+            "hp_regen": user_json["hpRegen"],
+            "sp_regen": user_json["spRegen"],
+            "defense": user_json["defense"],
+            "attack_power": user_json["attackPower"],
+            "attack_speed": user_json["attackSpeed"],
+            "skill_amp": user_json["skillAmp"],
+            "cooldown_percent": int(user_json["coolDownReduction"]),
+            "adaptive_force": user_json["adaptiveForce"],
+            "adaptive_force_attack": user_json["adaptiveForceAttack"],
+            "adaptive_force_amp": user_json["adaptiveForceAmplify"],
+            "move_speed": float(user_json["moveSpeed"]),
+            "ooc_move_speed": float(user_json["outOfCombatMoveSpeed"]),
+            "sight_range": float(user_json["sightRange"]),
+            "attack_range": float(user_json["attackRange"]),
+            "critical_percent": int(user_json["criticalStrikeChance"]),
+            "critical_damage": int(user_json.get("criticalStrikeDamage", 0)),
+            "life_steal_percent": int(100*user_json["lifeSteal"]),
+            "normal_life_steel": int(100*user_json["normalLifeSteal"]),
+            "skill_life_steel": user_json["skillLifeSteal"]
+        }
+
+        user_stat_list.append(user_stat)
+
+    return user_stat_list
+
+def parse_match_user_damage(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 가한 피해량, 받은 피해량을 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 가한 피해량, 받은 피해량 정보를 담은 딕셔너리의 리스트
+    """
+    user_damage_list = []
+
+    for user_json in data.get("userGames", []):
+        user_damage = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "basic_damage_to_player": user_json["damageToPlayer_basic"],
+            "skill_damage_to_player": user_json["damageToPlayer_skill"],
+            "direct_damage_to_player": user_json["damageToPlayer_direct"],
+            "shield_damage_to_player": user_json["damageToPlayer_Shield"],
+            "item_damage_to_player": user_json["damageToPlayer_itemSkill"],
+            "trap_damage_to_player": user_json["damageToPlayer_trap"],
+            "basic_damage_from_player": user_json["damageFromPlayer_basic"],
+            "skill_damage_from_player": user_json["damageFromPlayer_skill"],
+            "direct_damage_from_player": user_json["damageFromPlayer_direct"],
+            "shield_damage_from_player": user_json["damageOffsetedByShield_Player"],
+            "item_damage_from_player": user_json["damageFromPlayer_itemSkill"],
+            "trap_damage_from_player": user_json["damageFromPlayer_trap"]
+        }
+
+        user_damage_list.append(user_damage)
+
+    return user_damage_list
+
+def parse_match_user_trait(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저가 선택한 특성을 파싱하여 틱셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저가 선택한 특성 ID를 담은 딕셔너리 리스트
+    """
+    user_trait_list = []
+
+    for user_json in data.get("userGames", []):
+        user_trait = {
+            "user_id": user_json["userNum"],
+            "match_id": user_json["gameId"],
+            "core_trait_id": user_json["traitFirstCore"],
+            "first_trait_id_one": user_json["traitFirstSub"][0],
+            "first_trait_id_two": user_json["traitFirstSub"][1],
+            "second_trait_id_one": user_json["traitSecondSub"][0],
+            "second_trait_id_two": user_json["traitSecondSub"][1]
+        }
+
+        user_trait_list.append(user_trait)
+
+    return user_trait_list
+
+def parse_match_user_mmr(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 MMR 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 MMR 정보를 담은 딕셔너리의 리스트
+    """
+    user_mmr_list = []
+
+    for user_json in data.get("userGames", []):
+        user_mmr = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "before_mmr": user_json["mmrBefore"],
+            "after_mmr": user_json["mmrAfter"],
+            "mmr_gain": user_json["mmrGain"],
+            "mmr_entry_loss": user_json["mmrLossEntryCost"]
+        }
+
+        user_mmr_list.append(user_mmr)
+
+    return user_mmr_list
+
+def parse_user_match_kda_detail(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 KDA 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 KDA를 담은 딕셔너리의 리스트
+    """
+    user_kda_list = []
+
+    for user_json in data.get("userGames", []):
+        user_kda = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "kill_phase_one": user_json["killsPhaseOne"],
+            "kill_phase_two": user_json["killsPhaseTwo"],
+            "kill_phase_three": user_json["killsPhaseThree"],
+            "death_phase_one": user_json["deathsPhaseOne"],
+            "death_phase_two": user_json["deathsPhaseTwo"],
+            "death_phase_three": user_json["deathsPhaseThree"]
+        }
+
+        user_kda_list.append(user_kda)
+
+    return user_kda_list
+
+def parse_match_user_sight(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 시야 관련 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 시야 관련 행동 정보를 담은 딕셔너리의 리스트
+    """
+    user_sight_list = []
+
+    for user_json in data.get("userGames", []):
+        user_sight = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "sight_score": user_json["viewContribution"],
+            "camera_setup": user_json["addTelephotoCamera"],
+            "camera_remove": user_json["removeTelephotoCamera"],
+            "emp_drone_setup": user_json["useEmpDrone"],
+            "basic_drone_setup": user_json["useReconDrone"]
+        }
+
+        user_sight_list.append(user_sight)
+
+    return user_sight_list
+
+def parse_object(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 몬스터 및 큐브 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 몬스터 및 큐브 정보를 담은 딕셔너리의 리스트
+    """
+    object_list = []
+
+    for user_json in data.get("userGames", []):
+        kill_monsters = user_json.get("killMonsters", {})
+
+        object_data = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "damage_to_rumi": user_json["damageToGuideRobot"],
+            "damage_to_monster": user_json["damageToMonster"],
+            "total_kill_monster": user_json["monsterKill"],
+            "kill_alpha": kill_monsters.get("8", 0),
+            "kill_omega": kill_monsters.get("9", 0),
+            "kill_gamma": kill_monsters.get("10", 0),
+            "kill_wickline": 1 if kill_monsters.get("7", 0) > 0 else 0,
+            "get_cube_red": user_json["getBuffCubeRed"],
+            "get_cube_green": user_json["getBuffCubeGreen"],
+            "get_cube_gold": user_json["getBuffCubeGold"],
+            "get_cube_purple": user_json["getBuffCubePurple"],
+            "get_cube_skyblue": user_json["getBuffCubeSkyBlue"],
+            "collect_tree_of_life": user_json["collectItemForLog"][4],
+            "collect_meteorite": user_json["collectItemForLog"][5],
+            "get_air_supply_purple": user_json["airSupplyOpenCount"][3],
+            "get_air_supply_red": user_json["airSupplyOpenCount"][5]
+        }
+
+        object_list.append(object_data)
+
+    return object_list
+
+def parse_match_user_gain_credit(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 크레딧 획득 경로를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 크레딧 획득 경로를 담은 딕셔너리의 리스트
+    """
+    user_gain_credit_list = []
+
+    for user_json in data.get("userGames", []):
+        credit_source = user_json.get("creditSource", {})
+
+        gain_credit = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "total_gain_cr": user_json["totalGainVFCredit"],
+            "start_cr": credit_source.get("PreliminaryPhase", 0),
+            "time_elapse_cr": credit_source.get("TimeElapsedCompensationByMiliSecond", 0),
+            "time_elapse_bonus_cr": int(credit_source.get("TimeElapsedCreditBonusByMiliSecond",0)),
+            "wild_dog_cr": credit_source.get("KillWildDog", 0),
+            "bat_cr": credit_source.get("KillBat", 0),
+            "chicken_cr": credit_source.get("KillChicken", 0),
+            "boar_cr": credit_source.get("KillBoar", 0),
+            "wolf_cr": credit_source.get("KillWolf", 0),
+            "bear_cr": credit_source.get("KillBear", 0),
+            "raven_cr": credit_source.get("KillRaven", 0),
+            "mutant_wild_dog_cr": credit_source.get("KillMutantWildDog", 0),
+            "mutant_bat_cr": credit_source.get("KillMutantBat", 0),
+            "mutant_chicken_cr": credit_source.get("KillMutantChicken", 0),
+            "mutant_boar_cr": credit_source.get("KillMutantBoar", 0),
+            "mutant_wolf_cr": credit_source.get("KillMutantWolf", 0),
+            "mutant_bear_cr": credit_source.get("KillMutantBear", 0),
+            "mutant_raven_cr": credit_source.get("KillMutantRaven", 0),
+            "alpha_cr": credit_source.get("KillAlpha",0),
+            "omega_cr": credit_source.get("KillOmega",0),
+            "gamma_cr": credit_source.get("KillGamma", 0),
+            "wickline_cr": credit_source.get("KillWickline", 0),
+            "security_console_cr": credit_source.get("GoldSecurityConsoleAccess",0),
+            "drone_cr": credit_source.get("KillDrone", 0),
+            "kill_cr": user_json["crGetKill"],
+            "kill_by_team_cr": credit_source.get("KillAssistDivideContribute",0),
+            "rumi_cr": user_json["crGetByGuideRobot"],
+            "skill_cr": credit_source.get("GetBySkill", 0),
+            "cointoss_cr": credit_source.get("TraitSkillCoinToss", 0),
+            "item_bounty_cr": credit_source.get("ItemBountyByItemCode", 0),
+            "kill_bounty_cr": credit_source.get("ItemBounty", 0),
+            "door_console_cr": credit_source.get("DoorConsoleAccess",0)
+        }
+
+        user_gain_credit_list.append(gain_credit)
+
+    return user_gain_credit_list
+
+def parse_match_user_use_credit(data: dict) -> List[dict]:
+    """매치 데이터에서 각 유저의 크레딧 사용 정보를 파싱하여 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 크레딧 사용 정보를 담은 딕셔너리의 리스트
+    """
+    user_use_credit_list = []
+
+    for user_json in data.get("userGames", []):
+        credit_source = user_json.get("creditSource", {})
+        item_transferred = user_json.get("itemTransferredDrone", [])
+
+        use_credit = {
+            "match_id": user_json["gameId"],
+            "user_id": user_json["userNum"],
+            "total_used_cr": user_json["totalUseVFCredit"],
+            "used_revival_cr": user_json["transferConsoleFromRevivalUseVFCredit"],
+            "used_remote_drone_myself_cr": user_json["remoteDroneUseVFCreditMySelf"],
+            "used_remote_drone_myteam_cr": user_json["remoteDroneUseVFCreditAlly"],
+            "used_tactical_skill_cr": user_json["crUseUpgradeTacticalSkill"],
+            "used_tree_of_life_cr": user_json["crUseTreeOfLife"],
+            "used_meteorite_cr": user_json["crUseMeteorite"],
+            "used_mythril_cr": user_json["crUseMythril"],
+            "used_forcecore_cr": user_json["crUseForceCore"],
+            "used_blood_sample_cr": user_json["crUseVFBloodSample"],
+            "used_escapekit_cr": user_json["crUseRootkit"],
+            "used_emp_drone_cr": item_transferred.count(502308) * 30,
+            "used_basic_drone_cr": item_transferred.count(502208) * 20,
+            "used_camera_cr": item_transferred.count(502207) * 20,
+            "used_guillotine_cr": item_transferred.count(502405) * 100,
+            "used_c4_cr": item_transferred.count(502404) * 100,
+            "used_fried_chicken_cr": item_transferred.count(301316) * 25,
+            "used_rumi_signiture_cr": credit_source.get("GuideRobotSignature", 0),
+            "used_rumi_fragship_cr": credit_source.get("guideRobotFlagShip", 0),
+            "used_rumi_radial_cr": credit_source.get("GuideRobotRadial", 0)
+        }
+
+        user_use_credit_list.append(use_credit)
+
+    return user_use_credit_list
+
+def parse_match_user_credit_time(data: dict) -> List[dict]:
+    """각 유저의 1분 단위 크레딧 사용/획득량을 매치 데이터에서 추출하여 최대 20분까지 딕셔너리 리스트로 반환
+
+    Args:
+        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+
+    Returns:
+        List[dict]: 각 유저의 분 단위 크레딧 사용/획득 정보를 담은 딕셔너리의 리스트
+    """
+    user_credit_time_list = []
+
+    for user_json in data.get("userGames", []):
+        match_id = user_json["gameId"]
+        user_id = user_json["userNum"]
+
+        for minute in range(20):  # 20 minutes maximum
+            used_credit = user_json["usedVFCredits"][minute]
+            gain_credit = user_json["totalVFCredits"][minute]
+
+            # credit이 0이 아닌 경우에만 저장
+            if used_credit != 0 or gain_credit != 0:
+                user_credit_time = {
+                    "match_id": match_id,
+                    "user_id": user_id,
+                    "minute": minute,
+                    "used_credit": used_credit,
+                    "gain_credit": gain_credit
+                }
+
+                user_credit_time_list.append(user_credit_time)
+
+    return user_credit_time_list
+
+def parse_match_data(data: dict) -> Dict[str, Any]:
+    """경기와 관한 정보를 파싱하여 딕셔너리로 반환
+
+    Args:
+        data (dict): 매치 원본 데이터
+
+    Returns:
+        Dict[str, Any]: 매치에 관한 주요 정보를 담은 딕셔너리
+    """
+    try:
+        result = {
+            "match_info": parse_match_info(data),
+            "match_team_info": parse_match_team_info(data),
+            "match_user_basic": parse_match_user_basic(data),
+            "match_user_equipment": parse_match_user_equipment(data),
+            "match_user_stat": parse_match_user_stat(data),
+            "match_user_damage": parse_match_user_damage(data),
+            "match_user_trait": parse_match_user_trait(data),
+            "match_user_mmr": parse_match_user_mmr(data),
+            "user_match_kda_detail": parse_user_match_kda_detail(data),
+            "match_user_sight": parse_match_user_sight(data),
+            "object": parse_object(data),
+            "match_user_gain_credit": parse_match_user_gain_credit(data),
+            "match_user_use_credit": parse_match_user_use_credit(data),
+            "match_user_credit_time": parse_match_user_credit_time(data)
+        }
+
+        return result
+    except Exception as e:
+        print(f"Error parsing match data: {e}")
+        raise
@@ -0,0 +1,120 @@
+import os
+import sys
+import json
+import random
+from glob import glob
+
+# 벤치마크는 scripts/의 모듈을 그대로 import 해서 측정
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+def load_recorded_payloads(limit: int = 1000, source: str | None = None) -> list:
+    """기록된 경기 원본 데이터를 읽음
+
+    source가 디렉토리면 *.json 파일(/v1/games/{match_id} 응답)을, 없으면 data_raw 아카이브를 읽는다.
+
+    Args:
+        limit (int, optional): 읽을 최대 경기 수. Defaults to 1000.
+        source (str | None, optional): JSON 파일 디렉토리. Defaults to None.
+
+    Returns:
+        list: 경기 원본 데이터 리스트. 기록된 경기가 없으면 빈 리스트
+    """
+    payloads = []
+    if source:
+        for path in sorted(glob(os.path.join(source, "*.json")))[:limit]:
+            with open(path, "r", encoding="utf-8") as f:
+                payloads.append(json.load(f))
+        return payloads
+
+    from archive import get_match_archive
+    archive = get_match_archive()
+    if archive is None:
+        return payloads
+    for match_id in archive.match_ids()[:limit]:
+        payloads.append(archive.get(match_id))
+    return payloads
+
+def unused_fields(r: random.Random) -> dict:
+    """실제 API의 userGames 레코드에는 파서가 읽지 않는 필드가 100개 이상 더 있으므로 비슷한 크기로 채움"""
+    fields = {
+        "nickname": f"player{r.randint(0, 10**6)}", "accountLevel": r.randint(1, 300), "serverName": "Asia",
+        "language": "Korean", "expireDtm": "2025-05-20T12:34:56.000+0900", "botAdded": 0, "botRemain": 0,
+        "killDetails": "{}", "deathDetails": "{}", "mmrGainInGame": r.randint(-50, 80),
+        "scoredPoint": [r.randint(0, 20) for _ in range(6)], "foodCraftCount": [r.randint(0, 5) for _ in range(6)],
+        "beverageCraftCount": [r.randint(0, 5) for _ in range(6)], "skillLevelInfo": {str(1001100 + i): r.randint(1, 5) for i in range(6)},
+        "skillOrderInfo": {str(i): 1001100 + r.randint(0, 5) for i in range(1, 21)},
+        "masteryLevel": {str(i): r.randint(1, 20) for i in range(100, 125)},
+        "battleZonePlayerKill": 0, "battleZoneDeaths": 0, "routeSlotId": 0, "giveUp": 0, "teamSpectator": 0,
+    }
+    for i in range(80):
+        fields[f"unusedStat{i}"] = r.random() * 100 if i % 3 else r.randint(0, 1000)
+    return fields
+
+def synthetic_user_game(game_id: int, user_num: int, team: int, rank: int, version: int = 46) -> dict:
+    """파서가 읽는 모든 필드와 읽지 않는 필드를 채운 가짜 userGames 레코드"""
+    r = random.Random(game_id * 1000 + user_num)
+    return {
+        **unused_fields(r),
+        "gameId": game_id, "userNum": user_num, "teamNumber": team, "gameRank": rank,
+        "startDtm": "2025-04-20T12:34:56.000+0900", "playTime": r.randint(600, 1300),
+        "matchingTeamMode": 3, "matchingMode": 3, "seasonId": 31, "versionMajor": version, "versionMinor": 2,
+        "mainWeather": 1, "subWeather": 2, "mmrAvg": 6000, "escapeState": 0, "teamDown": r.randint(0, 5),
+        "teamElimination": r.randint(0, 3),
+        "teamDownCanNotEliminate": 1, "teamDownCanEliminate": 2, "teamRepeatDownCanNotEliminate": 0, "teamRepeatDownCanEliminate": 1,
+        "teamDownInAutoResurrection": 1, "teamDownDeactiveAutoResurrection": 2,
+        "teamRepeatDownInAutoResurrection": 0, "teamRepeatDownDeactiveAutoResurrection": 1,
+        "exceptPreMadeTeam": False, "characterNum": r.randint(1, 80), "skinCode": 1001001, "characterLevel": 20,
+        "playerKill": r.randint(0, 10), "playerDeaths": r.randint(0, 3), "playerAssistant": r.randint(0, 10),
+        "bestWeapon": r.randint(1, 24), "bestWeaponLevel": 20, "watchTime": 0, "damageToPlayer": r.randint(1000, 40000),
+        "damageFromPlayer": r.randint(1000, 40000), "healAmount": 3000, "teamRecover": 100, "useHyperLoop": 2, "useSecurityConsole": 1,
+        "routeIdOfStart": 0, "placeOfStart": "3", "useEmoticonCount": 0, "fishingCount": 0, "tacticalSkillGroup": 30,
+        "tacticalSkillLevel": 2, "tacticalSkillUseCount": 5, "creditRevivalCount": 0, "creditRevivedOthersCount": 0,
+        "equipment": {"0": 101401, "1": 202405, "2": 0, "3": 203409, "4": 204405},
+        "equipFirstItemForLog": {"0": [101101, 101401], "1": [202101], "2": [], "4": [204101]},
+        "maxHp": 2500, "maxSp": 1200, "hpRegen": 30, "spRegen": 20, "defense": 100, "attackPower": 200,
+        "attackSpeed": 150, "skillAmp": 10, "coolDownReduction": 20.0, "adaptiveForce": 30, "adaptiveForceAttack": 30,
+        "adaptiveForceAmplify": 0, "moveSpeed": 3.55, "outOfCombatMoveSpeed": 3.9, "sightRange": 8.5, "attackRange": 2.5,
+        "criticalStrikeChance": 35.0, "criticalStrikeDamage": 10.0, "lifeSteal": 0.12, "normalLifeSteal": 0.05, "skillLifeSteal": 0,
+        "damageToPlayer_basic": 100, "damageToPlayer_skill": 200, "damageToPlayer_direct": 10, "damageToPlayer_Shield": 5,
+        "damageToPlayer_itemSkill": 20, "damageToPlayer_trap": 0, "damageFromPlayer_basic": 100, "damageFromPlayer_skill": 100,
+        "damageFromPlayer_direct": 10, "damageOffsetedByShield_Player": 300, "damageFromPlayer_itemSkill": 0, "damageFromPlayer_trap": 0,
+        "traitFirstCore": 7000201, "traitFirstSub": [7010101, 7010201], "traitSecondSub": [7110101, 7110201],
+        "mmrBefore": 6000, "mmrAfter": 6050, "mmrGain": 50, "mmrLossEntryCost": 0,
+        "killsPhaseOne": 1, "killsPhaseTwo": 2, "killsPhaseThree": 3, "deathsPhaseOne": 0, "deathsPhaseTwo": 0, "deathsPhaseThree": 1,
+        "viewContribution": 20, "addTelephotoCamera": 2, "removeTelephotoCamera": 1, "useEmpDrone": 0, "useReconDrone": 1,
+        "killMonsters": {"1": 3, "7": 1, "8": 1, "9": 0}, "damageToGuideRobot": 0, "damageToMonster": 30000, "monsterKill": 40,
+        "getBuffCubeRed": 0, "getBuffCubeGreen": 1, "getBuffCubeGold": 0, "getBuffCubePurple": 0, "getBuffCubeSkyBlue": 1,
+        "collectItemForLog": [0, 0, 0, 0, 2, 1, 0], "airSupplyOpenCount": [0, 0, 0, 1, 0, 2],
+        "totalGainVFCredit": 3000, "crGetKill": 300, "crGetByGuideRobot": 0,
+        "creditSource": {"PreliminaryPhase": 100, "TimeElapsedCompensationByMiliSecond": 500, "TimeElapsedCreditBonusByMiliSecond": 12.5,
+                         "KillWildDog": 40, "KillAlpha": 50, "GuideRobotSignature": 0},
+        "totalUseVFCredit": 2500, "transferConsoleFromRevivalUseVFCredit": 0, "remoteDroneUseVFCreditMySelf": 100,
+        "remoteDroneUseVFCreditAlly": 0, "crUseUpgradeTacticalSkill": 0, "crUseTreeOfLife": 0, "crUseMeteorite": 100,
+        "crUseMythril": 0, "crUseForceCore": 0, "crUseVFBloodSample": 0, "crUseRootkit": 0,
+        "itemTransferredDrone": [502308, 502208, 502208, 301316],
+        "usedVFCredits": [r.randint(0, 200) if i % 3 else 0 for i in range(22)],
+        "totalVFCredits": [r.randint(0, 300) for i in range(22)],
+    }
+
+def synthetic_match(game_id: int, users: int = 24, version: int = 46) -> dict:
+    """/v1/games/{match_id} 응답 형태의 가짜 경기 데이터 (3인 1팀)"""
+    return {
+        "code": 200,
+        "message": "Success",
+        "userGames": [
+            synthetic_user_game(game_id, 1000 + game_id % 97 * 30 + i, i // 3 + 1, i // 3 + 1, version)
+            for i in range(users)
+        ],
+    }
+
+def get_payloads(limit: int = 1000, source: str | None = None) -> tuple:
+    """기록된 경기를 우선 사용하고, 없으면 가짜 경기를 생성
+
+    Returns:
+        tuple: (경기 원본 데이터 리스트, "recorded" 또는 "synthetic")
+    """
+    payloads = load_recorded_payloads(limit, source)
+    if payloads:
+        return payloads, "recorded"
+    # 버전별 분기(versionMajor <= 44)도 측정되도록 일부는 이전 버전으로 생성
+    return [synthetic_match(1_000_000 + i, version=44 if i % 10 == 0 else 46) for i in range(limit)], "synthetic"
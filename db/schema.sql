@@ -372,6 +372,41 @@ CREATE TABLE user_match_kda_detail
   PRIMARY KEY (match_id, user_id)
 );
 
+-- 메타 통계 집계 테이블 (scripts/stats.py). 경기를 적재하는 트랜잭션에서 경기의 savepoint와 함께 증분을 더하고
+-- (DB_INSERT_MODE=insert일 때만), python stats.py --rebuild로 원본 매치 테이블에서 다시 계산한다. 평균 = 합계 / games
+CREATE TABLE stat_character
+(
+  version_major SMALLINT NOT NULL,
+  character_id  INT      NOT NULL,
+  weapon_type   SMALLINT NOT NULL,
+  games         INT      NOT NULL,
+  wins          INT      NOT NULL COMMENT '팀 순위 1위',
+  top3          INT      NOT NULL COMMENT '팀 순위 3위 이내',
+  total_damage  BIGINT   NOT NULL COMMENT '플레이어에게 준 피해량 합계',
+  total_kills   INT      NOT NULL,
+  PRIMARY KEY (version_major, character_id, weapon_type)
+);
+
+CREATE TABLE stat_equipment
+(
+  version_major SMALLINT  NOT NULL,
+  character_id  INT       NOT NULL,
+  equipment_id  MEDIUMINT NOT NULL COMMENT '최종 장비',
+  games         INT       NOT NULL,
+  wins          INT       NOT NULL,
+  PRIMARY KEY (version_major, character_id, equipment_id)
+);
+
+CREATE TABLE stat_trait
+(
+  version_major SMALLINT NOT NULL,
+  character_id  INT      NOT NULL,
+  core_trait_id INT      NOT NULL,
+  games         INT      NOT NULL,
+  wins          INT      NOT NULL,
+  PRIMARY KEY (version_major, character_id, core_trait_id)
+);
+
 ALTER TABLE match_user_basic
   ADD CONSTRAINT FK_match_info_TO_match_user_basic
     FOREIGN KEY (match_id)
@@ -0,0 +1,480 @@
+-- 매치 테이블을 version_major(게임 패치 버전) RANGE 파티션으로 나눈 스키마 (schema_path=./db/schema_partitioned.sql)
+--
+-- * 모든 매치 테이블에 version_major 컬럼이 있고 기본 키에 포함된다 (파티션 키는 모든 유니크 키에 포함되어야 함).
+--   match_info 외의 테이블의 version_major는 적재할 때 경기의 match_info 값으로 채운다.
+-- * 파티션은 처음에 p_future(MAXVALUE) 하나이며, 새 패치를 수집하기 전에 partitions.py가
+--   p_future를 나눠 버전별 파티션(p46 = version_major < 47)을 만든다. 지난 패치는 DROP PARTITION으로 바로 삭제한다.
+-- * InnoDB 파티션 테이블은 외래 키를 지원하지 않으므로 외래 키 제약이 없다.
+-- * 버전별 분석 쿼리(캐릭터 승률, 아이템 선택률)가 파티션 하나만 읽도록 버전별 커버링 인덱스를 둔다.
+
+CREATE TABLE equipment
+(
+  equipment_id              MEDIUMINT     NOT NULL,
+  equipment_name            VARCHAR(16)   NOT NULL,
+  equipment_main_type       VARCHAR(16)   NOT NULL,
+  equipment_sub_type        VARCHAR(16)   NOT NULL,
+  equipment_grade           TINYINT       NOT NULL,
+  attack_power              TINYINT       NOT NULL,
+  attack_power_bylv         TINYINT       NOT NULL,
+  defense                   TINYINT       NOT NULL,
+  defense_bylv              TINYINT       NOT NULL,
+  skill_amp                 TINYINT       NOT NULL,
+  skill_amp_bylv            TINYINT       NOT NULL,
+  skill_amp_ratio           TINYINT       NOT NULL,
+  adaptive_force            TINYINT       NOT NULL,
+  max_hp                    SMALLINT      NOT NULL,
+  max_hp_bylv               TINYINT       NOT NULL,
+  max_sp                    SMALLINT      NOT NULL,
+  hp_regen_percent          SMALLINT      NOT NULL,
+  sp_regen_percent          SMALLINT      NOT NULL,
+  attack_speed_percent      TINYINT       NOT NULL,
+  critical_percent          TINYINT       NOT NULL,
+  critical_damage_percent   TINYINT       NOT NULL,
+  cooldown_percent          TINYINT       NOT NULL,
+  lifeSteal_percent         TINYINT       NOT NULL,
+  normal_life_steel         TINYINT       NOT NULL,
+  move_speed                FLOAT         NOT NULL,
+  move_speed_percent        FLOAT         NOT NULL,
+  sight_range               TINYINT       NOT NULL,
+  penetration_defense       TINYINT       NOT NULL,
+  slow_resist_percent       TINYINT       NOT NULL,
+  cooldown_limit_percent    TINYINT       NOT NULL,
+  tenacity_percent          TINYINT       NOT NULL,
+  unique_skill_amp_percent  TINYINT       NOT NULL,
+  PRIMARY KEY (equipment_id)
+);
+
+CREATE TABLE game_character
+(
+  character_id       INT         NOT NULL,
+  character_name     VARCHAR(24) NOT NULL,
+  attack_power       INT         NOT NULL,
+  defense            INT         NOT NULL,
+  skill_amp          INT         NOT NULL,
+  max_hp             SMALLINT         NOT NULL,
+  max_sp             SMALLINT         NOT NULL,
+  hp_regen           TINYINT         NOT NULL,
+  sp_regen           TINYINT         NOT NULL,
+  attack_speed       FLOAT         NOT NULL,
+  attack_speed_limit FLOAT         NOT NULL,
+  move_speed         INT         NOT NULL,
+  sight_range        INT         NOT NULL,
+
+  growth_attack_power       INT         NOT NULL,
+  growth_defense            INT         NOT NULL,
+  growth_max_hp             INT         NOT NULL,
+  growth_max_sp             INT         NOT NULL,
+  growth_hp_regen           INT         NOT NULL,
+  growth_sp_regen           INT         NOT NULL,
+  PRIMARY KEY (character_id)
+);
+
+CREATE TABLE game_character_weapon
+(
+  character_id        INT         NOT NULL,
+  weapon_type         VARCHAR(26) NOT NULL,
+  weapon_attack_power INT         NOT NULL,
+  weapon_defense             INT         NOT NULL,
+  skill_amp           INT         NOT NULL,
+  max_hp              INT         NOT NULL,
+  max_sp              INT         NOT NULL,
+  hp_regen            INT         NOT NULL,
+  sp_regen            INT         NOT NULL,
+  attack_speed        INT         NOT NULL,
+  attack_speed_limit  INT         NOT NULL,
+  weapon_move_speed          INT         NOT NULL,
+  sight_range         INT         NOT NULL,
+  PRIMARY KEY (character_id)
+);
+
+CREATE TABLE match_info
+(
+  match_id      INT       NOT NULL,
+  start_dtm     TIMESTAMP NOT NULL,
+  match_mode    TINYINT   NOT NULL COMMENT '솔로, 듀오, 스쿼드',
+  season_id     SMALLINT  NOT NULL,
+  version_major SMALLINT  NOT NULL,
+  version_minor TINYINT   NOT NULL,
+  weather_main  MEDIUMINT NOT NULL,
+  weather_sub   MEDIUMINT NOT NULL,
+  match_size    TINYINT   NOT NULL,
+  match_avg_mmr SMALLINT  NOT NULL,
+  match_expire_dtm    TIMESTAMP  NOT NULL,
+  PRIMARY KEY (match_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_team_info
+(
+  match_id                                 INT       NOT NULL,
+  team_id                                  INT       NOT NULL,
+  team_ranking                             TINYINT   NOT NULL,
+  escape_state                             TINYINT   NOT NULL,
+  player_down                              TINYINT   NOT NULL,
+  team_down_in_auto_reserrection           TINYINT   NOT NULL,
+  team_down_after_auto_reserrection        TINYINT   NOT NULL,
+  team_repeat_down_in_auto_reserrection    TINYINT   NOT NULL,
+  team_repeat_down_after_auto_reserrection TINYINT   NOT NULL,
+  team_elimination_count                   TINYINT   NOT NULL,
+  version_major                            SMALLINT  NOT NULL,
+  PRIMARY KEY (match_id, team_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_basic
+(
+  match_id                    INT       NOT NULL,
+  user_id                     INT       NOT NULL,
+  team_id                     TINYINT   NOT NULL,
+  except_premade_team         BOOL      NOT NULL DEFAULT false,
+  character_id                INT       NOT NULL,
+  skin_id                     INT       NOT NULL,
+  character_level             TINYINT   NOT NULL,
+  total_kill                  TINYINT   NOT NULL,
+  total_death                 TINYINT   NOT NULL,
+  total_assist                TINYINT   NOT NULL,
+  weapon_type                 SMALLINT  NOT NULL,
+  weapon_level                TINYINT   NOT NULL,
+  play_time                   SMALLINT  NOT NULL,
+  watch_time                  SMALLINT  NOT NULL,
+  total_damage_to_player      MEDIUMINT NOT NULL,
+  total_damage_from_player    MEDIUMINT NOT NULL,
+  total_heal                  MEDIUMINT NOT NULL,
+  heal_to_team                MEDIUMINT NOT NULL,
+  use_loop_count              SMALLINT  NOT NULL,
+  user_security_console_count SMALLINT  NOT NULL,
+  route_id                    MEDIUMINT NOT NULL,
+  start_place                 SMALLINT  NOT NULL,
+  emotion_count               SMALLINT  NOT NULL,
+  fishing_count               SMALLINT  NOT NULL,
+  tactical_skill_id           SMALLINT  NOT NULL,
+  tactical_skill_level        TINYINT   NOT NULL,
+  tactical_skill_count        SMALLINT  NOT NULL,
+  credit_revival_count        TINYINT   NOT NULL,
+  credit_revival_other_count  TINYINT   NOT NULL,
+  version_major               SMALLINT  NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_credit_time
+(
+  match_id    INT      NOT NULL,
+  user_id     INT      NOT NULL,
+  minute      TINYINT  NOT NULL,
+  used_credit SMALLINT NOT NULL,
+  gain_credit SMALLINT NOT NULL,
+  version_major SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, minute, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_damage
+(
+  match_id                  INT       NOT NULL,
+  user_id                   INT       NOT NULL,
+  basic_damage_to_player    MEDIUMINT NOT NULL,
+  skill_damage_to_player    MEDIUMINT NOT NULL,
+  direct_damage_to_player   MEDIUMINT NOT NULL,
+  shield_damage_to_player   MEDIUMINT NOT NULL,
+  item_damage_to_player     MEDIUMINT NOT NULL,
+  trap_damage_to_player     MEDIUMINT NOT NULL,
+  basic_damage_from_player  MEDIUMINT NOT NULL,
+  skill_damage_from_player  MEDIUMINT NOT NULL,
+  direct_damage_from_player MEDIUMINT NOT NULL,
+  shield_damage_from_player MEDIUMINT NOT NULL,
+  item_damage_from_player   MEDIUMINT NOT NULL,
+  trap_damage_from_player   MEDIUMINT NOT NULL,
+  version_major             SMALLINT  NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_equipment
+(
+  match_id               INT       NOT NULL,
+  user_id                INT       NOT NULL,
+  equipment_weapon       MEDIUMINT NULL    ,
+  equipment_chest        MEDIUMINT NULL,
+  equipment_head         MEDIUMINT NULL,
+  equipment_arm          MEDIUMINT NULL,
+  equipment_leg          MEDIUMINT NULL,
+  first_equipment_weapon MEDIUMINT NULL,
+  first_equipment_chest  MEDIUMINT NULL,
+  first_equipment_head   MEDIUMINT NULL,
+  first_equipment_arm    MEDIUMINT NULL,
+  first_equipment_leg    MEDIUMINT NULL,
+  version_major          SMALLINT  NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_gain_credit
+(
+  match_id             INT      NOT NULL,
+  user_id              INT      NOT NULL,
+  total_gain_cr        SMALLINT NOT NULL,
+  start_cr             SMALLINT NOT NULL,
+  time_elapse_cr       SMALLINT NOT NULL    ,
+  time_elapse_bonus_cr SMALLINT NOT NULL,
+  wild_dog_cr          SMALLINT NOT NULL,
+  bat_cr               SMALLINT NOT NULL,
+  chicken_cr           SMALLINT NOT NULL,
+  boar_cr              SMALLINT NOT NULL,
+  wolf_cr              SMALLINT NOT NULL,
+  bear_cr              SMALLINT NOT NULL,
+  raven_cr             SMALLINT NOT NULL,
+  mutant_wild_dog_cr   SMALLINT NOT NULL,
+  mutant_bat_cr        SMALLINT NOT NULL,
+  mutant_chicken_cr    SMALLINT NOT NULL,
+  mutant_boar_cr       SMALLINT NOT NULL,
+  mutant_wolf_cr       SMALLINT NOT NULL,
+  mutant_bear_cr       SMALLINT NOT NULL,
+  mutant_raven_cr      SMALLINT NOT NULL,
+  alpha_cr             SMALLINT NOT NULL,
+  omega_cr             SMALLINT NOT NULL,
+  gamma_cr             SMALLINT NOT NULL,
+  wickline_cr          SMALLINT NOT NULL,
+  security_console_cr  SMALLINT NOT NULL,
+  drone_cr             SMALLINT NOT NULL,
+  kill_cr              SMALLINT NOT NULL,
+  kill_by_team_cr      SMALLINT NOT NULL,
+  rumi_cr              SMALLINT NOT NULL,
+  skill_cr             SMALLINT NULL    ,
+  cointoss_cr          SMALLINT NULL    ,
+  item_bounty_cr       SMALLINT NOT NULL,
+  kill_bounty_cr       SMALLINT NOT NULL,
+  door_console_cr      SMALLINT NOT NULL,
+  version_major        SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_mmr
+(
+  match_id       INT      NOT NULL,
+  user_id        INT      NOT NULL,
+  before_mmr     SMALLINT NOT NULL,
+  after_mmr      SMALLINT NOT NULL,
+  mmr_gain       SMALLINT NOT NULL,
+  mmr_entry_loss SMALLINT NOT NULL,
+  version_major  SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_sight
+(
+  match_id          INT     NOT NULL,
+  user_id           INT     NOT NULL,
+  sight_score       TINYINT NOT NULL DEFAULT 0,
+  camera_setup      TINYINT NOT NULL DEFAULT 0,
+  camera_remove     TINYINT NOT NULL DEFAULT 0,
+  emp_drone_setup   TINYINT NOT NULL DEFAULT 0,
+  basic_drone_setup TINYINT NOT NULL DEFAULT 0,
+  version_major     SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_stat
+(
+  match_id              INT      NOT NULL,
+  user_id               INT      NOT NULL,
+  hp                    SMALLINT NOT NULL,
+  sp                    SMALLINT NOT NULL,
+  hp_regen              SMALLINT NOT NULL,
+  sp_regen              SMALLINT NOT NULL,
+  defense               SMALLINT NOT NULL,
+  attack_power          SMALLINT NOT NULL,
+  attack_speed          SMALLINT NOT NULL,
+  skill_amp             SMALLINT NOT NULL,
+  cooldown_percent      TINYINT  NOT NULL,
+  adaptive_force        SMALLINT NOT NULL,
+  adaptive_force_attack SMALLINT NOT NULL,
+  adaptive_force_amp    SMALLINT NOT NULL,
+  move_speed            FLOAT    NOT NULL,
+  ooc_move_speed        FLOAT    NOT NULL,
+  sight_range           FLOAT    NOT NULL,
+  attack_range          FLOAT    NOT NULL,
+  critical_percent      TINYINT  NOT NULL,
+  critical_damage       TINYINT  NOT NULL,
+  life_steal_percent    TINYINT  NOT NULL,
+  normal_life_steel     SMALLINT NOT NULL,
+  skill_life_steel      SMALLINT NOT NULL,
+  version_major         SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_trait
+(
+  user_id          INT NOT NULL,
+  match_id         INT NOT NULL,
+  core_trait_id    INT NOT NULL,
+  first_trait_id_one  INT NOT NULL,
+  first_trait_id_two  INT NOT NULL,
+  second_trait_id_one INT NOT NULL,
+  second_trait_id_two INT NOT NULL,
+  version_major       SMALLINT NOT NULL,
+  PRIMARY KEY (user_id, match_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE match_user_use_credit
+(
+  match_id                    INT      NOT NULL,
+  user_id                     INT      NOT NULL,
+  total_used_cr               SMALLINT NOT NULL,
+  used_revival_cr             SMALLINT NOT NULL,
+  used_remote_drone_myself_cr SMALLINT NOT NULL,
+  used_remote_drone_myteam_cr SMALLINT NOT NULL,
+  used_tactical_skill_cr      SMALLINT NOT NULL,
+  used_tree_of_life_cr        SMALLINT NOT NULL,
+  used_meteorite_cr           SMALLINT NOT NULL,
+  used_mythril_cr             SMALLINT NOT NULL,
+  used_forcecore_cr           SMALLINT NOT NULL,
+  used_blood_sample_cr        SMALLINT NOT NULL,
+  used_escapekit_cr           SMALLINT NOT NULL,
+  used_emp_drone_cr           SMALLINT NOT NULL,
+  used_basic_drone_cr         SMALLINT NOT NULL,
+  used_camera_cr              SMALLINT NOT NULL,
+  used_guillotine_cr          SMALLINT NOT NULL,
+  used_c4_cr                  SMALLINT NOT NULL,
+  used_fried_chicken_cr       SMALLINT NOT NULL,
+  used_rumi_signiture_cr      SMALLINT NOT NULL,
+  used_rumi_fragship_cr       SMALLINT NOT NULL,
+  used_rumi_radial_cr         SMALLINT NOT NULL,
+  version_major               SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE monster_info
+(
+  monster_id   INT         NOT NULL,
+  monster_name VARCHAR(16) NOT NULL,
+  PRIMARY KEY (monster_id)
+);
+
+CREATE TABLE object
+(
+  match_id              INT       NOT NULL,
+  user_id               INT       NOT NULL,
+  damage_to_rumi        MEDIUMINT NOT NULL,
+  damage_to_monster     MEDIUMINT NOT NULL,
+  total_kill_monster    SMALLINT  NOT NULL,
+  kill_alpha            TINYINT   NOT NULL,
+  kill_omega            TINYINT   NOT NULL,
+  kill_gamma            TINYINT   NOT NULL,
+  kill_wickline         BOOL      NOT NULL DEFAULT 0,
+  get_cube_red          TINYINT   NOT NULL,
+  get_cube_green        TINYINT   NOT NULL,
+  get_cube_gold         TINYINT   NOT NULL,
+  get_cube_purple       TINYINT   NOT NULL,
+  get_cube_skyblue      TINYINT   NOT NULL,
+  collect_tree_of_life  TINYINT   NOT NULL,
+  collect_meteorite     TINYINT   NOT NULL,
+  get_air_supply_purple TINYINT   NOT NULL,
+  get_air_supply_red    TINYINT   NOT NULL,
+  version_major         SMALLINT  NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+CREATE TABLE trait_info
+(
+  trait_id   INT      NOT NULL,
+  trait_name VARCHAR(16) NOT NULL,
+  PRIMARY KEY (trait_id)
+);
+
+CREATE TABLE user_match_kda_detail
+(
+  match_id          INT     NOT NULL,
+  user_id           INT     NOT NULL,
+  kill_phase_one    TINYINT NOT NULL,
+  kill_phase_two    TINYINT NOT NULL,
+  kill_phase_three  TINYINT NOT NULL,
+  death_phase_one   TINYINT NOT NULL,
+  death_phase_two   TINYINT NOT NULL,
+  death_phase_three TINYINT NOT NULL,
+  version_major     SMALLINT NOT NULL,
+  PRIMARY KEY (match_id, user_id, version_major)
+)
+PARTITION BY RANGE (version_major) (
+  PARTITION p_future VALUES LESS THAN MAXVALUE
+);
+
+-- 메타 통계 집계 테이블 (scripts/stats.py). 경기를 적재하는 트랜잭션에서 경기의 savepoint와 함께 증분을 더하고
+-- (DB_INSERT_MODE=insert일 때만), python stats.py --rebuild로 원본 매치 테이블에서 다시 계산한다. 평균 = 합계 / games
+CREATE TABLE stat_character
+(
+  version_major SMALLINT NOT NULL,
+  character_id  INT      NOT NULL,
+  weapon_type   SMALLINT NOT NULL,
+  games         INT      NOT NULL,
+  wins          INT      NOT NULL COMMENT '팀 순위 1위',
+  top3          INT      NOT NULL COMMENT '팀 순위 3위 이내',
+  total_damage  BIGINT   NOT NULL COMMENT '플레이어에게 준 피해량 합계',
+  total_kills   INT      NOT NULL,
+  PRIMARY KEY (version_major, character_id, weapon_type)
+);
+
+CREATE TABLE stat_equipment
+(
+  version_major SMALLINT  NOT NULL,
+  character_id  INT       NOT NULL,
+  equipment_id  MEDIUMINT NOT NULL COMMENT '최종 장비',
+  games         INT       NOT NULL,
+  wins          INT       NOT NULL,
+  PRIMARY KEY (version_major, character_id, equipment_id)
+);
+
+CREATE TABLE stat_trait
+(
+  version_major SMALLINT NOT NULL,
+  character_id  INT      NOT NULL,
+  core_trait_id INT      NOT NULL,
+  games         INT      NOT NULL,
+  wins          INT      NOT NULL,
+  PRIMARY KEY (version_major, character_id, core_trait_id)
+);
+
+-- 버전별 분석용 커버링 인덱스 (InnoDB 보조 인덱스에는 기본 키 컬럼이 함께 저장됨)
+CREATE INDEX idx_match_info_version ON match_info (version_major, season_id, match_mode);
+
+-- 캐릭터 승률: match_user_basic의 (version_major, character_id, team_id) + 기본 키(match_id, user_id)만 읽고 팀 순위는 기본 키로 조회
+CREATE INDEX idx_basic_version_character ON match_user_basic (version_major, character_id, team_id);
+
+-- 아이템 선택률
+CREATE INDEX idx_equipment_version_weapon ON match_user_equipment (version_major, equipment_weapon);
+
+-- 특성 선택률
+CREATE INDEX idx_trait_version_core ON match_user_trait (version_major, core_trait_id);
@@ -0,0 +1,290 @@
+import os
+import json
+import mmap
+import zlib
+import struct
+import logging
+import threading
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATA_RAW_PATH = os.getenv("data_raw")
+# segment 파일 하나의 최대 크기 (넘으면 다음 segment로 넘어감)
+ARCHIVE_SEGMENT_SIZE = int(os.getenv("ARCHIVE_SEGMENT_SIZE", 256 * 1024 * 1024))
+
+SEGMENT_HEADER = struct.Struct("<qI")    # match_id, 압축된 길이
+INDEX_RECORD = struct.Struct("<qIQI")    # match_id, segment 번호, offset, 압축된 길이
+INDEX_FILE = "index.bin"
+# zlib 스트림의 첫 바이트 (CMF: deflate, 32K window)
+ZLIB_MAGIC = 0x78
+
+def read_record(data, position: int) -> tuple | None:
+    """position에서 시작하는 온전한 segment 레코드. 헤더가 잘렸거나 압축 데이터가 끝까지 풀리지 않으면 None
+
+    Args:
+        data (bytes | mmap.mmap): segment 파일 내용
+        position (int): 레코드 헤더 위치
+
+    Returns:
+        tuple | None: (match_id, 압축 데이터 offset, 압축된 길이)
+    """
+    start = position + SEGMENT_HEADER.size
+    if start >= len(data):
+        return None
+    match_id, length = SEGMENT_HEADER.unpack_from(data, position)
+    if length == 0 or start + length > len(data) or data[start] != ZLIB_MAGIC:
+        return None
+    decompressor = zlib.decompressobj()
+    try:
+        decompressor.decompress(data[start:start + length])
+    except zlib.error:
+        return None
+    if not decompressor.eof or decompressor.unused_data:
+        return None
+    return match_id, start, length
+
+def scan_segment(path: str, start: int = 0) -> tuple:
+    """segment 파일을 start부터 읽어 온전한 레코드를 찾음
+
+    쓰는 도중 종료되면 레코드가 잘린 채 남고, 다음 실행의 레코드가 그 뒤에 이어 붙을 수 있다.
+    손상된 레코드를 만나면 다음 zlib 시작 바이트마다 헤더를 맞춰 보며 다음 온전한 레코드부터 다시 읽는다.
+
+    Args:
+        path (str): segment 파일 경로
+        start (int, optional): 읽기 시작할 레코드 헤더 위치. Defaults to 0.
+
+    Returns:
+        tuple: ([(match_id, offset, 압축된 길이)...], 마지막 온전한 레코드의 끝 위치, [(건너뛴 시작, 끝)...])
+    """
+    records, skipped = [], []
+    end = start
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= start:
+            return records, end, skipped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            position = start
+            while position < len(data):
+                record = read_record(data, position)
+                if record is None:
+                    # 다음 후보: 헤더 바로 뒤가 zlib 시작 바이트인 위치
+                    candidate = position + 1
+                    while True:
+                        magic = data.find(bytes([ZLIB_MAGIC]), candidate + SEGMENT_HEADER.size)
+                        if magic < 0:
+                            candidate = len(data)
+                            break
+                        candidate = magic - SEGMENT_HEADER.size
+                        if read_record(data, candidate) is not None:
+                            break
+                        candidate += 1
+                    skipped.append((position, candidate))
+                    position = candidate
+                    continue
+                records.append(record)
+                position = end = record[1] + record[2]
+    return records, end, skipped
+
+class MatchArchive:
+    """원본 경기 JSON을 압축해 append-only segment 파일에 저장하는 아카이브
+
+    segment_{n}.seg 파일에는 [match_id, 길이 헤더 + zlib 압축된 JSON] 레코드가 이어 붙고,
+    index.bin에는 match_id → (segment, offset, 길이) 고정 길이 레코드가 쌓인다.
+    인덱스는 열 때 메모리에 올리므로 경기 하나를 읽을 때는 seek 한 번, read 한 번이면 된다.
+    데이터를 쓴 뒤에 인덱스를 쓰므로 중간에 종료되어도 인덱스가 없는 데이터를 가리키지 않는다.
+    쓰기는 한 프로세스에서만 해야 하며, 읽기는 여러 프로세스에서 동시에 해도 된다.
+    """
+    def __init__(self, root: str, segment_size: int = ARCHIVE_SEGMENT_SIZE, level: int = 6):
+        """
+        Args:
+            root (str): 아카이브 디렉토리
+            segment_size (int, optional): segment 파일 최대 크기(byte). Defaults to ARCHIVE_SEGMENT_SIZE.
+            level (int, optional): zlib 압축 레벨. Defaults to 6.
+        """
+        self.root = root
+        self.segment_size = segment_size
+        self.level = level
+        self._lock = threading.Lock()
+        self._index = {}
+        self._index_file = None
+        self._tail_checked = False
+        os.makedirs(root, exist_ok=True)
+        self._load_index()
+        segments = self._segment_numbers()
+        self._segment = segments[-1] if segments else 0
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.root, f"segment_{segment:05d}.seg")
+
+    def _segment_numbers(self) -> list:
+        return sorted(
+            int(name[len("segment_"):-len(".seg")]) for name in os.listdir(self.root)
+            if name.startswith("segment_") and name.endswith(".seg")
+        )
+
+    def _load_index(self) -> None:
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % INDEX_RECORD.size
+        if usable != len(data):
+            # 쓰다 만 마지막 레코드 제거
+            with open(path, "r+b") as f:
+                f.truncate(usable)
+        for match_id, segment, offset, length in INDEX_RECORD.iter_unpack(data[:usable]):
+            self._index[match_id] = (segment, offset, length)
+
+    def __contains__(self, match_id) -> bool:
+        return int(match_id) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def match_ids(self) -> list:
+        """저장된 경기 ID를 segment/offset 순서(디스크 순서)로 반환"""
+        return sorted(self._index, key=self._index.get)
+
+    def append(self, match_id: int, payload: dict) -> bool:
+        """경기 원본 데이터를 압축해 추가
+
+        Args:
+            match_id (int): 경기 고유 ID
+            payload (dict): /v1/games/{match_id} 응답
+
+        Returns:
+            bool: 새로 저장했으면 True, 이미 있으면 False
+        """
+        if int(match_id) in self._index:
+            return False
+        return self.append_raw(match_id, json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def append_raw(self, match_id: int, raw: bytes) -> bool:
+        """API 응답 본문(JSON 바이트)을 그대로 압축해 추가
+
+        Args:
+            match_id (int): 경기 고유 ID
+            raw (bytes): /v1/games/{match_id} 응답 본문
+
+        Returns:
+            bool: 새로 저장했으면 True, 이미 있으면 False
+        """
+        match_id = int(match_id)
+        if match_id in self._index:
+            return False
+        blob = zlib.compress(raw, self.level)
+        with self._lock:
+            if match_id in self._index:
+                return False
+            if not self._tail_checked:
+                self._repair_tail()
+            path = self._segment_path(self._segment)
+            if os.path.exists(path) and os.path.getsize(path) + len(blob) > self.segment_size:
+                self._segment += 1
+                path = self._segment_path(self._segment)
+            with open(path, "ab") as f:
+                f.write(SEGMENT_HEADER.pack(match_id, len(blob)))
+                offset = f.tell()
+                f.write(blob)
+            if self._index_file is None:
+                self._index_file = open(os.path.join(self.root, INDEX_FILE), "ab")
+            self._index_file.write(INDEX_RECORD.pack(match_id, self._segment, offset, len(blob)))
+            self._index_file.flush()
+            self._index[match_id] = (self._segment, offset, len(blob))
+        return True
+
+    def _repair_tail(self) -> None:
+        """이 프로세스에서 처음 쓰기 전에, 쓰던 segment에서 인덱스에 없는 꼬리를 정리
+
+        이전 실행이 레코드를 쓰고 인덱스를 쓰기 전에 종료되었으면 온전한 레코드는 인덱스에 추가하고,
+        레코드를 쓰다 종료되어 잘린 꼬리는 잘라 내 새 레코드가 손상된 바이트 뒤에 붙지 않도록 한다.
+        읽기만 하는 프로세스는 쓰기 중인 꼬리를 건드리지 않도록 쓰기 프로세스에서만 호출한다.
+        """
+        self._tail_checked = True
+        path = self._segment_path(self._segment)
+        if not os.path.exists(path):
+            return
+        indexed_end = max(
+            (offset + length for segment, offset, length in self._index.values() if segment == self._segment), default=0)
+        if os.path.getsize(path) <= indexed_end:
+            return
+        records, end, skipped = scan_segment(path, indexed_end)
+        if self._index_file is None:
+            self._index_file = open(os.path.join(self.root, INDEX_FILE), "ab")
+        for match_id, offset, length in records:
+            if match_id not in self._index:
+                self._index_file.write(INDEX_RECORD.pack(match_id, self._segment, offset, length))
+                self._index[match_id] = (self._segment, offset, length)
+        self._index_file.flush()
+        size = os.path.getsize(path)
+        if end < size:
+            logging.getLogger(__name__).warning(
+                f"Truncating {size - end} bytes of partial records at the end of {path} "
+                f"({len(records)} unindexed records recovered)")
+            with open(path, "r+b") as f:
+                f.truncate(end)
+
+    def read_raw(self, match_id: int) -> bytes | None:
+        """경기 하나의 압축 해제된 JSON 바이트를 반환. 없으면 None"""
+        location = self._index.get(int(match_id))
+        if location is None:
+            return None
+        segment, offset, length = location
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return zlib.decompress(f.read(length))
+
+    def get(self, match_id: int) -> dict | None:
+        """경기 하나의 원본 데이터를 반환. 없으면 None"""
+        raw = self.read_raw(match_id)
+        return json.loads(raw) if raw is not None else None
+
+    def iter_matches(self):
+        """(match_id, 원본 데이터)를 디스크 순서대로 순회"""
+        for match_id in self.match_ids():
+            yield match_id, self.get(match_id)
+
+    def rebuild_index(self) -> int:
+        """segment 파일의 레코드를 읽어 index.bin을 다시 만듦 (인덱스가 손상되었을 때 사용)
+
+        잘린 레코드는 건너뛰고 그 뒤의 온전한 레코드부터 다시 읽으며, 건너뛴 범위는 로그로 남긴다.
+        segment 끝에 남은 잘린 레코드는 잘라 낸다.
+
+        Returns:
+            int: 인덱스에 기록된 경기 수
+        """
+        logger = logging.getLogger(__name__)
+        with self._lock:
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+            index = {}
+            for segment in self._segment_numbers():
+                path = self._segment_path(segment)
+                records, end, skipped = scan_segment(path)
+                for start, stop in skipped:
+                    logger.warning(f"Skipped {stop - start} bytes of damaged records in {path} at offset {start}")
+                for match_id, offset, length in records:
+                    index.setdefault(match_id, (segment, offset, length))
+                if end < os.path.getsize(path):
+                    with open(path, "r+b") as f:
+                        f.truncate(end)
+            self._tail_checked = True
+            with open(os.path.join(self.root, INDEX_FILE), "wb") as f:
+                for match_id, (segment, offset, length) in index.items():
+                    f.write(INDEX_RECORD.pack(match_id, segment, offset, length))
+            self._index = index
+        return len(index)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+
+def get_match_archive() -> MatchArchive | None:
+    """프로세스 전역에서 공유하는 원본 경기 아카이브를 반환. data_raw가 설정되지 않았으면 None"""
+    if not hasattr(get_match_archive, "_archive"):
+        get_match_archive._archive = MatchArchive(DATA_RAW_PATH) if DATA_RAW_PATH else None
+    return get_match_archive._archive
@@ -1,11 +1,18 @@
 import os
+import json
+import random
 import asyncio
 import aiohttp
 from dotenv import load_dotenv
 import requests
 from typing import List, Dict, Any
-from functools import lru_cache
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from tqdm import tqdm
+from rate_limiter import get_rate_limiter, API_MAX_CONCURRENCY
+from static_cache import get_static_cache
+from decoding import decode_match, decode_user_games, decode_with_fallback
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -18,67 +25,172 @@ HEADERS_WITH_KEY = {
     "x-api-key": API_KEY
 }
 
-# 정적 데이터 캐싱
-@lru_cache(maxsize=None)
-def get_character():
-    character_url = f'{BASE_URL}/v2/data/Character'
-    character_levelup_url = f'{BASE_URL}/v2/data/CharacterLevelUpStat'
-    response_c = requests.get(character_url, headers=HEADERS_WITH_KEY)
-    response_cl = requests.get(character_levelup_url, headers=HEADERS_WITH_KEY)
-    if response_c.status_code == 200 and response_cl.status_code == 200:
-        return response_c.json(), response_cl.json()
-    else:
-        print(f"[Error] get_character - status_code: {response_c.status_code}")
-        print(f"[Error] get_character - status_code: {response_cl.status_code}")
-        return None
+# 재시도 설정
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", 5))
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 
-@lru_cache(maxsize=None)
-def get_equipment():
-    url_armor = f'{BASE_URL}/v2/data/ItemArmor'
-    url_weapon = f'{BASE_URL}/v2/data/ItemWeapon'
-    
-    response_armor = requests.get(url_armor, headers=HEADERS_WITH_KEY)
-    response_weapon = requests.get(url_weapon, headers=HEADERS_WITH_KEY)
-    if response_armor.status_code == 200 and response_weapon.status_code == 200:
-        return response_armor.json(), response_weapon.json()
-    else:
-        print(f"[Error] get_equipment armor - status_code: {response_armor.status_code}")
-        print(f"[Error] get_equipment weapon - status_code: {response_weapon.status_code}")
-        return None
-    
-@lru_cache(maxsize=None)
-def get_trait() -> dict | None:
-    """_summary_
+# 세션 전체에서 누적되는 커넥션 사용 통계
+CONNECTION_STATS = {"requests": 0, "created": 0, "reused": 0, "dns_cache_hit": 0, "dns_cache_miss": 0}
+
+def _connection_trace_config() -> aiohttp.TraceConfig:
+    """커넥션 생성/재사용, DNS 캐시 적중 여부를 CONNECTION_STATS에 기록하는 TraceConfig를 반환"""
+    def counter(key):
+        async def on_event(session, ctx, params):
+            CONNECTION_STATS[key] += 1
+        return on_event
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(counter("requests"))
+    trace_config.on_connection_create_end.append(counter("created"))
+    trace_config.on_connection_reuseconn.append(counter("reused"))
+    trace_config.on_dns_cache_hit.append(counter("dns_cache_hit"))
+    trace_config.on_dns_cache_miss.append(counter("dns_cache_miss"))
+    return trace_config
+
+def create_session() -> aiohttp.ClientSession:
+    """실행 전체에서 공유할 aiohttp 세션을 생성
+
+    커넥션 수 상한을 rate limiter의 동시 요청 수 상한에 맞추고, DNS 캐시와 keep-alive를 켜서
+    한 번 맺은 TCP/TLS 연결을 계속 재사용한다. 응답은 gzip/deflate 압축을 요청한다.
 
     Returns:
-        dict | None: _description_
+        aiohttp.ClientSession: API 요청용 세션
     """
-    url = f'{BASE_URL}/v2/data/Trait'
-    response = requests.get(url, headers=HEADERS_WITH_KEY)
-    
-    if response.status_code == 200:
-        return response.json()
+    connector = aiohttp.TCPConnector(
+        limit=API_MAX_CONCURRENCY,
+        limit_per_host=API_MAX_CONCURRENCY,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=60,
+    )
+    return aiohttp.ClientSession(
+        headers={**HEADERS_WITH_KEY, "accept-encoding": "gzip, deflate"},
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30, connect=10),
+        trace_configs=[_connection_trace_config()],
+    )
+
+def connection_stats_summary() -> str:
+    """커넥션 재사용 통계를 문자열로 반환"""
+    stats = CONNECTION_STATS
+    connections = stats["created"] + stats["reused"]
+    reuse_rate = stats["reused"] / connections * 100 if connections else 0.0
+    return (f"requests={stats['requests']}, connections_created={stats['created']}, "
+            f"connections_reused={stats['reused']} ({reuse_rate:.1f}%), "
+            f"dns_cache_hit={stats['dns_cache_hit']}, dns_cache_miss={stats['dns_cache_miss']}")
+
+@asynccontextmanager
+async def session_scope(session: aiohttp.ClientSession | None = None):
+    """주어진 세션을 그대로 쓰고, 없으면 임시 세션을 만들어 블록이 끝날 때 닫음"""
+    if session is not None:
+        yield session
     else:
-        print(f"[Error] get_trait - status_code: {response.status_code}")
-        return None
+        async with create_session() as own_session:
+            yield own_session
+
+L10N_URL = 'https://d1wkxvul68bth9.cloudfront.net/l10n/l10n-Korean-20250417055750.txt'
+
+STATIC_URLS = {
+    "character": f'{BASE_URL}/v2/data/Character',
+    "levelup": f'{BASE_URL}/v2/data/CharacterLevelUpStat',
+    "armor": f'{BASE_URL}/v2/data/ItemArmor',
+    "weapon": f'{BASE_URL}/v2/data/ItemWeapon',
+    "trait": f'{BASE_URL}/v2/data/Trait',
+    "l10n": L10N_URL,
+}
+
+# 정적 데이터 캐싱
+async def fetch_static(session, url: str, version, as_text: bool = False):
+    """정적 데이터를 디스크 캐시에서 읽고, 캐시가 없거나 만료되었을 때만 API를 요청
+
+    만료된 캐시는 ETag/Last-Modified 조건부 요청으로 재검증하고(304면 그대로 사용),
+    요청이 실패하면 만료된 캐시라도 반환한다.
 
-@lru_cache(maxsize=None)
-def get_l10n() -> str | None:
-    """_summary_
+    Args:
+        session (aiohttp.ClientSession): API 세션
+        url (str): 정적 데이터 URL
+        version: 캐시 키로 사용할 게임 버전
+        as_text (bool, optional): 응답을 텍스트로 받을지 여부. Defaults to False (JSON).
 
     Returns:
-        str | None: _description_
+        dict | str | None: 응답 본문. 캐시도 없고 요청도 실패하면 None
     """
-    url = 'https://d1wkxvul68bth9.cloudfront.net/l10n/l10n-Korean-20250417055750.txt'
-    response = requests.get(url, headers=HEADERS_WITH_KEY)
-        
-    if response.status_code == 200:
-        response.encoding = response.apparent_encoding
-        l10n = response.text
-        return l10n
-    else:
-        print(f"[Error] get_trait - status_code: {response.status_code}")
-        return None
+    cache = get_static_cache()
+    entry = cache.load(url, version)
+    if entry and cache.is_fresh(entry):
+        return entry["body"]
+
+    limiter = get_rate_limiter()
+    started = await limiter.acquire()
+    status = None
+    try:
+        async with session.get(url, headers=cache.conditional_headers(entry)) as response:
+            status = response.status
+            if status == 304 and entry:
+                return cache.touch(url, version, entry)["body"]
+            if status == 200:
+                if as_text:
+                    body = (await response.read()).decode("utf-8-sig")
+                else:
+                    body = await response.json()
+                return cache.store(url, version, body, response.headers.get("ETag"),
+                                   response.headers.get("Last-Modified"))["body"]
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"[Error] fetch_static - {url}: {type(e).__name__} {e}")
+    finally:
+        limiter.release(started, status)
+
+    print(f"[Error] fetch_static - {url}, status_code: {status}")
+    return entry["body"] if entry else None
+
+async def get_character(session, version):
+    """캐릭터 기본 정보와 레벨업 능력치 데이터를 반환"""
+    return await asyncio.gather(
+        fetch_static(session, STATIC_URLS["character"], version),
+        fetch_static(session, STATIC_URLS["levelup"], version),
+    )
+
+async def get_equipment(session, version):
+    """방어구와 무기 데이터를 반환"""
+    return await asyncio.gather(
+        fetch_static(session, STATIC_URLS["armor"], version),
+        fetch_static(session, STATIC_URLS["weapon"], version),
+    )
+
+async def get_trait(session, version) -> dict | None:
+    """특성 데이터를 반환"""
+    return await fetch_static(session, STATIC_URLS["trait"], version)
+
+async def get_l10n(session, version) -> str | None:
+    """한국어 l10n 텍스트를 반환 (URL에 l10n 버전이 포함되어 있음)"""
+    return await fetch_static(session, STATIC_URLS["l10n"], version, as_text=True)
+
+async def get_static_data(session, version) -> dict:
+    """정적 데이터를 동시에 가져옴. 캐시가 유효하면 네트워크 요청 없이 디스크에서 읽음
+
+    Args:
+        session (aiohttp.ClientSession): API 세션
+        version: 게임 버전 (캐시 키)
+
+    Returns:
+        dict: character, levelup, armor, weapon, trait, l10n 키를 가지는 딕셔너리
+    """
+    (character, levelup), (armor, weapon), trait, l10n = await asyncio.gather(
+        get_character(session, version),
+        get_equipment(session, version),
+        get_trait(session, version),
+        get_l10n(session, version),
+    )
+    return {
+        "character": character,
+        "levelup": levelup,
+        "armor": armor,
+        "weapon": weapon,
+        "trait": trait,
+        "l10n": l10n,
+    }
 
 def get_top_ranker(season: int, matching_mode: int) -> dict | None:
     """특정 시즌, 지역, 매칭 모드에서의 상위 랭커 정보를 반환
@@ -100,6 +212,100 @@ def get_top_ranker(season: int, matching_mode: int) -> dict | None:
         print(f"[Error] get_top_ranker - status_code: {response.status_code}")
         return None
 
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환
+
+    Args:
+        value (str | None): Retry-After 헤더 값
+
+    Returns:
+        float | None: 대기 시간(초). 헤더가 없거나 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def retry_delay(attempt: int, retry_after: float | None = None) -> float:
+    """재시도 전 대기 시간(초)을 계산
+
+    Retry-After가 있으면 그 값을 따르고, 없으면 지수 백오프에 full jitter를 적용한다.
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 횟수
+        retry_after (float | None, optional): 서버가 지정한 대기 시간(초)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY * 4)
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+async def fetch_json(session, url: str, name: str, max_retries: int = API_MAX_RETRIES,
+                     loads=json.loads, keep_body: bool = False):
+    """rate limiter를 거쳐 GET 요청을 보내고 JSON 응답을 반환
+
+    429/5xx 응답과 네트워크 오류는 Retry-After 또는 지수 백오프만큼 기다린 뒤 재시도하고,
+    그 밖의 오류 상태 코드는 바로 None을 반환한다.
+    응답이 loads의 타입 스키마와 맞지 않으면(API 스키마 변경) 표준 json으로 디코딩한 결과를 반환하고,
+    JSON이 아니면 다시 요청해도 같으므로 재시도하지 않고 실패로 반환한다.
+
+    Args:
+        session (aiohttp.ClientSession): API 세션
+        url (str): 요청 URL
+        name (str): 로그에 표시할 호출 이름
+        max_retries (int, optional): 최대 재시도 횟수. Defaults to API_MAX_RETRIES.
+        loads (Callable, optional): 응답 본문 디코딩 함수 (decoding.decode_match 등). Defaults to json.loads.
+        keep_body (bool, optional): True면 (디코딩 결과, 원본 바이트)를 반환. Defaults to False.
+
+    Returns:
+        dict | tuple | None: JSON 응답 (keep_body면 (응답, 원본 바이트)). 실패하면 None
+            (keep_body이고 응답은 받았지만 JSON이 아니면 (None, 원본 바이트))
+    """
+    limiter = get_rate_limiter()
+    for attempt in range(max_retries + 1):
+        started = await limiter.acquire()
+        status = None
+        retry_after = None
+        try:
+            async with session.get(url) as response:
+                status = response.status
+                if status == 200:
+                    body = await response.read()
+                    try:
+                        data, schema_error = decode_with_fallback(loads, body)
+                    except ValueError as e:
+                        # 잘못된 JSON: 다시 요청해도 같으므로 재시도하지 않음
+                        print(f"[Error] {name} - {url}: invalid payload, {e}")
+                        return (None, body) if keep_body else None
+                    if schema_error is not None:
+                        print(f"[Warning] {name} - {url}: payload does not match the typed schema, decoded with json ({schema_error})")
+                    return (data, body) if keep_body else data
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[Error] {name} - {url}: {type(e).__name__} {e}")
+        finally:
+            limiter.release(started, status, retry_after)
+
+        if status is not None and status not in RETRYABLE_STATUS:
+            print(f"[Error] {name} - {url}, status_code: {status}")
+            return None
+        if attempt < max_retries:
+            await asyncio.sleep(retry_delay(attempt, retry_after))
+
+    print(f"[Error] {name} - {url}, status_code: {status} (gave up after {max_retries} retries)")
+    return None
+
 async def fetch_user_games(session, url: str) -> dict:
     """유저의 match 정보를 가져오는 함수
 
@@ -111,68 +317,127 @@ async def fetch_user_games(session, url: str) -> dict:
         dict: _description_
     """
     # url = f"{BASE_URL}/v1/user/games/{user_num}"
-    async with session.get(url) as response:
-        if response.status == 200:
-            return await response.json()
-        else:
-            print(f"[Error] fetch_user_games - status_code: {response.status}")
-            return None
+    return await fetch_json(session, url, "fetch_user_games", loads=decode_user_games)
+
+def collect_page_match_ids(data: dict, main_version: int, match_ids_set: set, stop_at: int | None = None) -> bool:
+    """유저 게임 목록 한 페이지에서 main_version 경기 ID를 모으고 다음 페이지 탐색 여부를 반환
 
-async def get_match_ids_async(user_nums: List[int], main_version: int) -> List[int]:
+    Args:
+        data (dict): /v1/user/games 응답
+        main_version (int): 수집할 게임 패치 버전
+        match_ids_set (set): 경기 ID를 추가할 집합
+        stop_at (int | None, optional): 유저의 watermark. 이 gameId 이하가 나오면 탐색 종료
+
+    Returns:
+        bool: 다음 페이지를 계속 탐색해야 하면 True
+    """
+    for game in data["userGames"]:
+        if stop_at is not None and game["gameId"] <= stop_at:
+            return False  # 지난 수집에서 이미 본 경기부터는 탐색 종료
+        if game["versionMajor"] > main_version:
+            continue  # 그냥 무시하고 다음 게임
+        elif game["versionMajor"] == main_version:
+            if game["matchingMode"] == 3:
+                match_ids_set.add(game["gameId"])
+        else:  # game["versionMajor"] < main_version
+            return False  # 버전이 낮으면 바로 탐색 종료
+    return bool(data.get("next"))
+
+async def get_match_ids_async(user_nums: List[int], main_version: int, num_workers: int | None = None,
+                              session: aiohttp.ClientSession | None = None, watermarks=None,
+                              use_watermarks: bool = True) -> List[int]:
     """비동기적으로 여러 사용자의 게임 ID를 수집합니다.
-        각 사용자별로 수집 게임 수를 제한할 수 있습니다.
+        (user_num, next) 작업을 큐에 넣고 고정된 수의 worker가 나눠 처리하므로
+        모든 유저의 페이지 탐색이 동시에 진행되며, 각 유저의 탐색은 버전 조건에 따라 개별적으로 종료됩니다.
+        watermarks가 주어지면 지난 수집에서 본 경기에 도달하는 즉시 해당 유저의 탐색을 멈추고,
+        탐색이 정상적으로 끝난 유저만 이번에 본 가장 최근 gameId로 watermark를 갱신합니다.
+        (중간 페이지 요청이 실패한 유저는 갱신하지 않아 다음 수집에서 못 본 경기를 다시 탐색)
+
+    Args:
+        user_nums (List[int]): 수집할 유저 번호 리스트
+        main_version (int): 수집할 게임 패치 버전
+        num_workers (int | None, optional): worker 수. Defaults to rate limiter의 동시 요청 수 상한.
+        session (aiohttp.ClientSession | None, optional): 공유 세션. 없으면 임시 세션을 생성
+        watermarks (UserWatermarks | None, optional): 유저별 watermark. 저장은 호출한 쪽에서 처리
+        use_watermarks (bool, optional): False면 watermark에서 멈추지 않고 패치 버전 시작까지 탐색 (watermark는 갱신).
+            Defaults to True.
 
     Returns:
-        _type_: _description_
+        List[int]: 중복이 제거된 경기 ID 리스트
     """
+    main_version = int(main_version)
+    num_workers = num_workers or get_rate_limiter().max_concurrency
     match_ids_set = set()
-    
-    async with aiohttp.ClientSession(headers=HEADERS_WITH_KEY) as session:
-        tasks = []
-        for user_num in tqdm(user_nums):
-            url = f"{BASE_URL}/v1/user/games/{user_num}"
-            tasks.append(fetch_user_games(session, url))
-        
-        responses = await asyncio.gather(*tasks)
-        for user_num, data in zip(user_nums, responses):
-            while data and "userGames" in data:
-                stop_crawling = False  # 중단 여부 플래그
-                for game in data["userGames"]:
-                    if game["versionMajor"] > main_version:
-                        continue  # 그냥 무시하고 다음 게임
-                    elif game["versionMajor"] == main_version:
-                        if game["matchingMode"] == 3:
-                            match_ids_set.add(game["gameId"])
-                    else:  # game["versionMajor"] < main_version
-                        stop_crawling = True
-                        break  # 버전이 낮으면 바로 탐색 종료
-
-                if stop_crawling or not data.get('next'):
-                    break  # 크롤링 중단 또는 next 없으면 종료
-
-                # 다음 페이지로 이동
-                url = f"{BASE_URL}/v1/user/games/{user_num}?next={data['next']}"
+    queue = asyncio.Queue()
+    for user_num in user_nums:
+        stop_at = watermarks.get(user_num) if watermarks is not None and use_watermarks else None
+        queue.put_nowait((user_num, None, stop_at, None))
+    progress = tqdm(total=len(user_nums), desc="Collecting match IDs")
+
+    async def worker(session):
+        while True:
+            user_num, next_cursor, stop_at, newest = await queue.get()
+            try:
+                url = f"{BASE_URL}/v1/user/games/{user_num}"
+                if next_cursor:
+                    url = f"{url}?next={next_cursor}"
                 data = await fetch_user_games(session, url)
+                if not data or "userGames" not in data:
+                    progress.update(1)  # 페이지 요청 실패: watermark를 갱신하지 않고 종료
+                    continue
+                if next_cursor is None and data["userGames"]:
+                    # 첫 페이지의 가장 최근 gameId. 탐색이 끝까지 성공했을 때만 watermark로 저장
+                    newest = max(game["gameId"] for game in data["userGames"])
+                if collect_page_match_ids(data, main_version, match_ids_set, stop_at):
+                    # 다음 페이지로 이동
+                    queue.put_nowait((user_num, data["next"], stop_at, newest))
+                else:
+                    # watermark/이전 버전에 도달했거나 next가 없어 탐색 완료
+                    if watermarks is not None and newest is not None:
+                        watermarks.update(user_num, newest)
+                    progress.update(1)
+            except Exception as e:
+                print(f"[Error] get_match_ids_async - user_num: {user_num}, {e}")
+                progress.update(1)
+            finally:
+                queue.task_done()
+
+    async with session_scope(session) as session:
+        workers = [asyncio.create_task(worker(session)) for _ in range(num_workers)]
+        try:
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            progress.close()
 
     return list(match_ids_set)
 
 async def fetch_match_info(session, match_id):
     """비동기적으로 단일 게임 정보를 가져옵니다."""
     url = f"{BASE_URL}/v1/games/{match_id}"
-    async with session.get(url) as response:
-        if response.status == 200:
-            return match_id, await response.json()
-        else:
-            print(f"[Error] fetch_match_info - match_id: {match_id}, status_code: {response.status}")
-            return match_id, None
-
-async def get_match_infos_async(match_ids: List[int], batch_size: int = 10) -> Dict[int, Any]:
+    return match_id, await fetch_json(session, url, "fetch_match_info", loads=decode_match)
+
+async def fetch_match_payload(session, match_id) -> tuple:
+    """단일 게임 정보와 함께 응답 원본 바이트를 가져옵니다 (아카이브 저장용).
+
+    Returns:
+        tuple: (디코딩된 게임 정보, 원본 바이트). 응답이 JSON이 아니면 (None, 원본 바이트), 요청이 실패하면 (None, None)
+    """
+    url = f"{BASE_URL}/v1/games/{match_id}"
+    result = await fetch_json(session, url, "fetch_match_info", loads=decode_match, keep_body=True)
+    return result if result is not None else (None, None)
+
+async def get_match_infos_async(match_ids: List[int], batch_size: int = 10,
+                                session: aiohttp.ClientSession | None = None) -> Dict[int, Any]:
     """
     비동기적으로 여러 게임의 정보를 배치 단위로 수집합니다.
+    요청 속도와 동시 요청 수는 공용 rate limiter가 조절합니다.
     """
     result = {}
     
-    async with aiohttp.ClientSession(headers=HEADERS_WITH_KEY) as session:
+    async with session_scope(session) as session:
         # 배치 단위로 처리
         for i in range(0, len(match_ids), batch_size):
             batch = match_ids[i:i+batch_size]
@@ -182,10 +447,6 @@ async def get_match_infos_async(match_ids: List[int], batch_size: int = 10) -> D
             for match_id, data in batch_results:
                 if data:
                     result[match_id] = data
-            
-            # 배치 간 짧은 대기 시간 추가하여 API 서버 부하 방지
-            if i + batch_size < len(match_ids):
-                await asyncio.sleep(0.5)
     
     return result
 
@@ -0,0 +1,178 @@
+import os
+import re
+import math
+import struct
+from dotenv import load_dotenv
+from match_spec import MATCH_TABLE_SPECS
+from parsing import RowBatch, TABLE_COLUMNS
+
+load_dotenv()
+
+# match_user_credit_time 저장 방식
+#   rows: 유저 × 분마다 한 행 (경기당 최대 480행)
+#   packed: 유저마다 한 행에 분별 사용/획득 크레딧을 고정 길이 바이너리 컬럼으로 저장 (match_user_credit_timeline).
+#           스키마의 match_user_credit_time 테이블 자리에 같은 컬럼의 뷰를 만들어 기존 조회는 그대로 동작
+CREDIT_TIME_LAYOUTS = ("rows", "packed")
+CREDIT_TIME_LAYOUT = os.getenv("CREDIT_TIME_LAYOUT", "rows").lower()
+
+CREDIT_TIME_TABLE = "match_user_credit_time"
+CREDIT_TIMELINE_TABLE = "match_user_credit_timeline"
+CREDIT_MINUTES = MATCH_TABLE_SPECS[CREDIT_TIME_TABLE].series.length
+# 분별 값 CREDIT_MINUTES개를 int16 big-endian으로 이어 붙인 값 (BINARY(40)). 행 방식의 SMALLINT와 같은 범위
+CREDIT_STRUCT = struct.Struct(f">{CREDIT_MINUTES}h")
+CREDIT_MIN, CREDIT_MAX = -2 ** 15, 2 ** 15 - 1
+# 행 방식 컬럼 → packed 컬럼
+PACKED_COLUMNS = {"used_credit": "used_credits", "gain_credit": "gain_credits"}
+
+def _credit_value(value) -> int:
+    """크레딧 값을 SMALLINT 정수로 변환. 실수는 MySQL처럼 반올림(0에서 먼 쪽)
+
+    Raises:
+        ValueError: 숫자가 아니거나 SMALLINT 범위(-32768~32767)를 벗어날 때 발생
+    """
+    if isinstance(value, float):
+        value = int(math.floor(abs(value) + 0.5) * (1 if value >= 0 else -1)) if math.isfinite(value) else value
+    if not isinstance(value, int) or not CREDIT_MIN <= value <= CREDIT_MAX:
+        raise ValueError(f"credit value {value!r} is outside the SMALLINT range {CREDIT_MIN}..{CREDIT_MAX}")
+    return value
+
+def pack_credits(values) -> bytes:
+    """분별 크레딧 CREDIT_MINUTES개를 BINARY 값으로 인코딩
+
+    값은 행 방식의 SMALLINT와 같은 -32768~32767이며, 실수는 반올림한다.
+
+    Raises:
+        ValueError: SMALLINT 범위를 벗어난 값이 있을 때 발생
+    """
+    try:
+        return CREDIT_STRUCT.pack(*values)
+    except struct.error:
+        # 정수가 아닌 값(실수)이나 범위를 벗어난 값이 있을 때만 값마다 변환/검사
+        return CREDIT_STRUCT.pack(*map(_credit_value, values))
+
+def unpack_credits(data: bytes) -> tuple:
+    """pack_credits로 저장한 값을 분별 크레딧 튜플로 디코딩"""
+    return CREDIT_STRUCT.unpack(data)
+
+def storage_table(table: str) -> str:
+    """현재 저장 방식에서 테이블의 행이 실제로 저장되는 테이블 이름"""
+    if CREDIT_TIME_LAYOUT == "packed" and table == CREDIT_TIME_TABLE:
+        return CREDIT_TIMELINE_TABLE
+    return table
+
+def pack_credit_batch(batch: RowBatch) -> RowBatch:
+    """match_user_credit_time 행(분마다 한 행)을 유저마다 한 행인 match_user_credit_timeline 배치로 변환
+
+    행에 없는 분(크레딧이 모두 0이라 저장하지 않은 분)은 0으로 채운다.
+    TABLE_COLUMNS 뒤에 덧붙은 컬럼(파티션 스키마의 version_major 등)은 그대로 유지한다.
+
+    Args:
+        batch (RowBatch): match_user_credit_time 배치
+
+    Returns:
+        RowBatch: (match_id, user_id, used_credits, gain_credits, 덧붙은 컬럼...) 배치
+    """
+    columns = batch.columns
+    match_index, user_index, minute_index, used_index, gain_index = (
+        columns.index(column) for column in TABLE_COLUMNS[CREDIT_TIME_TABLE])
+    extra_indexes = tuple(i for i, column in enumerate(columns) if column not in TABLE_COLUMNS[CREDIT_TIME_TABLE])
+
+    users = {}
+    for row in batch.rows:
+        key = (row[match_index], row[user_index])
+        user = users.get(key)
+        if user is None:
+            user = users[key] = ([0] * CREDIT_MINUTES, [0] * CREDIT_MINUTES, tuple(row[i] for i in extra_indexes))
+        user[0][row[minute_index]] = row[used_index]
+        user[1][row[minute_index]] = row[gain_index]
+
+    rows = []
+    for (match_id, user_id), (used, gain, extra) in users.items():
+        try:
+            rows.append((match_id, user_id, pack_credits(used), pack_credits(gain)) + extra)
+        except ValueError as e:
+            raise ValueError(f"{CREDIT_TIME_TABLE} match_id {match_id} user_id {user_id}: {e}") from None
+    return RowBatch(CREDIT_TIMELINE_TABLE, ("match_id", "user_id", "used_credits", "gain_credits") + tuple(columns[i] for i in extra_indexes), rows)
+
+def expand_credit_batch(batch: RowBatch) -> RowBatch:
+    """pack_credit_batch의 반대. match_user_credit_timeline 행을 match_user_credit_time 행(0이 아닌 분만)으로 펼침
+
+    Args:
+        batch (RowBatch): match_user_credit_timeline 배치 (DB에서 읽은 행 등)
+
+    Returns:
+        RowBatch: TABLE_COLUMNS["match_user_credit_time"] 순서(+ 덧붙은 컬럼) 배치
+    """
+    columns = batch.columns
+    match_index, user_index, used_index, gain_index = (
+        columns.index(column) for column in ("match_id", "user_id", "used_credits", "gain_credits"))
+    extra_indexes = tuple(i for i in range(len(columns)) if i not in (match_index, user_index, used_index, gain_index))
+
+    unpack = CREDIT_STRUCT.unpack
+    rows = []
+    for row in batch.rows:
+        extra = tuple(row[i] for i in extra_indexes)
+        for minute, (used, gain) in enumerate(zip(unpack(row[used_index]), unpack(row[gain_index]))):
+            if used != 0 or gain != 0:
+                rows.append((row[match_index], row[user_index], minute, used, gain) + extra)
+    return RowBatch(CREDIT_TIME_TABLE, TABLE_COLUMNS[CREDIT_TIME_TABLE] + tuple(columns[i] for i in extra_indexes), rows)
+
+def _decode_sql(column: str) -> str:
+    """BINARY 컬럼에서 m.minute번째 int16 big-endian 값을 읽는 SQL 식 (상위 바이트가 128 이상이면 음수)"""
+    high = f"ASCII(SUBSTRING(t.{column}, 2 * m.minute + 1, 1))"
+    return (f"({high} - CASE WHEN {high} >= 128 THEN 256 ELSE 0 END) * 256 + "
+            f"ASCII(SUBSTRING(t.{column}, 2 * m.minute + 2, 1))")
+
+def packed_credit_schema(schema: str) -> str:
+    """스키마 SQL의 match_user_credit_time 테이블을 packed 방식으로 바꿈
+
+    테이블은 minute를 빼고 used_credit/gain_credit을 BINARY 컬럼으로 바꾼 match_user_credit_timeline이 되고
+    (덧붙은 컬럼, 기본 키, 파티션 절은 유지), 외래 키 등 테이블을 가리키는 다른 문도 새 테이블을 가리킨다.
+    원래 테이블 이름으로는 분 단위 행으로 펼치는 같은 컬럼의 뷰를 만든다.
+
+    Args:
+        schema (str): 스키마 파일 내용
+
+    Returns:
+        str: 바뀐 스키마. match_user_credit_time 테이블이 없으면 그대로 반환
+    """
+    schema = re.sub(rf"\b{CREDIT_TIME_TABLE}\b", CREDIT_TIMELINE_TABLE, schema)
+    match = re.search(rf"CREATE TABLE {CREDIT_TIMELINE_TABLE}\s*\((.*?)\n\)([^;]*);", schema, re.S)
+    if match is None:
+        return schema
+    body, options = match.groups()
+
+    lines, columns = [], []
+    for line in body.strip("\n").split("\n"):
+        column = re.match(r"\s*(\w+)\s", line)
+        name = column.group(1) if column else None
+        if name == "PRIMARY":
+            lines.append(re.sub(r",\s*minute\b|\bminute,\s*", "", line))
+            continue
+        if name is not None:
+            columns.append(name)
+        if name == "minute":
+            continue
+        if name in PACKED_COLUMNS:
+            line = (f"  {PACKED_COLUMNS[name]} BINARY({CREDIT_STRUCT.size}) NOT NULL "
+                    f"COMMENT '분별 {name} {CREDIT_MINUTES}개 (int16 big-endian)',")
+        lines.append(line)
+    table = f"CREATE TABLE {CREDIT_TIMELINE_TABLE}\n(\n" + "\n".join(lines) + f"\n){options};"
+
+    minutes = " UNION ALL ".join(f"SELECT {minute}" if minute else "SELECT 0 AS minute" for minute in range(CREDIT_MINUTES))
+    expanded = ",\n         ".join(
+        "m.minute" if column == "minute"
+        else f"{_decode_sql(PACKED_COLUMNS[column])} AS {column}" if column in PACKED_COLUMNS
+        else f"t.{column}"
+        for column in columns
+    )
+    view = (
+        f"CREATE VIEW {CREDIT_TIME_TABLE} AS\n"
+        f"SELECT {', '.join(columns)} FROM (\n"
+        f"  SELECT {expanded}\n"
+        f"  FROM {CREDIT_TIMELINE_TABLE} t\n"
+        f"  CROSS JOIN ({minutes}) m\n"
+        f") expanded\n"
+        f"WHERE {' OR '.join(f'{column} <> 0' for column in PACKED_COLUMNS)};"
+    )
+    return schema[:match.start()] + table + "\n\n" + view + schema[match.end():]
@@ -1,26 +1,65 @@
 import pymysql
+from pymysql.converters import escape_item
 from dbutils.pooled_db import PooledDB
 from dotenv import load_dotenv
 import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
 from typing import List
+from functools import lru_cache
 from time import sleep
 import logging
+from parsing import RowBatch, MatchBatch, TABLE_COLUMNS
+from init_db import read_primary_keys, read_table_columns, init_db, finalize_db
+from storage import StorageBackend, get_storage_backend
+from stats import add_match_stats
+from credit_timeline import pack_credit_batch, storage_table
 load_dotenv()
 
 DB_HOST = os.getenv("DB_HOST")
-DB_PORT = int(os.getenv("DB_PORT"))
+DB_PORT = int(os.getenv("DB_PORT", 3306))
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 
-# 최대 커넥션 수 증가 및 커넥션 풀 최적화
+# 1이면 트랜잭션 밖의 문장은 각각 바로 커밋 (조회가 오래된 스냅샷을 보지 않도록 기본값 유지).
+# 경기 적재는 이 값과 관계없이 transaction()으로 묶어 커밋
+DB_AUTOCOMMIT = os.getenv("DB_AUTOCOMMIT", "1") != "0"
+# 트랜잭션 하나로 커밋하는 최대 경기 수
+DB_COMMIT_MATCHES = int(os.getenv("DB_COMMIT_MATCHES", 50))
+
+# 기본 키가 이미 있는 행을 만났을 때의 처리 (db/schema.sql의 기본 키 기준)
+#   insert: 일반 INSERT. 중복 키 오류가 나면 해당 경기는 savepoint로 롤백되어 실패로 표시
+#   ignore: INSERT IGNORE. 이미 있는 행은 그대로 두고 건너뜀 (외래 키/값 범위 오류도 경고로 바뀌는 점에 주의)
+#   upsert: INSERT ... ON DUPLICATE KEY UPDATE. 기본 키가 같은 행을 새 값으로 갱신
+# ignore/upsert에서는 재실행, 재시도, 동시에 실행되는 크롤러가 존재 여부를 먼저 조회하지 않고 그대로 써도 된다
+DB_INSERT_MODES = ("insert", "ignore", "upsert")
+DB_INSERT_MODE = os.getenv("DB_INSERT_MODE", "insert").lower()
+# 1이면 경기를 적재하는 트랜잭션(경기의 savepoint) 안에서 메타 통계 집계 테이블(stat_*)에 증분을 더함 (stats.py).
+# ignore/upsert에서는 이미 있던 경기도 다시 더해지므로 DB_INSERT_MODE가 insert일 때만 사용
+DB_MATCH_STATS = os.getenv("DB_MATCH_STATS", "1") != "0"
+
+# 테이블 배치 적재 방식
+#   executemany: pymysql의 executemany (INSERT 문 하나가 최대 1MB)
+#   values: max_allowed_packet 크기에 맞춘 다중 행 INSERT ... VALUES (...),(...)
+#   load_data: LOAD DATA LOCAL INFILE (서버의 local_infile=ON 필요. insert 모드에서는 건너뛴 행이 있으면 오류)
+DB_BULK_LOADER = os.getenv("DB_BULK_LOADER", "values").lower()
+# values 방식에서 INSERT 문 하나의 최대 크기(바이트). 0이면 서버의 max_allowed_packet에 맞춤
+DB_MAX_STATEMENT_BYTES = int(os.getenv("DB_MAX_STATEMENT_BYTES", 0))
+# load_data 방식에서 행 버퍼를 잠시 내려놓을 디렉토리 (기본: 메모리 기반 /dev/shm, 없으면 시스템 임시 디렉토리)
+BULK_TMP_PATH = os.getenv("bulk_tmp_path", "/dev/shm" if os.path.isdir("/dev/shm") else None)
+
+# 프로세스 하나의 커넥션 풀 크기. 경기 적재는 DB 적재 프로세스가 각자 커넥션 하나로 처리하므로
+# 풀은 조회와 정적 데이터 저장에만 쓰여 작게 유지
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 4))
+
 def create_pool():
     return PooledDB(
         creator=pymysql,
-        maxconnections=24,  
-        mincached=8,        
-        maxcached=32,       
-        maxshared=8,        
+        maxconnections=DB_POOL_SIZE,
+        mincached=1,
+        maxcached=DB_POOL_SIZE,
         blocking=True,
         host=DB_HOST,
         port=DB_PORT,
@@ -28,44 +67,29 @@ def create_pool():
         password=DB_PASSWORD,
         database=DB_NAME,
         charset='utf8mb4',
-        autocommit=True,
+        autocommit=DB_AUTOCOMMIT,
+        local_infile=DB_BULK_LOADER == "load_data",
         ping=7
     )
 
 def get_db_connection():
-    """프로세스마다 독립적인 풀에서 커넥션을 가져옴
+    """STORAGE_BACKEND의 커넥션을 가져옴 (MySQL은 프로세스마다 독립적인 풀에서 가져옴)
 
     Returns:
-        get_db_connection._pool.connection(): 데이터베이스 커넥션 객체
+        Any: 데이터베이스 커넥션 객체. close()하면 반납
     """
-    if not hasattr(get_db_connection, "_pool"):
-        get_db_connection._pool = create_pool()
-    
-    # 커넥션을 얻기 전에 대기 시간 추가 (필요시)
-    # 재시도 로직 추가
-    for attempt in range(3):
-        try:
-            return get_db_connection._pool.connection()
-        except Exception as e:
-            if attempt < 2:  # 마지막 시도가 아니면 대기 후 재시도
-                sleep(1.5)
-            else:
-                raise
+    return get_storage_backend().connect()
 
-def match_exists(conn, match_id):
-    """주어진 match_id가 이미 데이터베이스에 존재하는지 확인
+def get_writer_connection():
+    """DB 적재 프로세스가 실행 내내 사용하는 커넥션 하나를 반환
 
-    Args:
-        conn (_type_): _description_
-        match_id (_type_): _description_
+    ProcessPoolExecutor의 initializer로 지정하면 프로세스가 시작될 때 미리 연결한다.
 
     Returns:
-        _type_: _description_
+        Any: 데이터베이스 커넥션 객체
     """
-    with conn.cursor() as cursor:
-        cursor.executemany("SELECT 1 FROM match_info WHERE match_id = %s LIMIT 1;", (match_id,))
-        return cursor.fetchone() is not None
-        
+    return get_storage_backend().writer_connection()
+
 def insert_dict(conn, table, data):
     """단일 딕셔너리를 테이블에 삽입
 
@@ -76,12 +100,7 @@ def insert_dict(conn, table, data):
     """
     if not data:
         return
-    with conn.cursor() as cursor:
-        keys = ', '.join(data.keys())
-        values = ', '.join(['%s'] * len(data))
-        sql = f"INSERT INTO {table} ({keys}) VALUES ({values});"
-        # executemany의 두 번째 인자는 리스트 of 튜플이어야 함
-        cursor.executemany(sql, [tuple(data.values())])
+    insert_batch(conn, RowBatch(table, tuple(data.keys()), [tuple(data.values())]))
 
 def insert_list(conn, table_name: str, data_list: dict):
     """여러 개의 딕셔너리 데이터를 지정한 테이블에 일괄 삽입
@@ -95,16 +114,382 @@ def insert_list(conn, table_name: str, data_list: dict):
         ValueError: 데이터의 컬럼 개수와 값 개수가 일치하지 않을 때 발생
     """
     keys = list(data_list[0].keys())
-    keys_str = ', '.join(keys)
-    values_placeholder = ', '.join(['%s'] * len(keys))
-    sql = f"INSERT INTO {table_name} ({keys_str}) VALUES ({values_placeholder})"
     values = [tuple(data.get(key) for key in keys) for data in data_list]
-    # 각 튜플의 길이가 %s 개수와 일치하는지 체크
+    # 각 튜플의 길이가 컬럼 개수와 일치하는지 체크
     for v in values:
         if len(v) != len(keys):
             raise ValueError(f"Value length {len(v)} does not match column count {len(keys)}")
+    insert_batch(conn, RowBatch(table_name, tuple(keys), values))
+
+def get_primary_keys() -> dict:
+    """db/schema.sql의 테이블별 기본 키 컬럼 (프로세스마다 한 번만 읽음)"""
+    if not hasattr(get_primary_keys, "_keys"):
+        get_primary_keys._keys = read_primary_keys()
+    return get_primary_keys._keys
+
+def get_denormalized_columns() -> dict:
+    """스키마의 매치 테이블에는 있지만 파서가 만들지 않는 match_info 컬럼 (프로세스마다 한 번만 읽음)
+
+    파티션 스키마(db/schema_partitioned.sql)에서는 모든 매치 테이블에 파티션 키 version_major가 있으므로
+    {"match_user_basic": ("version_major",), ...}가 되고, 기본 스키마에서는 빈 딕셔너리다.
+    """
+    if not hasattr(get_denormalized_columns, "_columns"):
+        schema = read_table_columns()
+        match_info = TABLE_COLUMNS["match_info"]
+        columns = {}
+        for table, parsed in TABLE_COLUMNS.items():
+            extra = tuple(column for column in schema.get(storage_table(table), ()) if column not in parsed and column in match_info)
+            if extra:
+                columns[table] = extra
+        get_denormalized_columns._columns = columns
+    return get_denormalized_columns._columns
+
+@lru_cache(maxsize=None)
+def insert_clauses(table_name: str, columns: tuple, mode: str = DB_INSERT_MODE) -> tuple:
+    """insert 방식에 맞는 INSERT 문의 앞부분(... VALUES )과 뒷부분(ON DUPLICATE KEY UPDATE ...)
+
+    upsert는 기본 키가 아닌 컬럼을 모두 새 값으로 갱신한다. 기본 키 컬럼만 있는 행은 갱신할 값이 없어 ignore와 같다.
+
+    Args:
+        table_name (str): 테이블 이름
+        columns (tuple): 컬럼 순서
+        mode (str, optional): DB_INSERT_MODES 중 하나. Defaults to DB_INSERT_MODE.
+
+    Raises:
+        ValueError: 알 수 없는 방식이거나, upsert인데 스키마에 테이블의 기본 키가 없을 때 발생
+
+    Returns:
+        tuple: (앞부분, 뒷부분) 문자열
+    """
+    if mode not in DB_INSERT_MODES:
+        raise ValueError(f"Unknown insert mode {mode!r} (expected one of {DB_INSERT_MODES})")
+    head = f"INTO {table_name} ({', '.join(columns)}) VALUES "
+    if mode == "insert":
+        return "INSERT " + head, ""
+    if mode == "upsert":
+        if table_name not in get_primary_keys():
+            raise ValueError(f"No primary key for {table_name} in schema; cannot upsert")
+        primary_key = get_primary_keys()[table_name]
+        updates = [f"{column} = VALUES({column})" for column in columns if column not in primary_key]
+        if updates:
+            return "INSERT " + head, f" ON DUPLICATE KEY UPDATE {', '.join(updates)}"
+    return "INSERT IGNORE " + head, ""
+
+@lru_cache(maxsize=None)
+def insert_sql(table_name: str, columns: tuple, mode: str = DB_INSERT_MODE) -> str:
+    """테이블과 컬럼 순서, insert 방식에 맞는 INSERT 문 (테이블마다 한 번만 만듦)"""
+    head, tail = insert_clauses(table_name, columns, mode)
+    return f"{head}({', '.join(['%s'] * len(columns))}){tail}"
+
+def get_max_allowed_packet(conn) -> int:
+    """서버의 max_allowed_packet (프로세스마다 한 번만 조회)"""
+    if not hasattr(get_max_allowed_packet, "_bytes"):
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT @@max_allowed_packet")
+            get_max_allowed_packet._bytes = int(cursor.fetchone()[0])
+    return get_max_allowed_packet._bytes
+
+def insert_executemany(conn, table: str, columns: tuple, rows: List[tuple], mode: str = DB_INSERT_MODE) -> None:
+    """pymysql executemany로 삽입 (pymysql이 ON DUPLICATE KEY UPDATE 절을 유지한 채 최대 1MB 단위의 다중 행 INSERT로 묶음)"""
+    with conn.cursor() as cursor:
+        cursor.executemany(insert_sql(table, columns, mode), rows)
+
+def insert_values(conn, table: str, columns: tuple, rows: List[tuple], max_bytes: int | None = None,
+                  mode: str = DB_INSERT_MODE) -> None:
+    """행을 max_allowed_packet 크기에 맞춘 다중 행 INSERT ... VALUES (...),(...) 문으로 삽입
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        table (str): 테이블 이름
+        columns (tuple): 컬럼 순서
+        rows (List[tuple]): 컬럼 순서대로 값을 담은 튜플 리스트
+        max_bytes (int | None, optional): INSERT 문 하나의 최대 크기. Defaults to DB_MAX_STATEMENT_BYTES 또는 max_allowed_packet.
+        mode (str, optional): 중복 키 처리 방식 (DB_INSERT_MODES). Defaults to DB_INSERT_MODE.
+    """
+    if max_bytes is None:
+        # 패킷 헤더 여유분을 뺀 크기
+        max_bytes = DB_MAX_STATEMENT_BYTES or get_max_allowed_packet(conn) - 1024
+    head, tail = insert_clauses(table, columns, mode)
+    prefix = head.encode("utf-8")
+    suffix = tail.encode("utf-8")
+    with conn.cursor() as cursor:
+        values = []
+        size = len(prefix) + len(suffix)
+        for row in rows:
+            value = escape_item(row, "utf8mb4").encode("utf-8")
+            if values and size + len(value) + 1 > max_bytes:
+                cursor.execute(prefix + b",".join(values) + suffix)
+                values = []
+                size = len(prefix) + len(suffix)
+            values.append(value)
+            size += len(value) + 1
+        if values:
+            cursor.execute(prefix + b",".join(values) + suffix)
+
+def _tsv_value(value) -> str:
+    """LOAD DATA의 기본 형식(탭 구분, \\ 이스케이프, NULL은 \\N)에 맞춘 값"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        # pymysql과 같이 시간대 정보 없이 저장
+        return f"{value:%Y-%m-%d %H:%M:%S.%f}"
+    if isinstance(value, bytes):
+        # BINARY 컬럼은 16진수로 쓰고 LOAD DATA의 SET 절에서 UNHEX
+        return value.hex()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+def load_data(conn, table: str, columns: tuple, rows: List[tuple], mode: str = DB_INSERT_MODE) -> None:
+    """행을 메모리에서 탭 구분 텍스트로 만든 뒤 LOAD DATA LOCAL INFILE로 적재
+
+    pymysql은 LOCAL INFILE을 파일 이름으로만 보낼 수 있어 버퍼를 BULK_TMP_PATH(기본 /dev/shm)에 잠시 내려놓는다.
+    LOCAL 적재에서는 MySQL이 중복 키/외래 키 오류를 경고로 바꾸고 해당 행을 건너뛰므로(IGNORE와 같음),
+    insert 모드에서는 경고가 있으면 오류를 발생시켜 호출한 쪽의 savepoint가 경기를 롤백하도록 한다.
+    ignore 모드에서는 경고 수를 로그로만 남긴다.
+    LOAD DATA의 REPLACE는 행을 지웠다가 다시 넣어 자식 테이블의 외래 키와 충돌하므로 upsert는 insert_values로 적재한다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체 (local_infile=True)
+        table (str): 테이블 이름
+        columns (tuple): 컬럼 순서
+        rows (List[tuple]): 컬럼 순서대로 값을 담은 튜플 리스트
+        mode (str, optional): 중복 키 처리 방식 (DB_INSERT_MODES). Defaults to DB_INSERT_MODE.
+
+    Raises:
+        pymysql.err.IntegrityError: insert 모드에서 건너뛴 행이 있을 때(경고가 있을 때) 발생
+    """
+    if mode == "upsert":
+        insert_values(conn, table, columns, rows, mode=mode)
+        return
+    logger = logging.getLogger(__name__)
+    binary = {i for i, value in enumerate(rows[0]) if isinstance(value, bytes)}
+    targets = ", ".join(f"@c{i}" if i in binary else column for i, column in enumerate(columns))
+    assignments = f" SET {', '.join(f'{columns[i]} = UNHEX(@c{i})' for i in sorted(binary))}" if binary else ""
+    buffer = "".join("\t".join(map(_tsv_value, row)) + "\n" for row in rows).encode("utf-8")
+    with tempfile.NamedTemporaryFile(dir=BULK_TMP_PATH, prefix=f"{table}-", suffix=".tsv", delete=False) as f:
+        f.write(buffer)
+        path = f.name
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s {'IGNORE ' if mode == 'ignore' else ''}INTO TABLE {table} CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({targets}){assignments}",
+                (path,),
+            )
+            cursor.execute("SELECT @@warning_count")
+            warnings = cursor.fetchone()[0]
+            if warnings and mode == "insert":
+                cursor.execute("SHOW WARNINGS LIMIT 1")
+                _, code, message = cursor.fetchone()
+                raise pymysql.err.IntegrityError(code, f"LOAD DATA into {table}: {warnings} warnings ({len(rows)} rows), first: {message}")
+            if warnings:
+                logger.warning(f"LOAD DATA into {table}: {warnings} warnings ({len(rows)} rows)")
+    finally:
+        os.remove(path)
+
+BULK_LOADERS = {
+    "executemany": insert_executemany,
+    "values": insert_values,
+    "load_data": load_data,
+}
+
+class MySQLBackend(StorageBackend):
+    """.env의 MySQL 서버를 사용하는 백엔드 (STORAGE_BACKEND=mysql)"""
+    name = "mysql"
+
+    def connect(self):
+        """프로세스마다 독립적인 풀에서 커넥션을 가져옴. 풀이 가득 차 실패하면 잠시 기다렸다가 다시 시도"""
+        if not hasattr(self, "_pool"):
+            self._pool = create_pool()
+        for attempt in range(3):
+            try:
+                return self._pool.connection()
+            except Exception:
+                if attempt < 2:  # 마지막 시도가 아니면 대기 후 재시도
+                    sleep(1.5)
+                else:
+                    raise
+
+    def writer_connection(self):
+        """처음 호출할 때 연결하고, 끊겼으면 다시 연결. 풀을 만들지 않으므로 적재 프로세스 수만큼만 커넥션이 열린다"""
+        if not hasattr(self, "_writer"):
+            self._writer = pymysql.connect(
+                host=DB_HOST,
+                port=DB_PORT,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                database=DB_NAME,
+                charset='utf8mb4',
+                autocommit=DB_AUTOCOMMIT,
+                local_infile=DB_BULK_LOADER == "load_data",
+            )
+        else:
+            self._writer.ping(reconnect=True)
+        return self._writer
+
+    def init_schema(self, bulk_load: bool = False, schema_path: str | None = None) -> None:
+        init_db(bulk_load=bulk_load, database=DB_NAME or "ER_Dataset", schema_path=schema_path)
+
+    def finalize_schema(self, schema_path: str | None = None) -> dict:
+        return finalize_db(DB_NAME or "ER_Dataset", schema_path)
+
+    def insert_rows(self, conn, table: str, columns: tuple, rows: List[tuple], mode: str = DB_INSERT_MODE,
+                    loader: str | None = None) -> None:
+        BULK_LOADERS[loader or DB_BULK_LOADER](conn, table, columns, rows, mode=mode)
+
+    def increment_sql(self, table: str, key_columns: tuple, value_columns: tuple) -> str:
+        columns = key_columns + value_columns
+        updates = ", ".join(f"{column} = {column} + VALUES({column})" for column in value_columns)
+        return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+                f"ON DUPLICATE KEY UPDATE {updates}")
+
+    def table_names(self, conn) -> set:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()")
+            return {row[0] for row in cursor.fetchall()}
+
+def insert_batch(conn, batch: RowBatch, loader: str = DB_BULK_LOADER, mode: str = DB_INSERT_MODE) -> None:
+    """RowBatch의 행 튜플을 그대로 일괄 삽입
+
+    행은 이미 batch.columns 순서의 튜플이므로 딕셔너리 조회나 튜플 재생성 없이 적재 함수에 넘긴다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        batch (RowBatch): 삽입할 테이블 배치
+        loader (str, optional): MySQL의 BULK_LOADERS 적재 방식 (다른 백엔드는 무시). Defaults to DB_BULK_LOADER.
+        mode (str, optional): 중복 키 처리 방식 (DB_INSERT_MODES). Defaults to DB_INSERT_MODE.
+    """
+    if not batch.rows:
+        return
+    get_storage_backend().insert_rows(conn, batch.table, batch.columns, batch.rows, mode=mode, loader=loader)
+
+def save_match_batch(conn, match_batch: MatchBatch) -> None:
+    """MatchBatch에 모인 경기들을 테이블별로 적재 (TABLE_COLUMNS 순서라 외래 키 순서를 지킴)
+
+    CREDIT_TIME_LAYOUT=packed이면 match_user_credit_time 행을 유저마다 한 행으로 묶어 match_user_credit_timeline에 넣는다.
+    match_stats_enabled()이면 같은 savepoint 안에서 집계 테이블도 갱신하므로 경기 행과 집계가 함께 커밋/롤백된다.
+    오류는 호출한 쪽(write_matches)에서 savepoint 롤백과 함께 기록한다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        match_batch (MatchBatch): 적재할 경기 배치
+    """
+    for batch in match_batch.batches():
+        if storage_table(batch.table) != batch.table:
+            batch = pack_credit_batch(batch)
+        insert_batch(conn, batch)
+    if match_stats_enabled():
+        add_match_stats(conn, match_batch)
+
+def match_stats_enabled() -> bool:
+    """경기를 적재할 때 집계 테이블에 증분을 더할지 여부. DB_INSERT_MODE가 insert가 아니면 끄고 한 번만 경고"""
+    if not DB_MATCH_STATS:
+        return False
+    if DB_INSERT_MODE != "insert":
+        if not hasattr(match_stats_enabled, "_warned"):
+            match_stats_enabled._warned = True
+            logging.getLogger(__name__).warning(
+                f"Incremental stats disabled with DB_INSERT_MODE={DB_INSERT_MODE}; run stats.py --rebuild after loading")
+        return False
+    return True
+
+@contextmanager
+def transaction(conn):
+    """블록 안의 문장을 하나의 트랜잭션으로 실행. 예외가 나면 롤백하고 다시 발생시킴
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+    """
+    conn.begin()
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+@contextmanager
+def savepoint(conn, name: str):
+    """트랜잭션 안에서 블록을 SAVEPOINT로 감쌈. 예외가 나면 블록의 변경만 되돌리고 다시 발생시킴
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체 (transaction 안)
+        name (str): savepoint 이름
+    """
     with conn.cursor() as cursor:
-        cursor.executemany(sql, values)
+        cursor.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except Exception:
+        with conn.cursor() as cursor:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        raise
+    with conn.cursor() as cursor:
+        cursor.execute(f"RELEASE SAVEPOINT {name}")
+
+def write_matches(conn, items, commit_matches: int = DB_COMMIT_MATCHES) -> dict:
+    """파싱된 경기들을 commit_matches개씩 트랜잭션 하나로 적재
+
+    트랜잭션마다 먼저 모든 경기를 테이블별 대량 적재로 한 번에 넣고, 실패하면 그 적재만 되돌린 뒤
+    경기마다 SAVEPOINT를 두고 하나씩 다시 넣는다. 실패한 경기는 자기 savepoint까지만 롤백되므로
+    나머지 경기는 같은 커밋으로 저장되고, 실패한 경기는 일부 행도 남지 않아 그대로 다시 시도할 수 있다.
+    집계 증분은 save_match_batch가 경기 행과 같은 savepoint 안에서 더하므로, 롤백된 경기의 증분은 남지 않는다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        items (List[tuple]): (match_id, parse_match_rows의 결과) 리스트
+        commit_matches (int, optional): 트랜잭션 하나로 커밋하는 최대 경기 수. Defaults to DB_COMMIT_MATCHES.
+
+    Returns:
+        dict: match_id별 저장 성공 여부
+    """
+    logger = logging.getLogger(__name__)
+    results = {}
+    for start in range(0, len(items), commit_matches):
+        chunk = items[start:start + commit_matches]
+        chunk_results = {}
+        try:
+            with transaction(conn):
+                try:
+                    with savepoint(conn, "match_batch"):
+                        match_batch = MatchBatch(get_denormalized_columns())
+                        for match_id, match_rows in chunk:
+                            match_batch.add(match_id, match_rows)
+                        save_match_batch(conn, match_batch)
+                    chunk_results = {match_id: True for match_id, _ in chunk}
+                except Exception as e:
+                    if len(chunk) == 1:
+                        raise
+                    logger.warning(f"Bulk insert of {len(chunk)} matches failed ({e}); retrying one match at a time")
+                    for match_id, match_rows in chunk:
+                        try:
+                            with savepoint(conn, "match"):
+                                match_batch = MatchBatch(get_denormalized_columns())
+                                match_batch.add(match_id, match_rows)
+                                save_match_batch(conn, match_batch)
+                            chunk_results[match_id] = True
+                        except Exception as e:
+                            logger.error(f"[DB ERROR] match_id {match_id}: {e}")
+                            chunk_results[match_id] = False
+        except Exception as e:
+            logger.error(f"[DB ERROR] transaction of {len(chunk)} matches rolled back: {e}")
+            chunk_results = {match_id: False for match_id, _ in chunk}
+        results.update(chunk_results)
+    return results
+
+def write_match_batch(items) -> dict:
+    """DB 적재 프로세스에서 실행. 프로세스의 커넥션으로 경기들을 write_matches로 적재
+
+    Args:
+        items (List[tuple]): (match_id, parse_match_rows의 결과) 리스트
+
+    Returns:
+        dict: match_id별 저장 성공 여부
+    """
+    return write_matches(get_writer_connection(), items)
 
 def bulk_check_match_exists(conn, match_ids):
     """여러 match_id가 이미 데이터베이스에 존재하는지 일괄 확인
@@ -118,14 +503,7 @@ def bulk_check_match_exists(conn, match_ids):
     """
     if not match_ids:
         return set()
-    
-    with conn.cursor() as cursor:
-        placeholders = ', '.join(['%s'] * len(match_ids))
-        sql = f"SELECT match_id FROM match_info WHERE match_id IN ({placeholders});"
-        cursor.executemany(sql, match_ids)
-        
-        # 이미 존재하는 match_id 반환
-        return {row[0] for row in cursor.fetchall()}
+    return get_storage_backend().existing_match_ids(conn, match_ids)
     
 def get_column_as_dict(conn, table_name: str, col: List[str]) -> dict:
     """테이블의 특정 칼럼들에 해당하는 값을 컬럼별 리스트로 묶어 딕셔너리로 반환
@@ -161,32 +539,4 @@ def is_table_empty(conn, table_name: str) -> bool:
     Returns:
         bool: 테이블이 비어 있으면 True, 그렇지 않으면 False
     """
-    with conn.cursor() as cursor:
-        cursor.execute(f"SELECT 1 FROM {table_name} LIMIT 1;")
-        return cursor.fetchone() is None
-    
-    
-def save_parsed_data_to_db(conn, parsed_data: list) -> None:
-    """DB에 파싱한 데이터를 적재
-
-    Args:
-        conn (_type_): 데이터베이스 연결 객체
-        parsed_data (_type_): 적재할 데이터
-        
-    """
-    logger = logging.getLogger(__name__)
-    try:
-        with conn.cursor() as cursor:
-            sql = f"SHOW TABLES FROM er_dataset;"
-            cursor.execute(sql)
-            tables = [t_name[0] for t_name in cursor.fetchall()]
-            
-        for table in tables:
-            if table in parsed_data and parsed_data[table]:
-                if isinstance(parsed_data[table], dict) and parsed_data[table]:
-                    insert_dict(conn, table, parsed_data[table])
-                elif isinstance(parsed_data[table], list) and parsed_data[table]:
-                    insert_list(conn, table, parsed_data[table])        
-    except Exception as e:
-        logger.error(f"Error saving data to DB: {e}")
-        raise
\ No newline at end of file
+    return get_storage_backend().is_table_empty(conn, table_name)
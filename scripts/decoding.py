@@ -0,0 +1,211 @@
+import os
+import json
+from typing import Any, Dict, List, TypedDict, Union
+from dotenv import load_dotenv
+
+try:
+    import msgspec
+except ImportError:  # msgspec이 없으면 표준 json으로 디코딩
+    msgspec = None
+
+load_dotenv()
+
+# msgspec이 설치되어 있으면 경기/유저 게임 응답을 타입이 정해진 구조로 디코딩 (0이면 표준 json 사용)
+API_FAST_DECODE = os.getenv("API_FAST_DECODE", "1") != "0"
+
+# 정수/실수가 섞여 오는 수치 (int는 int, float는 float 그대로 유지)
+Number = Union[int, float]
+
+class _UserGameRequired(TypedDict):
+    gameId: int
+    userNum: int
+    teamNumber: int
+    gameRank: int
+    startDtm: str
+    playTime: int
+    matchingTeamMode: int
+    seasonId: int
+    versionMajor: int
+    versionMinor: int
+    mainWeather: int
+    subWeather: int
+    mmrAvg: Number
+    escapeState: int
+    teamDown: int
+    teamElimination: int
+    exceptPreMadeTeam: bool
+    characterNum: int
+    skinCode: int
+    characterLevel: int
+    playerKill: int
+    playerDeaths: int
+    playerAssistant: int
+    bestWeapon: int
+    bestWeaponLevel: int
+    watchTime: int
+    damageToPlayer: Number
+    damageFromPlayer: Number
+    healAmount: Number
+    teamRecover: Number
+    useHyperLoop: int
+    useSecurityConsole: int
+    routeIdOfStart: int
+    placeOfStart: Union[int, str]
+    useEmoticonCount: int
+    fishingCount: int
+    tacticalSkillGroup: int
+    tacticalSkillLevel: int
+    tacticalSkillUseCount: int
+    creditRevivalCount: int
+    creditRevivedOthersCount: int
+    maxHp: Number
+    maxSp: Number
+    hpRegen: Number
+    spRegen: Number
+    defense: Number
+    attackPower: Number
+    attackSpeed: Number
+    skillAmp: Number
+    coolDownReduction: Number
+    adaptiveForce: Number
+    adaptiveForceAttack: Number
+    adaptiveForceAmplify: Number
+    moveSpeed: Number
+    outOfCombatMoveSpeed: Number
+    sightRange: Number
+    attackRange: Number
+    criticalStrikeChance: Number
+    lifeSteal: Number
+    normalLifeSteal: Number
+    skillLifeSteal: Number
+    damageToPlayer_basic: Number
+    damageToPlayer_skill: Number
+    damageToPlayer_direct: Number
+    damageToPlayer_Shield: Number
+    damageToPlayer_itemSkill: Number
+    damageToPlayer_trap: Number
+    damageFromPlayer_basic: Number
+    damageFromPlayer_skill: Number
+    damageFromPlayer_direct: Number
+    damageOffsetedByShield_Player: Number
+    damageFromPlayer_itemSkill: Number
+    damageFromPlayer_trap: Number
+    traitFirstCore: int
+    traitFirstSub: List[int]
+    traitSecondSub: List[int]
+    mmrBefore: Number
+    mmrAfter: Number
+    mmrGain: Number
+    mmrLossEntryCost: Number
+    killsPhaseOne: int
+    killsPhaseTwo: int
+    killsPhaseThree: int
+    deathsPhaseOne: int
+    deathsPhaseTwo: int
+    deathsPhaseThree: int
+    viewContribution: Number
+    addTelephotoCamera: int
+    removeTelephotoCamera: int
+    useEmpDrone: int
+    useReconDrone: int
+    damageToGuideRobot: Number
+    damageToMonster: Number
+    monsterKill: int
+    getBuffCubeRed: int
+    getBuffCubeGreen: int
+    getBuffCubeGold: int
+    getBuffCubePurple: int
+    getBuffCubeSkyBlue: int
+    collectItemForLog: List[int]
+    airSupplyOpenCount: List[int]
+    totalGainVFCredit: Number
+    crGetKill: Number
+    crGetByGuideRobot: Number
+    totalUseVFCredit: Number
+    transferConsoleFromRevivalUseVFCredit: Number
+    remoteDroneUseVFCreditMySelf: Number
+    remoteDroneUseVFCreditAlly: Number
+    crUseUpgradeTacticalSkill: Number
+    crUseTreeOfLife: Number
+    crUseMeteorite: Number
+    crUseMythril: Number
+    crUseForceCore: Number
+    crUseVFBloodSample: Number
+    crUseRootkit: Number
+    usedVFCredits: List[Number]
+    totalVFCredits: List[Number]
+
+class UserGame(_UserGameRequired, total=False):
+    """/v1/games/{match_id} 응답의 userGames 레코드 중 parsing.py가 읽는 필드
+
+    parser가 user_json["..."]로 읽는 필드는 필수, .get()으로 읽는 필드는 선택이다.
+    여기에 없는 필드는 디코딩하지 않고 건너뛴다.
+    """
+    creditSource: Dict[str, Number]
+    teamDownInAutoResurrection: int
+    teamDownDeactiveAutoResurrection: int
+    teamRepeatDownInAutoResurrection: int
+    teamRepeatDownDeactiveAutoResurrection: int
+    teamDownCanNotEliminate: int
+    teamDownCanEliminate: int
+    teamRepeatDownCanNotEliminate: int
+    teamRepeatDownCanEliminate: int
+    equipment: Dict[str, Any]
+    equipFirstItemForLog: Dict[str, Any]
+    criticalStrikeDamage: Number
+    killMonsters: Dict[str, int]
+    itemTransferredDrone: List[int]
+
+class _Response(TypedDict):
+    code: int
+    message: str
+
+class MatchResponse(_Response, total=False):
+    """/v1/games/{match_id} 응답 (오류 응답에는 userGames가 없음)"""
+    userGames: List[UserGame]
+
+class UserGameSummary(TypedDict):
+    """/v1/user/games/{user_num} 응답에서 경기 ID 수집에 쓰는 필드"""
+    gameId: int
+    versionMajor: int
+    matchingMode: int
+
+class UserGamesResponse(_Response, total=False):
+    """/v1/user/games/{user_num} 응답"""
+    userGames: List[UserGameSummary]
+    next: int
+
+def make_decoder(schema):
+    """schema 구조로 JSON을 디코딩하는 함수를 반환. 빠른 디코딩을 쓰지 않으면 json.loads
+
+    필수 필드가 없거나 타입이 다르면(API 스키마 변경) ValueError의 하위 클래스인
+    msgspec.ValidationError가 바로 발생한다.
+    """
+    if msgspec is None or not API_FAST_DECODE:
+        return json.loads
+    return msgspec.json.Decoder(schema).decode
+
+decode_match = make_decoder(MatchResponse)
+decode_user_games = make_decoder(UserGamesResponse)
+
+def decode_with_fallback(decoder, body: bytes) -> tuple:
+    """decoder로 디코딩하고, 타입 스키마와 맞지 않으면(API 스키마 변경) 표준 json으로 다시 디코딩
+
+    스키마가 바뀐 응답도 원본을 아카이브에 남기고 파서가 처리 여부를 판단하도록 한다.
+
+    Args:
+        decoder (Callable): 응답 본문 디코딩 함수 (decode_match 등)
+        body (bytes): 응답 본문
+
+    Raises:
+        ValueError: 본문이 JSON이 아닐 때 발생
+
+    Returns:
+        tuple: (디코딩 결과, 타입 디코딩에서 발생한 오류 또는 None)
+    """
+    try:
+        return decoder(body), None
+    except ValueError as e:
+        if decoder is json.loads:
+            raise
+        return json.loads(body), e
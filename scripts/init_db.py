@@ -1,6 +1,26 @@
 from dotenv import load_dotenv
+from time import perf_counter
+from typing import List, NamedTuple
+import argparse
 import pymysql
 import os
+import re
+from credit_timeline import CREDIT_TIME_LAYOUT, CREDIT_TIME_LAYOUTS, packed_credit_schema
+
+class ForeignKey(NamedTuple):
+    """스키마의 ALTER TABLE ... ADD CONSTRAINT ... FOREIGN KEY 문 하나"""
+    table: str
+    name: str
+    columns: tuple
+    ref_table: str
+    ref_columns: tuple
+
+FOREIGN_KEY_PATTERN = re.compile(
+    r"ALTER TABLE (\w+)\s+ADD CONSTRAINT (\w+)\s+FOREIGN KEY\s*\(([^)]*)\)\s*REFERENCES (\w+)\s*\(([^)]*)\)", re.I)
+# 대량 적재 모드에서 테이블을 만든 뒤로 미루는 문 (외래 키, 보조 인덱스)
+DEFERRED_PATTERN = re.compile(r"^\s*(ALTER TABLE \w+\s+ADD\s+(CONSTRAINT|INDEX|KEY)|CREATE\s+(UNIQUE\s+)?INDEX)", re.I | re.M)
+CREATE_INDEX_PATTERN = re.compile(r"CREATE\s+(UNIQUE\s+)?INDEX (\w+)\s+ON (\w+)\s*(\(.*\))", re.I | re.S)
+ALTER_TABLE_PATTERN = re.compile(r"ALTER TABLE (\w+)\s+(ADD\s.*)", re.I | re.S)
 
 def check_db_folder():
     """데이터베이스 및 데이터 저장에 필요한 폴더가 존재하는지 확인하고 없으면 생성하는 함수
@@ -15,58 +35,263 @@ def check_db_folder():
             print(f"'{folder}' does not exist. Creating now...")
             os.makedirs(folder)   
                  
-def init_db():
-    """DB 스키마 파일을 읽어 데이터베이스를 초기화하고 필요한 테이블을 생성하는 함수
+def read_schema(schema_path: str | None = None) -> str:
+    """스키마 파일을 읽고 CREDIT_TIME_LAYOUT에 맞게 바꾼 SQL
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Raises:
+        ValueError: CREDIT_TIME_LAYOUT이 CREDIT_TIME_LAYOUTS에 없을 때 발생
+
+    Returns:
+        str: 스키마 SQL
     """
     load_dotenv()
-    schema_path = os.getenv("schema_path")
-    
-    conn = pymysql.connect(
+    if CREDIT_TIME_LAYOUT not in CREDIT_TIME_LAYOUTS:
+        raise ValueError(f"Unknown CREDIT_TIME_LAYOUT {CREDIT_TIME_LAYOUT!r}; expected one of {CREDIT_TIME_LAYOUTS}")
+    with open(schema_path or os.getenv("schema_path"), 'r', encoding='utf-8') as f:
+        schema = f.read()
+    if CREDIT_TIME_LAYOUT == "packed":
+        schema = packed_credit_schema(schema)
+    return schema
+
+def read_table_columns(schema_path: str | None = None) -> dict:
+    """스키마 파일의 CREATE TABLE 문에서 테이블별 컬럼 타입을 읽음
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Returns:
+        dict: {테이블 이름: {컬럼 이름: 타입(예: "SMALLINT", "VARCHAR")}} (컬럼은 정의 순서)
+    """
+    schema = read_schema(schema_path)
+
+    tables = {}
+    for table, body in re.findall(r"CREATE TABLE (\w+)\s*\((.*?)\n\)[^;]*;", schema, re.S):
+        columns = {}
+        for line in body.split("\n"):
+            column = re.match(r"\s*(\w+)\s+([A-Za-z]+)", line)
+            if column and column.group(1).upper() not in ("PRIMARY", "KEY", "UNIQUE", "INDEX", "CONSTRAINT"):
+                columns[column.group(1)] = column.group(2).upper()
+        tables[table] = columns
+    return tables
+
+def read_primary_keys(schema_path: str | None = None) -> dict:
+    """스키마 파일의 CREATE TABLE 문에서 테이블별 기본 키 컬럼을 읽음
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Returns:
+        dict: {테이블 이름: 기본 키 컬럼 튜플} (기본 키가 없는 테이블은 제외)
+    """
+    schema = read_schema(schema_path)
+
+    primary_keys = {}
+    for table, body in re.findall(r"CREATE TABLE (\w+)\s*\((.*?)\n\)[^;]*;", schema, re.S):
+        key = re.search(r"PRIMARY KEY\s*\(([^)]*)\)", body)
+        if key:
+            primary_keys[table] = tuple(column.strip() for column in key.group(1).split(","))
+    return primary_keys
+
+def read_schema_statements(schema_path: str | None = None) -> List[str]:
+    """스키마 파일을 주석(/* */, --)을 뺀 SQL 문 리스트로 읽음
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Returns:
+        List[str]: 세미콜론 없이 앞뒤 공백을 제거한 SQL 문 리스트
+    """
+    schema = read_schema(schema_path)
+    schema = re.sub(r"/\*.*?\*/", "", schema, flags=re.S)
+    schema = re.sub(r"--[^\n]*", "", schema)
+    return [stmt.strip() for stmt in schema.split(';') if stmt.strip()]
+
+def is_deferred_statement(stmt: str) -> bool:
+    """대량 적재 모드에서 finalize_db까지 미루는 문(외래 키 제약, 보조 인덱스)인지 여부"""
+    return DEFERRED_PATTERN.match(stmt) is not None
+
+def read_foreign_keys(schema_path: str | None = None) -> List[ForeignKey]:
+    """스키마 파일의 외래 키 제약을 정의 순서대로 읽음
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Returns:
+        List[ForeignKey]: 외래 키 리스트
+    """
+    foreign_keys = []
+    for stmt in read_schema_statements(schema_path):
+        match = FOREIGN_KEY_PATTERN.match(stmt)
+        if match:
+            table, name, columns, ref_table, ref_columns = match.groups()
+            foreign_keys.append(ForeignKey(
+                table, name,
+                tuple(column.strip() for column in columns.split(",")),
+                ref_table,
+                tuple(column.strip() for column in ref_columns.split(",")),
+            ))
+    return foreign_keys
+
+def connect_database(database: str | None = None):
+    """.env의 MySQL 서버에 autocommit 커넥션을 열고, database가 주어지면 선택"""
+    load_dotenv()
+    return pymysql.connect(
         host=os.getenv("DB_HOST"),
         port=int(os.getenv("DB_PORT")),
         user=os.getenv("DB_USER"),
         password=os.getenv("DB_PASSWORD"),
-        #db=os.getenv("DB_NAME"),
+        database=database,
         charset='utf8mb4',
         autocommit=True
     )
+
+def init_db(bulk_load: bool = False, database: str = "ER_Dataset", schema_path: str | None = None):
+    """DB 스키마 파일을 읽어 데이터베이스를 초기화하고 필요한 테이블을 생성하는 함수
+
+    bulk_load면 외래 키 제약과 보조 인덱스 없이 테이블만 만든다. 행마다 외래 키 검사와 보조 인덱스 갱신이 없으므로
+    크롤링이나 replay로 대량 적재를 마친 뒤 finalize_db로 무결성을 검사하고 제약/인덱스를 한 번에 추가한다.
+
+    Args:
+        bulk_load (bool, optional): 외래 키와 보조 인덱스를 finalize_db까지 미룸. Defaults to False.
+        database (str, optional): 새로 만들 데이터베이스 이름. Defaults to "ER_Dataset".
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+    """
+    load_dotenv()
+    schema_path = schema_path or os.getenv("schema_path")
+    
+    conn = connect_database()
     
     cursor = conn.cursor()
     
     # Create database if not exists
-    cursor.execute("SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME = 'ER_Dataset';")
+    cursor.execute("SELECT SCHEMA_NAME FROM INFORMATION_SCHEMA.SCHEMATA WHERE SCHEMA_NAME = %s;", (database,))
     result = cursor.fetchone()
 
     if result:
-        cursor.execute("DROP DATABASE ER_Dataset;")
-        print("Existing database 'ER_Dataset' has been deleted. Creating a new database.")
+        cursor.execute(f"DROP DATABASE {database};")
+        print(f"Existing database '{database}' has been deleted. Creating a new database.")
     try:
-        cursor.execute("CREATE DATABASE IF NOT EXISTS ER_Dataset CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;")
-        print("Database 'ER_Dataset' is ensured.")
-        cursor.execute("USE ER_Dataset;")
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;")
+        print(f"Database '{database}' is ensured.")
+        cursor.execute(f"USE {database};")
     except Exception as e:
         print(f"[DB CREATE ERROR] → {e}")
 
     # Select the database to use
     try:
-        cursor.execute(f"USE ER_Dataset;")
+        cursor.execute(f"USE {database};")
     except Exception as e:
         print(f"[DB USE ERROR] → {e}")
         
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        sql_statements = f.read().split(';')
-        
-    for stmt in sql_statements:
-        stmt = stmt.strip()
-        if stmt:
-            try:
-                cursor.execute(stmt + ';')
-            except Exception as e:
-                print(f"[SQL ERROR] {stmt}\n→ {e}")
+    deferred = 0
+    for stmt in read_schema_statements(schema_path):
+        if bulk_load and is_deferred_statement(stmt):
+            deferred += 1
+            continue
+        try:
+            cursor.execute(stmt + ';')
+        except Exception as e:
+            print(f"[SQL ERROR] {stmt}\n→ {e}")
+    if bulk_load:
+        print(f"Bulk-load mode: {deferred} constraint/index statements deferred. Run 'init_db.py --finalize' after loading.")
     
     cursor.close()
     conn.close()
 
+    # 저장된 match_id 인덱스는 삭제한 DB 기준이므로 함께 삭제
+    if database == os.getenv("DB_NAME", "ER_Dataset"):
+        from known_ids import remove_index_file
+        remove_index_file()
+
+def find_orphans(cursor, foreign_key: ForeignKey) -> int:
+    """외래 키의 부모 행이 없는 자식 행 수 (NULL 값은 제외)"""
+    not_null = " AND ".join(f"c.{column} IS NOT NULL" for column in foreign_key.columns)
+    join = " AND ".join(f"p.{ref} = c.{column}" for column, ref in zip(foreign_key.columns, foreign_key.ref_columns))
+    cursor.execute(
+        f"SELECT COUNT(*) FROM {foreign_key.table} c "
+        f"WHERE {not_null} AND NOT EXISTS (SELECT 1 FROM {foreign_key.ref_table} p WHERE {join})"
+    )
+    return cursor.fetchone()[0]
+
+def finalize_db(database: str = "ER_Dataset", schema_path: str | None = None) -> dict:
+    """대량 적재 모드(init_db(bulk_load=True))로 만든 DB에 미뤄 둔 외래 키와 보조 인덱스를 추가
+
+    먼저 외래 키마다 부모가 없는 자식 행을 세어 무결성을 검사하고, 하나라도 있으면 아무것도 추가하지 않는다.
+    검사를 통과하면 foreign_key_checks=0으로 행 단위 재검사 없이(ALGORITHM=INPLACE) 테이블마다
+    ALTER TABLE 문 하나로 제약과 인덱스를 모두 추가한다. 이미 있는 제약/인덱스는 건너뛰므로 다시 실행해도 된다.
+
+    Args:
+        database (str, optional): 대상 데이터베이스 이름. Defaults to "ER_Dataset".
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Returns:
+        dict: 부모 행이 없는 자식 행이 있는 외래 키 이름 → 행 수 (비어 있으면 제약/인덱스 추가 완료)
+    """
+    conn = connect_database(database)
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT CONSTRAINT_NAME FROM information_schema.TABLE_CONSTRAINTS "
+                "WHERE TABLE_SCHEMA = %s AND CONSTRAINT_TYPE = 'FOREIGN KEY'", (database,))
+            existing = {row[0].lower() for row in cursor.fetchall()}
+            cursor.execute("SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s", (database,))
+            existing.update(row[0].lower() for row in cursor.fetchall())
+
+            # 무결성 검사
+            orphans = {}
+            for foreign_key in read_foreign_keys(schema_path):
+                if foreign_key.name.lower() in existing:
+                    continue
+                start = perf_counter()
+                count = find_orphans(cursor, foreign_key)
+                print(f"[CHECK] {foreign_key.name}: {count} orphan rows ({perf_counter() - start:.2f}s)")
+                if count:
+                    orphans[foreign_key.name] = count
+            if orphans:
+                print(f"[FINALIZE ABORTED] {len(orphans)} foreign keys have orphan rows; no constraints were added")
+                return orphans
+
+            # 테이블별로 미뤄 둔 절을 모아 ALTER TABLE 한 번으로 추가
+            clauses = {}
+            for stmt in read_schema_statements(schema_path):
+                if not is_deferred_statement(stmt):
+                    continue
+                index = CREATE_INDEX_PATTERN.match(stmt)
+                if index:
+                    unique, name, table, columns = index.groups()
+                    clause = f"ADD {'UNIQUE ' if unique else ''}INDEX {name} {columns}"
+                else:
+                    table, clause = ALTER_TABLE_PATTERN.match(stmt).groups()
+                    name = re.match(r"ADD\s+(?:CONSTRAINT|INDEX|KEY)\s+(\w+)", clause, re.I).group(1)
+                if name.lower() not in existing:
+                    clauses.setdefault(table, []).append(clause)
+
+            cursor.execute("SET foreign_key_checks = 0")
+            try:
+                for table, table_clauses in clauses.items():
+                    start = perf_counter()
+                    cursor.execute(f"ALTER TABLE {table} {', '.join(table_clauses)}")
+                    print(f"[FINALIZE] {table}: {len(table_clauses)} constraints/indexes added ({perf_counter() - start:.2f}s)")
+            finally:
+                cursor.execute("SET foreign_key_checks = 1")
+        return {}
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
-    check_db_folder()
-    init_db()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="DB 스키마 초기화")
+    parser.add_argument("--bulk-load", action="store_true", help="외래 키와 보조 인덱스 없이 테이블만 생성 (대량 적재 후 --finalize)")
+    parser.add_argument("--finalize", action="store_true", help="무결성 검사 후 미뤄 둔 외래 키와 보조 인덱스를 추가")
+    args = parser.parse_args()
+
+    from storage import get_storage_backend
+
+    backend = get_storage_backend()
+    if args.finalize:
+        backend.finalize_schema()
+    else:
+        check_db_folder()
+        backend.init_schema(bulk_load=args.bulk_load)
\ No newline at end of file
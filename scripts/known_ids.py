@@ -0,0 +1,169 @@
+import os
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from dotenv import load_dotenv
+from db_utils import get_db_connection
+from parquet_sink import get_parquet_sink, use_mysql
+
+load_dotenv()
+
+KNOWN_IDS_PATH = os.getenv("known_ids_path", "./data/known_match_ids.bin")
+# 새로 저장한 ID가 이만큼 쌓이면 정렬 배열에 합침
+KNOWN_IDS_COMPACT_SIZE = 4096
+
+class KnownMatchIds:
+    """이미 저장된 match_id를 정렬된 int64 배열(ID 하나당 8바이트)로 보관하는 인덱스
+
+    조회는 배열에 대한 이진 탐색과 아직 합치지 않은 새 ID 집합 확인이다.
+    파일에는 배열을 그대로 저장하며, 다음 실행에서는 파일을 읽은 뒤 파일의 가장 큰 ID보다 큰 경기만
+    DB에서 가져오므로 match_info 전체를 다시 읽지 않는다. gameId는 시간 순으로 증가한다.
+    """
+    def __init__(self, path: str = KNOWN_IDS_PATH):
+        """
+        Args:
+            path (str, optional): 인덱스 파일 경로. Defaults to KNOWN_IDS_PATH.
+        """
+        self.path = path
+        self._ids = array("q")
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids) + len(self._pending)
+
+    def __contains__(self, match_id: int) -> bool:
+        with self._lock:
+            return self._contains(match_id)
+
+    def _contains(self, match_id: int) -> bool:
+        if match_id in self._pending:
+            return True
+        ids = self._ids
+        i = bisect_left(ids, match_id)
+        return i < len(ids) and ids[i] == match_id
+
+    def max_id(self) -> int | None:
+        with self._lock:
+            candidates = ([self._ids[-1]] if self._ids else []) + ([max(self._pending)] if self._pending else [])
+            return max(candidates) if candidates else None
+
+    def filter_new(self, match_ids) -> list:
+        """인덱스에 없는 match_id만 순서를 유지해 반환"""
+        with self._lock:
+            return [match_id for match_id in match_ids if not self._contains(match_id)]
+
+    def add(self, match_ids) -> None:
+        """저장한 경기의 ID를 추가"""
+        with self._lock:
+            self._pending.update(match_ids)
+            if len(self._pending) >= KNOWN_IDS_COMPACT_SIZE:
+                self._compact()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids = array("q")
+            self._pending.clear()
+
+    def _compact(self) -> None:
+        new_ids = sorted(match_id for match_id in self._pending if not self._contains_sorted(match_id))
+        if new_ids:
+            self._ids = array("q", merge(self._ids, new_ids))
+        self._pending.clear()
+
+    def _contains_sorted(self, match_id: int) -> bool:
+        i = bisect_left(self._ids, match_id)
+        return i < len(self._ids) and self._ids[i] == match_id
+
+    def load(self) -> bool:
+        """인덱스 파일을 읽음. 파일이 없으면 False"""
+        if not os.path.exists(self.path):
+            return False
+        ids = array("q")
+        with open(self.path, "rb") as f:
+            ids.frombytes(f.read())
+        with self._lock:
+            self._ids = ids
+            self._pending.clear()
+        return True
+
+    def save(self) -> None:
+        """인덱스를 파일로 원자적으로 저장"""
+        with self._lock:
+            self._compact()
+            ids = self._ids
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                ids.tofile(f)
+            os.replace(tmp_path, self.path)
+
+    def sync_database(self, conn) -> int:
+        """DB의 match_info와 맞춤. 파일 이후에 저장된 경기만 읽고, DB가 초기화된 경우에는 전체를 다시 읽음
+
+        커지는 match_info 전체를 세지 않도록 행 수는 비교하지 않는다. 경기를 지우는 작업(init_db의 스키마 생성,
+        partitions.drop_version_partition)은 remove_index_file로 인덱스 파일을 지워 다음 실행에서 다시 만들게 하고,
+        여기서는 DB의 가장 큰 match_id가 인덱스보다 작은 경우(다른 방법으로 DB를 비운 경우 등)만 감지한다.
+
+        Args:
+            conn (Any): 데이터베이스 연결 객체
+
+        Returns:
+            int: DB에서 읽은 match_id 수
+        """
+        logger = logging.getLogger(__name__)
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT MAX(match_id) FROM match_info")
+            db_max = cursor.fetchone()[0]
+            known_max = self.max_id()
+            if known_max is not None and (db_max is None or db_max < known_max):
+                # 인덱스에 DB에 없는 경기가 있음 (스키마를 새로 만든 경우 등)
+                logger.warning(f"Known match ID index is ahead of match_info (max {known_max} > {db_max}); rebuilding")
+                self.clear()
+                known_max = None
+            if db_max is None:
+                return 0
+            if known_max is None:
+                cursor.execute("SELECT match_id FROM match_info")
+            else:
+                cursor.execute("SELECT match_id FROM match_info WHERE match_id > %s", (known_max,))
+            rows = cursor.fetchall()
+        self.add(row[0] for row in rows)
+        return len(rows)
+
+def remove_index_file(path: str = KNOWN_IDS_PATH) -> None:
+    """저장된 match_id 인덱스 파일을 삭제 (DB를 새로 만들거나 경기를 지운 뒤 호출). 다음 실행에서 DB로부터 다시 만든다"""
+    if os.path.exists(path):
+        os.remove(path)
+
+def get_known_match_ids() -> KnownMatchIds:
+    """프로세스 전역에서 공유하는 저장된 match_id 인덱스. 처음 호출할 때 파일을 읽고 출력과 맞춤
+
+    DB(STORAGE_BACKEND)에 적재하면 match_info에서 파일 이후에 저장된 경기만 가져오고,
+    Parquet 출력만 사용하면 인덱스 파일이 없을 때만 Parquet match_info에서 만든다.
+    """
+    if not hasattr(get_known_match_ids, "_index"):
+        logger = logging.getLogger(__name__)
+        index = KnownMatchIds()
+        loaded = index.load()
+        if use_mysql():
+            conn = get_db_connection()
+            try:
+                fetched = index.sync_database(conn)
+            finally:
+                conn.close()
+        elif not loaded:
+            match_ids = get_parquet_sink().match_ids()
+            index.add(match_ids)
+            fetched = len(match_ids)
+        else:
+            fetched = 0
+        index.save()
+        logger.info(f"Known match IDs: {len(index)} ({'index file + ' if loaded else ''}{fetched} read from storage)")
+        get_known_match_ids._index = index
+    return get_known_match_ids._index
@@ -0,0 +1,124 @@
+import os
+import mmap
+import struct
+from bisect import bisect_left
+from collections.abc import Mapping
+from urllib.parse import urlparse
+from static_cache import CACHE_PATH
+from parsing import parse_txt_to_dict
+
+# 캐시 디렉토리에서만 쓰는 파일이므로 정수는 현재 시스템의 바이트 순서로 저장
+# 파일 구조: MAGIC | 항목 수(uint32) | 오프셋(uint32 × (2 × 항목 수 + 1)) | 키/값 UTF-8 바이트
+# i번째 항목의 키는 data[offsets[2i]:offsets[2i+1]], 값은 data[offsets[2i+1]:offsets[2i+2]]
+MAGIC = b"L10NIDX1"
+HEADER = struct.Struct("=8sI")
+
+def l10n_index_path(url: str, cache_dir: str = CACHE_PATH) -> str:
+    """l10n 파일 URL에 대응하는 인덱스 경로. 파일 이름에 언어와 l10n 버전이 들어 있어 그대로 사용
+
+    예: .../l10n-Korean-20250417055750.txt → {cache_dir}/l10n/l10n-Korean-20250417055750.idx
+    """
+    name = os.path.splitext(os.path.basename(urlparse(url).path))[0]
+    return os.path.join(cache_dir, "l10n", f"{name}.idx")
+
+def build_l10n_index(txt: str, path: str) -> None:
+    """'키┃값' 형태의 l10n 텍스트를 키 순으로 정렬된 인덱스 파일로 저장
+
+    키가 중복되면 parse_txt_to_dict처럼 마지막 값을 사용한다.
+    임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 쓰다 만 인덱스를 열지 않는다.
+
+    Args:
+        txt (str): l10n 텍스트
+        path (str): 인덱스 파일 경로
+    """
+    entries = {key.encode("utf-8"): value.encode("utf-8") for key, value in parse_txt_to_dict(txt).items()}
+
+    keys = sorted(entries)
+    offsets = [0]
+    for key in keys:
+        offsets.append(offsets[-1] + len(key))
+        offsets.append(offsets[-1] + len(entries[key]))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys)))
+        f.write(struct.pack(f"={len(offsets)}I", *offsets))
+        for key in keys:
+            f.write(key)
+            f.write(entries[key])
+    os.replace(tmp_path, path)
+
+class L10nIndex(Mapping):
+    """읽기 전용으로 memory-map한 l10n 인덱스 (키 → 번역 문자열)
+
+    파일 전체를 mmap하므로 같은 인덱스를 여는 모든 프로세스가 OS 페이지 캐시를 복사 없이 공유하고,
+    조회는 정렬된 키에 대한 이진 탐색이다. 언어/l10n 버전마다 파일이 하나씩이며 실제로 읽는 페이지만 메모리에 올라간다.
+    """
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): build_l10n_index로 만든 인덱스 파일 경로
+
+        Raises:
+            ValueError: 인덱스 파일 형식이 아닐 때 발생
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an l10n index")
+        start = HEADER.size
+        self._data_start = start + 4 * (2 * self._count + 1)
+        self._offsets = memoryview(self._mmap)[start:self._data_start].cast("I")
+
+    def _slice(self, start: int, end: int) -> bytes:
+        return self._mmap[self._data_start + start:self._data_start + end]
+
+    def _key_at(self, i: int) -> bytes:
+        return self._slice(self._offsets[2 * i], self._offsets[2 * i + 1])
+
+    def __getitem__(self, key: str) -> str:
+        encoded = key.encode("utf-8")
+        i = bisect_left(range(self._count), encoded, key=self._key_at)
+        if i == self._count or self._key_at(i) != encoded:
+            raise KeyError(key)
+        return self._slice(self._offsets[2 * i + 1], self._offsets[2 * i + 2]).decode("utf-8")
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._key_at(i).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._mmap.close()
+
+def get_l10n_index(url: str, txt: str | None = None) -> L10nIndex:
+    """l10n URL의 인덱스를 열어 반환. 인덱스가 없으면 txt로 한 번만 만들고, 프로세스 안에서는 재사용
+
+    Args:
+        url (str): l10n 파일 URL (언어와 l10n 버전이 들어 있음)
+        txt (str | None, optional): 인덱스가 없을 때 사용할 l10n 텍스트. Defaults to None.
+
+    Raises:
+        FileNotFoundError: 인덱스가 없고 txt도 주어지지 않았을 때 발생
+
+    Returns:
+        L10nIndex: 키 → 번역 문자열 Mapping
+    """
+    if not hasattr(get_l10n_index, "_indexes"):
+        get_l10n_index._indexes = {}
+    path = l10n_index_path(url)
+    index = get_l10n_index._indexes.get(path)
+    if index is not None:
+        return index
+    if not os.path.exists(path):
+        if txt is None:
+            raise FileNotFoundError(f"l10n index {path} not found and no l10n text to build it from")
+        build_l10n_index(txt, path)
+    index = get_l10n_index._indexes[path] = L10nIndex(path)
+    return index
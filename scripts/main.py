@@ -1,42 +1,78 @@
+import asyncio
+import argparse
 from time import time
 from multiprocessing import cpu_count
 from parsing import top_ranker_id
-from crawler import get_top_ranker
-from utils import setup_logger, split_into_chunks, collect_data
+from crawler import get_top_ranker, create_session, connection_stats_summary
+from utils import setup_logger, split_into_chunks, collect_data, resume_failed, load_static_data
 import os
+import logging
 from dotenv import load_dotenv
 from datetime import datetime
 
 load_dotenv()
 
+async def run(user_chunks, log_dir, start_date, use_watermarks=True):
+    """하나의 API 세션으로 모든 유저 chunk를 순서대로 수집
+
+    Returns:
+        tuple: (성공한 경기 수, 전체 경기 수)
+    """
+    logger = logging.getLogger(__name__)
+    sum_success_count = 0
+    sum_total_count = 0
+    async with create_session() as session:
+        # 정적 데이터는 실행 시작 시 한 번만 처리
+        await load_static_data(session, os.getenv("main_version"))
+        for idx, user_chunk in enumerate(user_chunks):
+            logger.info(f"Processing user batch {idx+1}/{len(user_chunks)} ({len(user_chunk)} users)")
+            success_count, total_count = await collect_data(
+                session,
+                users=user_chunk,
+                main_version=os.getenv("main_version"), # 46
+                batch_size=100,
+                log_dir = log_dir,
+                start_date = start_date,
+                use_watermarks = use_watermarks
+            )
+            logger.info(f"Batch {idx+1} Summary: {success_count}/{total_count} matches processed successfully")
+            sum_success_count += success_count
+            sum_total_count += total_count
+    logger.info(f"HTTP connections: {connection_stats_summary()}")
+    return sum_success_count, sum_total_count
+
+async def run_resume_failed(log_dir, start_date):
+    """이전 실행의 실패 목록에 있는 경기만 다시 수집"""
+    async with create_session() as session:
+        result = await resume_failed(session, batch_size=100, log_dir=log_dir, start_date=start_date)
+    logging.getLogger(__name__).info(f"HTTP connections: {connection_stats_summary()}")
+    return result
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eternal Return match crawler")
+    parser.add_argument("--resume-failed", action="store_true",
+                        help="log_path의 failed_match_ids_*.txt에 있는 경기만 다시 수집")
+    parser.add_argument("--full-crawl", action="store_true",
+                        help="유저별 watermark를 무시하고 패치 버전 시작까지 전체 경기 기록을 탐색")
+    args = parser.parse_args()
+
     # logging
     LOG_DIR = os.getenv("log_path")
     logger = setup_logger(LOG_DIR)
     start_time = time()
     start_dt_str = datetime.fromtimestamp(start_time).strftime("%Y-%m-%d_%H-%M-%S")
-    
-    users = get_top_ranker(season=os.getenv("season_id"), matching_mode=os.getenv("matching_mode"))
-    users, nicknames = top_ranker_id(users)
-    user_chunks = split_into_chunks(users[:2], 100) # 100개씩 분할
-    
-    # 데이터 수집 실행
-    # 각 chunk별로 collect_data 실행
-    sum_success_count = 0
-    sum_total_count = 0
-    for idx, user_chunk in enumerate(user_chunks):
-        logger.info(f"Processing user batch {idx+1}/{len(user_chunks)} ({len(user_chunk)} users)")
-        success_count, total_count = collect_data(
-            users=user_chunk,
-            main_version=os.getenv("main_version"), # 46
-            batch_size=100,
-            log_dir = LOG_DIR,
-            start_date = start_dt_str
-        )
-        logger.info(f"Batch {idx+1} Summary: {success_count}/{total_count} matches processed successfully")
-        sum_success_count += success_count
-        sum_total_count += total_count
-        
+
+    if args.resume_failed:
+        sum_success_count, sum_total_count = asyncio.run(run_resume_failed(LOG_DIR, start_dt_str))
+    else:
+        users = get_top_ranker(season=os.getenv("season_id"), matching_mode=os.getenv("matching_mode"))
+        users, nicknames = top_ranker_id(users)
+        user_chunks = split_into_chunks(users[:2], 100) # 100개씩 분할
+
+        # 데이터 수집 실행
+        # 각 chunk별로 collect_data 실행 (API 세션은 전체 실행에서 공유)
+        sum_success_count, sum_total_count = asyncio.run(run(user_chunks, LOG_DIR, start_dt_str, use_watermarks=not args.full_crawl))
+
     # 처리 결과 요약
     elapsed_time = time() - start_time
     logger.info(f"Total Data collection completed in {elapsed_time:.2f} seconds")
@@ -0,0 +1,301 @@
+"""/v1/games/{match_id} 응답의 userGames 레코드 → 매치 테이블 컬럼 매핑
+
+parsing.compile_match_extractor가 이 명세를 게임 버전(versionMajor)별 추출 함수로 한 번 컴파일하므로,
+패치로 API 필드가 바뀌면 여기서 필드를 추가하거나 since/until로 버전 범위를 나누면 된다.
+msgspec 디코딩을 사용한다면 새로 읽는 API 필드를 decoding.UserGame에도 추가해야 한다.
+
+source 표기:
+    "playTime"              user_json["playTime"] (default가 있으면 user_json.get("playTime", default))
+    "creditSource.KillBat"  user_json.get("creditSource", {})의 "KillBat" 키
+    "collectItemForLog[4]"  user_json["collectItemForLog"]의 4번째 값
+
+transform은 "{}" 자리에 값을 넣는 파이썬 식이며 그대로 추출 함수 소스에 들어간다.
+"""
+from typing import Any, NamedTuple
+
+# default가 없으면 필수 필드 (없으면 KeyError)
+REQUIRED = object()
+
+# 자주 쓰는 transform
+INT = "int({})"
+FLOAT = "float({})"
+PERCENT = "int(100*{})"
+NONE_IF_ZERO = "none_if_zero({})"
+POSITIVE = "1 if {} > 0 else 0"
+
+class Field(NamedTuple):
+    """API 필드 하나를 컬럼 하나로 옮기는 규칙
+
+    Attributes:
+        column (str): 테이블 컬럼 이름
+        source (str): userGames 레코드에서 값을 읽을 위치
+        default (Any): 필드가 없을 때 사용할 값. REQUIRED면 필수 필드
+        transform (str | None): 값에 적용할 식 ("{}"가 값)
+        since (int | None): 이 규칙을 적용하는 첫 versionMajor (포함)
+        until (int | None): 이 규칙을 적용하는 마지막 versionMajor (포함)
+    """
+    column: str
+    source: str
+    default: Any = REQUIRED
+    transform: str | None = None
+    since: int | None = None
+    until: int | None = None
+
+    def applies_to(self, version: int) -> bool:
+        return (self.since is None or version >= self.since) and (self.until is None or version <= self.until)
+
+class Series(NamedTuple):
+    """분 단위 배열처럼 레코드 하나에서 여러 행으로 펼쳐지는 값
+
+    sources 배열의 i번째 값들이 (fields..., i, 값...) 행 하나가 된다.
+    skip_zero면 모든 값이 0인 행은 저장하지 않는다.
+    """
+    index_column: str
+    length: int
+    fields: tuple
+    skip_zero: bool = True
+
+class TableSpec(NamedTuple):
+    """테이블 하나의 추출 규칙
+
+    Attributes:
+        fields (tuple): 컬럼 순서대로 나열한 Field
+        key (str | None): 지정하면 이 source 값마다 첫 번째 레코드로만 행을 만듦 (팀 정보 등)
+        series (Series | None): 지정하면 fields 뒤에 Series 값을 붙여 레코드마다 여러 행을 만듦
+    """
+    fields: tuple
+    key: str | None = None
+    series: Series | None = None
+
+MATCH_ID = Field("match_id", "gameId")
+USER_ID = Field("user_id", "userNum")
+
+# TABLE_COLUMNS의 적재 순서와 같게 유지 (match_info는 경기 단위로 parsing.match_info_row가 생성)
+MATCH_TABLE_SPECS = {
+    "match_team_info": TableSpec(key="teamNumber", fields=(
+        MATCH_ID,
+        Field("team_id", "teamNumber"),
+        Field("team_ranking", "gameRank"),
+        Field("escape_state", "escapeState"),
+        Field("player_down", "teamDown"),
+        Field("team_elimination_count", "teamElimination"),
+        # 44 버전까지는 자동 부활 기준, 45 버전부터는 처치 가능 여부 기준으로 집계됨
+        Field("team_down_in_auto_reserrection", "teamDownInAutoResurrection", 0, until=44),
+        Field("team_down_after_auto_reserrection", "teamDownDeactiveAutoResurrection", 0, until=44),
+        Field("team_repeat_down_in_auto_reserrection", "teamRepeatDownInAutoResurrection", 0, until=44),
+        Field("team_repeat_down_after_auto_reserrection", "teamRepeatDownDeactiveAutoResurrection", 0, until=44),
+        Field("team_down_in_auto_reserrection", "teamDownCanNotEliminate", 0, since=45),
+        Field("team_down_after_auto_reserrection", "teamDownCanEliminate", 0, since=45),
+        Field("team_repeat_down_in_auto_reserrection", "teamRepeatDownCanNotEliminate", 0, since=45),
+        Field("team_repeat_down_after_auto_reserrection", "teamRepeatDownCanEliminate", 0, since=45),
+    )),
+    "match_user_basic": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("team_id", "teamNumber"),
+        Field("except_premade_team", "exceptPreMadeTeam"),
+        Field("character_id", "characterNum"),
+        Field("skin_id", "skinCode"),
+        Field("character_level", "characterLevel"),
+        Field("total_kill", "playerKill"),
+        Field("total_death", "playerDeaths"),
+        Field("total_assist", "playerAssistant"),
+        Field("weapon_type", "bestWeapon"),
+        Field("weapon_level", "bestWeaponLevel"),
+        Field("play_time", "playTime"),
+        Field("watch_time", "watchTime"),
+        Field("total_damage_to_player", "damageToPlayer"),
+        Field("total_damage_from_player", "damageFromPlayer"),
+        Field("total_heal", "healAmount"),
+        Field("heal_to_team", "teamRecover"),
+        Field("use_loop_count", "useHyperLoop"),
+        Field("user_security_console_count", "useSecurityConsole"),
+        Field("route_id", "routeIdOfStart"),
+        Field("start_place", "placeOfStart", transform=INT),
+        Field("emotion_count", "useEmoticonCount"),
+        Field("fishing_count", "fishingCount"),
+        Field("tactical_skill_id", "tacticalSkillGroup"),
+        Field("tactical_skill_level", "tacticalSkillLevel"),
+        Field("tactical_skill_count", "tacticalSkillUseCount"),
+        Field("credit_revival_count", "creditRevivalCount"),
+        Field("credit_revival_other_count", "creditRevivedOthersCount"),
+    )),
+    "match_user_equipment": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("equipment_weapon", "equipment.0", None, NONE_IF_ZERO),
+        Field("equipment_chest", "equipment.1", None, NONE_IF_ZERO),
+        Field("equipment_head", "equipment.2", None, NONE_IF_ZERO),
+        Field("equipment_arm", "equipment.3", None, NONE_IF_ZERO),
+        Field("equipment_leg", "equipment.4", None, NONE_IF_ZERO),
+        # 첫 획득 장비 로그는 리스트이며 마지막 값을 사용
+        Field("first_equipment_weapon", "equipFirstItemForLog.0", [None], NONE_IF_ZERO),
+        Field("first_equipment_chest", "equipFirstItemForLog.1", [None], NONE_IF_ZERO),
+        Field("first_equipment_head", "equipFirstItemForLog.2", [None], NONE_IF_ZERO),
+        Field("first_equipment_arm", "equipFirstItemForLog.3", [None], NONE_IF_ZERO),
+        Field("first_equipment_leg", "equipFirstItemForLog.4", [None], NONE_IF_ZERO),
+    )),
+    "match_user_stat": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("hp", "maxHp"),
+        Field("sp", "maxSp"),
+        Field("hp_regen", "hpRegen"),
+        Field("sp_regen", "spRegen"),
+        Field("defense", "defense"),
+        Field("attack_power", "attackPower"),
+        Field("attack_speed", "attackSpeed"),
+        Field("skill_amp", "skillAmp"),
+        Field("cooldown_percent", "coolDownReduction", transform=INT),
+        Field("adaptive_force", "adaptiveForce"),
+        Field("adaptive_force_attack", "adaptiveForceAttack"),
+        Field("adaptive_force_amp", "adaptiveForceAmplify"),
+        Field("move_speed", "moveSpeed", transform=FLOAT),
+        Field("ooc_move_speed", "outOfCombatMoveSpeed", transform=FLOAT),
+        Field("sight_range", "sightRange", transform=FLOAT),
+        Field("attack_range", "attackRange", transform=FLOAT),
+        Field("critical_percent", "criticalStrikeChance", transform=INT),
+        Field("critical_damage", "criticalStrikeDamage", 0, INT),
+        Field("life_steal_percent", "lifeSteal", transform=PERCENT),
+        Field("normal_life_steel", "normalLifeSteal", transform=PERCENT),
+        Field("skill_life_steel", "skillLifeSteal"),
+    )),
+    "match_user_damage": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("basic_damage_to_player", "damageToPlayer_basic"),
+        Field("skill_damage_to_player", "damageToPlayer_skill"),
+        Field("direct_damage_to_player", "damageToPlayer_direct"),
+        Field("shield_damage_to_player", "damageToPlayer_Shield"),
+        Field("item_damage_to_player", "damageToPlayer_itemSkill"),
+        Field("trap_damage_to_player", "damageToPlayer_trap"),
+        Field("basic_damage_from_player", "damageFromPlayer_basic"),
+        Field("skill_damage_from_player", "damageFromPlayer_skill"),
+        Field("direct_damage_from_player", "damageFromPlayer_direct"),
+        Field("shield_damage_from_player", "damageOffsetedByShield_Player"),
+        Field("item_damage_from_player", "damageFromPlayer_itemSkill"),
+        Field("trap_damage_from_player", "damageFromPlayer_trap"),
+    )),
+    "match_user_trait": TableSpec(fields=(
+        USER_ID,
+        MATCH_ID,
+        Field("core_trait_id", "traitFirstCore"),
+        Field("first_trait_id_one", "traitFirstSub[0]"),
+        Field("first_trait_id_two", "traitFirstSub[1]"),
+        Field("second_trait_id_one", "traitSecondSub[0]"),
+        Field("second_trait_id_two", "traitSecondSub[1]"),
+    )),
+    "match_user_mmr": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("before_mmr", "mmrBefore"),
+        Field("after_mmr", "mmrAfter"),
+        Field("mmr_gain", "mmrGain"),
+        Field("mmr_entry_loss", "mmrLossEntryCost"),
+    )),
+    "user_match_kda_detail": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("kill_phase_one", "killsPhaseOne"),
+        Field("kill_phase_two", "killsPhaseTwo"),
+        Field("kill_phase_three", "killsPhaseThree"),
+        Field("death_phase_one", "deathsPhaseOne"),
+        Field("death_phase_two", "deathsPhaseTwo"),
+        Field("death_phase_three", "deathsPhaseThree"),
+    )),
+    "match_user_sight": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("sight_score", "viewContribution"),
+        Field("camera_setup", "addTelephotoCamera"),
+        Field("camera_remove", "removeTelephotoCamera"),
+        Field("emp_drone_setup", "useEmpDrone"),
+        Field("basic_drone_setup", "useReconDrone"),
+    )),
+    "object": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("damage_to_rumi", "damageToGuideRobot"),
+        Field("damage_to_monster", "damageToMonster"),
+        Field("total_kill_monster", "monsterKill"),
+        Field("kill_alpha", "killMonsters.8", 0),
+        Field("kill_omega", "killMonsters.9", 0),
+        Field("kill_gamma", "killMonsters.10", 0),
+        Field("kill_wickline", "killMonsters.7", 0, POSITIVE),
+        Field("get_cube_red", "getBuffCubeRed"),
+        Field("get_cube_green", "getBuffCubeGreen"),
+        Field("get_cube_gold", "getBuffCubeGold"),
+        Field("get_cube_purple", "getBuffCubePurple"),
+        Field("get_cube_skyblue", "getBuffCubeSkyBlue"),
+        Field("collect_tree_of_life", "collectItemForLog[4]"),
+        Field("collect_meteorite", "collectItemForLog[5]"),
+        Field("get_air_supply_purple", "airSupplyOpenCount[3]"),
+        Field("get_air_supply_red", "airSupplyOpenCount[5]"),
+    )),
+    "match_user_gain_credit": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("total_gain_cr", "totalGainVFCredit"),
+        Field("start_cr", "creditSource.PreliminaryPhase", 0),
+        Field("time_elapse_cr", "creditSource.TimeElapsedCompensationByMiliSecond", 0),
+        Field("time_elapse_bonus_cr", "creditSource.TimeElapsedCreditBonusByMiliSecond", 0, INT),
+        Field("wild_dog_cr", "creditSource.KillWildDog", 0),
+        Field("bat_cr", "creditSource.KillBat", 0),
+        Field("chicken_cr", "creditSource.KillChicken", 0),
+        Field("boar_cr", "creditSource.KillBoar", 0),
+        Field("wolf_cr", "creditSource.KillWolf", 0),
+        Field("bear_cr", "creditSource.KillBear", 0),
+        Field("raven_cr", "creditSource.KillRaven", 0),
+        Field("mutant_wild_dog_cr", "creditSource.KillMutantWildDog", 0),
+        Field("mutant_bat_cr", "creditSource.KillMutantBat", 0),
+        Field("mutant_chicken_cr", "creditSource.KillMutantChicken", 0),
+        Field("mutant_boar_cr", "creditSource.KillMutantBoar", 0),
+        Field("mutant_wolf_cr", "creditSource.KillMutantWolf", 0),
+        Field("mutant_bear_cr", "creditSource.KillMutantBear", 0),
+        Field("mutant_raven_cr", "creditSource.KillMutantRaven", 0),
+        Field("alpha_cr", "creditSource.KillAlpha", 0),
+        Field("omega_cr", "creditSource.KillOmega", 0),
+        Field("gamma_cr", "creditSource.KillGamma", 0),
+        Field("wickline_cr", "creditSource.KillWickline", 0),
+        Field("security_console_cr", "creditSource.GoldSecurityConsoleAccess", 0),
+        Field("drone_cr", "creditSource.KillDrone", 0),
+        Field("kill_cr", "crGetKill"),
+        Field("kill_by_team_cr", "creditSource.KillAssistDivideContribute", 0),
+        Field("rumi_cr", "crGetByGuideRobot"),
+        Field("skill_cr", "creditSource.GetBySkill", 0),
+        Field("cointoss_cr", "creditSource.TraitSkillCoinToss", 0),
+        Field("item_bounty_cr", "creditSource.ItemBountyByItemCode", 0),
+        Field("kill_bounty_cr", "creditSource.ItemBounty", 0),
+        Field("door_console_cr", "creditSource.DoorConsoleAccess", 0),
+    )),
+    "match_user_use_credit": TableSpec(fields=(
+        MATCH_ID,
+        USER_ID,
+        Field("total_used_cr", "totalUseVFCredit"),
+        Field("used_revival_cr", "transferConsoleFromRevivalUseVFCredit"),
+        Field("used_remote_drone_myself_cr", "remoteDroneUseVFCreditMySelf"),
+        Field("used_remote_drone_myteam_cr", "remoteDroneUseVFCreditAlly"),
+        Field("used_tactical_skill_cr", "crUseUpgradeTacticalSkill"),
+        Field("used_tree_of_life_cr", "crUseTreeOfLife"),
+        Field("used_meteorite_cr", "crUseMeteorite"),
+        Field("used_mythril_cr", "crUseMythril"),
+        Field("used_forcecore_cr", "crUseForceCore"),
+        Field("used_blood_sample_cr", "crUseVFBloodSample"),
+        Field("used_escapekit_cr", "crUseRootkit"),
+        # 드론으로 전송한 아이템 코드 수 × 아이템 가격
+        Field("used_emp_drone_cr", "itemTransferredDrone", [], "{}.count(502308) * 30"),
+        Field("used_basic_drone_cr", "itemTransferredDrone", [], "{}.count(502208) * 20"),
+        Field("used_camera_cr", "itemTransferredDrone", [], "{}.count(502207) * 20"),
+        Field("used_guillotine_cr", "itemTransferredDrone", [], "{}.count(502405) * 100"),
+        Field("used_c4_cr", "itemTransferredDrone", [], "{}.count(502404) * 100"),
+        Field("used_fried_chicken_cr", "itemTransferredDrone", [], "{}.count(301316) * 25"),
+        Field("used_rumi_signiture_cr", "creditSource.GuideRobotSignature", 0),
+        Field("used_rumi_fragship_cr", "creditSource.guideRobotFlagShip", 0),
+        Field("used_rumi_radial_cr", "creditSource.GuideRobotRadial", 0),
+    )),
+    # credit이 0이 아닌 분만 저장 (최대 20분)
+    "match_user_credit_time": TableSpec(fields=(MATCH_ID, USER_ID), series=Series("minute", 20, (
+        Field("used_credit", "usedVFCredits"),
+        Field("gain_credit", "totalVFCredits"),
+    ))),
+}
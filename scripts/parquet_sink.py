@@ -0,0 +1,182 @@
+import os
+import threading
+from time import time_ns
+from dotenv import load_dotenv
+from parsing import TABLE_COLUMNS
+from init_db import read_table_columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet 출력을 사용하지 않으면 pyarrow는 필요 없음
+    pa = None
+
+load_dotenv()
+
+# 파싱된 경기를 적재할 곳: mysql(STORAGE_BACKEND의 데이터베이스), parquet, both
+OUTPUT_SINK = os.getenv("OUTPUT_SINK", "mysql").lower()
+PARQUET_PATH = os.getenv("parquet_path", "./data/parquet/")
+# 파일 하나의 row group 크기(행). 분석 쿼리가 한 번에 읽는 단위
+PARQUET_ROW_GROUP_SIZE = int(os.getenv("PARQUET_ROW_GROUP_SIZE", 128 * 1024))
+# 파티션별로 이만큼 행이 모이면 파일 하나로 기록
+PARQUET_FILE_ROWS = int(os.getenv("PARQUET_FILE_ROWS", 256 * 1024))
+
+# 디렉토리(hive 파티션)로 표현하므로 파일에는 저장하지 않는 컬럼
+PARTITION_COLUMNS = ("season_id", "version_major")
+SEASON_INDEX = TABLE_COLUMNS["match_info"].index("season_id")
+VERSION_INDEX = TABLE_COLUMNS["match_info"].index("version_major")
+
+def use_mysql() -> bool:
+    return OUTPUT_SINK in ("mysql", "both")
+
+def use_parquet() -> bool:
+    return OUTPUT_SINK in ("parquet", "both")
+
+def arrow_type(sql_type: str):
+    """schema.sql의 MySQL 타입에 대응하는 Arrow 타입"""
+    return {
+        "TINYINT": pa.int8(),
+        "SMALLINT": pa.int16(),
+        "MEDIUMINT": pa.int32(),
+        "INT": pa.int32(),
+        "BIGINT": pa.int64(),
+        "FLOAT": pa.float32(),
+        "DOUBLE": pa.float64(),
+        "BOOL": pa.bool_(),
+        "BOOLEAN": pa.bool_(),
+        "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+        "DATETIME": pa.timestamp("us"),
+    }.get(sql_type, pa.string())
+
+def is_id_column(column: str) -> bool:
+    """값의 종류가 적고 자주 반복되는 ID 컬럼 (dictionary 인코딩 대상)"""
+    return column.endswith("_id") or column == "weapon_type" or "equipment_" in column
+
+class ParquetSink:
+    """파싱된 경기를 테이블별 Parquet 파일로 저장하는 분석용 출력
+
+    {root}/{table}/season_id={s}/version_major={v}/part-*.parquet 형태의 hive 파티션으로 저장하므로
+    pyarrow.dataset / DuckDB / Spark에서 시즌·버전 조건으로 필요한 파일만 읽을 수 있다.
+    행은 파티션별로 메모리에 모았다가 file_rows만큼 쌓이면 파일 하나로 기록하고,
+    ID 컬럼은 dictionary 인코딩, 파일은 zstd로 압축한다.
+    """
+    def __init__(self, root: str = PARQUET_PATH, row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+                 file_rows: int = PARQUET_FILE_ROWS, compression: str = "zstd"):
+        """
+        Args:
+            root (str, optional): Parquet 출력 디렉토리. Defaults to PARQUET_PATH.
+            row_group_size (int, optional): row group 크기(행). Defaults to PARQUET_ROW_GROUP_SIZE.
+            file_rows (int, optional): 파일 하나에 기록할 행 수. Defaults to PARQUET_FILE_ROWS.
+            compression (str, optional): 압축 방식. Defaults to "zstd".
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for the parquet output sink (pip install pyarrow)")
+        self.root = root
+        self.row_group_size = row_group_size
+        self.file_rows = file_rows
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._buffers = {}
+        self._sequence = 0
+        self.rows_written = 0
+
+        sql_types = read_table_columns()
+        self._schemas = {}
+        for table, columns in TABLE_COLUMNS.items():
+            self._schemas[table] = pa.schema([
+                (column, arrow_type(sql_types.get(table, {}).get(column, "")))
+                for column in columns if not (table == "match_info" and column in PARTITION_COLUMNS)
+            ])
+
+    def add(self, match_rows: dict) -> None:
+        """parse_match_rows의 결과(경기 하나)를 시즌/버전 파티션 버퍼에 추가
+
+        Args:
+            match_rows (dict): 테이블 이름을 key로 하는 행 튜플 리스트
+        """
+        info = match_rows["match_info"][0]
+        season_id, version_major = info[SEASON_INDEX], info[VERSION_INDEX]
+        full = []
+        with self._lock:
+            for table, rows in match_rows.items():
+                if not rows:
+                    continue
+                key = (table, season_id, version_major)
+                buffer = self._buffers.setdefault(key, [])
+                buffer.extend(rows)
+                if len(buffer) >= self.file_rows:
+                    full.append((key, self._buffers.pop(key)))
+        for key, rows in full:
+            self._write(key, rows)
+
+    def flush(self) -> None:
+        """버퍼에 남은 행을 모두 파일로 기록"""
+        with self._lock:
+            buffers, self._buffers = self._buffers, {}
+        for key, rows in buffers.items():
+            self._write(key, rows)
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write(self, key: tuple, rows: list) -> None:
+        table, season_id, version_major = key
+        schema = self._schemas[table]
+        columns = list(zip(*rows))
+        if table == "match_info":
+            columns = [values for column, values in zip(TABLE_COLUMNS[table], columns) if column not in PARTITION_COLUMNS]
+        arrays = []
+        for field, values in zip(schema, columns):
+            try:
+                arrays.append(pa.array(values, type=field.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # 정수 컬럼에 실수가 들어온 경우 MySQL처럼 소수점을 버림 (범위 초과는 여전히 오류)
+                arrays.append(pc.cast(pa.array(values), options=pc.CastOptions(field.type, allow_float_truncate=True)))
+        data = pa.Table.from_arrays(arrays, schema=schema)
+
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        directory = os.path.join(self.root, table, f"season_id={season_id}", f"version_major={version_major}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{time_ns()}-{os.getpid()}-{sequence:05d}.parquet")
+        # 다 쓴 파일만 보이도록 임시 이름으로 쓴 뒤 교체
+        tmp_path = f"{path}.tmp"
+        pq.write_table(
+            data, tmp_path,
+            row_group_size=self.row_group_size,
+            compression=self.compression,
+            use_dictionary=[name for name in schema.names if is_id_column(name)],
+        )
+        os.replace(tmp_path, path)
+        self.rows_written += len(rows)
+
+    def write_static(self, table: str, data_list: list) -> None:
+        """정적 테이블(캐릭터, 장비, 특성)을 {root}/{table}/{table}.parquet 하나로 저장 (덮어씀)"""
+        if not data_list:
+            return
+        directory = os.path.join(self.root, table)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{table}.parquet")
+        pq.write_table(pa.Table.from_pylist(data_list), f"{path}.tmp", compression=self.compression)
+        os.replace(f"{path}.tmp", path)
+
+    def match_ids(self) -> set:
+        """이미 Parquet으로 저장된 경기 ID (match_info 파일의 match_id 컬럼만 읽음)"""
+        directory = os.path.join(self.root, "match_info")
+        match_ids = set()
+        if not os.path.isdir(directory):
+            return match_ids
+        for dirpath, _, filenames in os.walk(directory):
+            for filename in filenames:
+                if filename.endswith(".parquet"):
+                    column = pq.read_table(os.path.join(dirpath, filename), columns=["match_id"]).column("match_id")
+                    match_ids.update(column.to_pylist())
+        return match_ids
+
+def get_parquet_sink() -> ParquetSink | None:
+    """프로세스 전역에서 공유하는 Parquet 출력을 반환. OUTPUT_SINK에 parquet이 없으면 None"""
+    if not hasattr(get_parquet_sink, "_sink"):
+        get_parquet_sink._sink = ParquetSink() if use_parquet() else None
+    return get_parquet_sink._sink
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Mapping
+from match_spec import MATCH_TABLE_SPECS, REQUIRED
 
 def top_ranker_id(data: dict) -> dict:
     """topRanks 데이터에서 상위 랭커의 userNum과 nickname 리스트를 추출합
@@ -17,568 +18,342 @@ def top_ranker_id(data: dict) -> dict:
         top_1000_user_nicknames.append(data['topRanks'][i]['nickname'])
     return top_1000_user_ids, top_1000_user_nicknames
 
-def parse_match_info(data: dict) -> dict:
-    """매치 데이터에서 주요 정보를 파싱하여 match_info 딕셔너리로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Raises:
-        ValueError: 'userGames' 데이터가 없거나 비어 있을 때 발생
-
-    Returns:
-        dict: 매치 정보가 담긴 딕셔너리 (match_id, start_dtm, match_mode 등 포함)
-    """
-    if not data.get("userGames") or len(data["userGames"]) == 0:
-        raise ValueError("No user games data found in the input")
-    
-    # 첫 번째 user data를 사용
-    user_json = data["userGames"][0]
-    start_dtm = datetime.strptime(user_json["startDtm"], "%Y-%m-%dT%H:%M:%S.%f%z")
-    play_time = min(data["userGames"], key=lambda u: u["gameRank"])["playTime"]
-                        
-    match_expire_dtm = start_dtm + timedelta(seconds=play_time)
-    match_info = {
-        "match_id": user_json["gameId"],
-        "start_dtm": start_dtm,
-        "match_mode": user_json["matchingTeamMode"],
-        "season_id": user_json["seasonId"],
-        "version_major": user_json["versionMajor"],
-        "version_minor": user_json["versionMinor"],
-        "weather_main": user_json["mainWeather"],
-        "weather_sub": user_json["subWeather"],
-        "match_size": len(data["userGames"]),
-        "match_avg_mmr": user_json["mmrAvg"],
-        "match_expire_dtm": match_expire_dtm
-    }
-    
-    return match_info
-
-def parse_match_team_info(data: dict) -> List[dict]:
-    """매치 데이터에서 팀별 주요 정보를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 팀의 주요 정보를 담은 딕셔너리의 리스트
-    """
-    team_info_list = []
-    processed_team_ids = set()
-    
-    for user_json in data.get("userGames", []):
-        team_id = user_json["teamNumber"]
-        
-        # Team id가 이미 있을 경우 skip
-        if team_id in processed_team_ids:
-            continue
-        
-        match_id = user_json["gameId"]
-        
-        is_older_version = user_json["versionMajor"] <= 44
-        
-        team_info = {
-            "match_id": match_id,
-            "team_id": team_id,
-            "team_ranking": user_json["gameRank"],
-            "escape_state": user_json["escapeState"],
-            "player_down": user_json["teamDown"],
-            "team_elimination_count": user_json["teamElimination"]
-        }
-        
-        if is_older_version:
-            team_info.update({
-                "team_down_in_auto_reserrection": user_json.get("teamDownInAutoResurrection", 0),
-                "team_down_after_auto_reserrection": user_json.get("teamDownDeactiveAutoResurrection", 0),
-                "team_repeat_down_in_auto_reserrection": user_json.get("teamRepeatDownInAutoResurrection", 0),
-                "team_repeat_down_after_auto_reserrection": user_json.get("teamRepeatDownDeactiveAutoResurrection", 0)
-            })
-        else:
-            team_info.update({
-                "team_down_in_auto_reserrection": user_json.get("teamDownCanNotEliminate", 0),
-                "team_down_after_auto_reserrection": user_json.get("teamDownCanEliminate", 0),
-                "team_repeat_down_in_auto_reserrection": user_json.get("teamRepeatDownCanNotEliminate", 0),
-                "team_repeat_down_after_auto_reserrection": user_json.get("teamRepeatDownCanEliminate", 0)
-            })
-        
-        team_info_list.append(team_info)
-        processed_team_ids.add(team_id)
-    
-    return team_info_list
-
-def parse_match_user_basic(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 기본 정보를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 기본 정보를 담은 딕셔너리의 리스트
-    """
-    user_basic_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_basic = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "team_id": user_json["teamNumber"],
-            "except_premade_team": user_json["exceptPreMadeTeam"],
-            "character_id": user_json["characterNum"],
-            "skin_id": user_json["skinCode"],
-            "character_level": user_json["characterLevel"],
-            "total_kill": user_json["playerKill"],
-            "total_death": user_json["playerDeaths"],
-            "total_assist": user_json["playerAssistant"],
-            "weapon_type": user_json["bestWeapon"],
-            "weapon_level": user_json["bestWeaponLevel"],
-            "play_time": user_json["playTime"],
-            "watch_time": user_json["watchTime"],
-            "total_damage_to_player": user_json["damageToPlayer"],
-            "total_damage_from_player": user_json["damageFromPlayer"],
-            "total_heal": user_json["healAmount"],
-            "heal_to_team": user_json["teamRecover"],
-            "use_loop_count": user_json["useHyperLoop"],
-            "user_security_console_count": user_json["useSecurityConsole"],
-            "route_id": user_json["routeIdOfStart"],
-            "start_place": int(user_json["placeOfStart"]),
-            "emotion_count": user_json["useEmoticonCount"],
-            "fishing_count": user_json["fishingCount"],
-            "tactical_skill_id": user_json["tacticalSkillGroup"],
-            "tactical_skill_level": user_json["tacticalSkillLevel"],
-            "tactical_skill_count": user_json["tacticalSkillUseCount"],
-            "credit_revival_count": user_json["creditRevivalCount"],
-            "credit_revival_other_count": user_json["creditRevivedOthersCount"],
-        }
-        
-        user_basic_list.append(user_basic)
-    
-    return user_basic_list
-    
-def parse_match_user_equipment(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 장비 및 첫 획득 장비 정보를 파싱하여 딕셔너리 리스트로 반환합니다.
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 장비 정보를 담은 딕셔너리의 리스트
+def _none_if_zero(val):
+    # 리스트일 경우 마지막 값을 사용
+    if isinstance(val, list):
+        if not val:
+            return None
+        val = val[-1]
+    # 0 또는 "0"이면 None, 아니면 원래 값
+    return None if val == 0 or val == "0" else val
+
+TABLE_COLUMNS = {
+    "match_info": (
+        "match_id", "start_dtm", "match_mode", "season_id", "version_major", "version_minor", "weather_main",
+        "weather_sub", "match_size", "match_avg_mmr", "match_expire_dtm",
+    ),
+    "match_team_info": (
+        "match_id", "team_id", "team_ranking", "escape_state", "player_down", "team_elimination_count",
+        "team_down_in_auto_reserrection", "team_down_after_auto_reserrection",
+        "team_repeat_down_in_auto_reserrection", "team_repeat_down_after_auto_reserrection",
+    ),
+    "match_user_basic": (
+        "match_id", "user_id", "team_id", "except_premade_team", "character_id", "skin_id", "character_level",
+        "total_kill", "total_death", "total_assist", "weapon_type", "weapon_level", "play_time", "watch_time",
+        "total_damage_to_player", "total_damage_from_player", "total_heal", "heal_to_team", "use_loop_count",
+        "user_security_console_count", "route_id", "start_place", "emotion_count", "fishing_count",
+        "tactical_skill_id", "tactical_skill_level", "tactical_skill_count", "credit_revival_count",
+        "credit_revival_other_count",
+    ),
+    "match_user_equipment": (
+        "match_id", "user_id", "equipment_weapon", "equipment_chest", "equipment_head", "equipment_arm",
+        "equipment_leg", "first_equipment_weapon", "first_equipment_chest", "first_equipment_head",
+        "first_equipment_arm", "first_equipment_leg",
+    ),
+    "match_user_stat": (
+        "match_id", "user_id", "hp", "sp", "hp_regen", "sp_regen", "defense", "attack_power", "attack_speed",
+        "skill_amp", "cooldown_percent", "adaptive_force", "adaptive_force_attack", "adaptive_force_amp",
+        "move_speed", "ooc_move_speed", "sight_range", "attack_range", "critical_percent", "critical_damage",
+        "life_steal_percent", "normal_life_steel", "skill_life_steel",
+    ),
+    "match_user_damage": (
+        "match_id", "user_id", "basic_damage_to_player", "skill_damage_to_player", "direct_damage_to_player",
+        "shield_damage_to_player", "item_damage_to_player", "trap_damage_to_player",
+        "basic_damage_from_player", "skill_damage_from_player", "direct_damage_from_player",
+        "shield_damage_from_player", "item_damage_from_player", "trap_damage_from_player",
+    ),
+    "match_user_trait": (
+        "user_id", "match_id", "core_trait_id", "first_trait_id_one", "first_trait_id_two",
+        "second_trait_id_one", "second_trait_id_two",
+    ),
+    "match_user_mmr": (
+        "match_id", "user_id", "before_mmr", "after_mmr", "mmr_gain", "mmr_entry_loss",
+    ),
+    "user_match_kda_detail": (
+        "match_id", "user_id", "kill_phase_one", "kill_phase_two", "kill_phase_three", "death_phase_one",
+        "death_phase_two", "death_phase_three",
+    ),
+    "match_user_sight": (
+        "match_id", "user_id", "sight_score", "camera_setup", "camera_remove", "emp_drone_setup",
+        "basic_drone_setup",
+    ),
+    "object": (
+        "match_id", "user_id", "damage_to_rumi", "damage_to_monster", "total_kill_monster", "kill_alpha",
+        "kill_omega", "kill_gamma", "kill_wickline", "get_cube_red", "get_cube_green", "get_cube_gold",
+        "get_cube_purple", "get_cube_skyblue", "collect_tree_of_life", "collect_meteorite",
+        "get_air_supply_purple", "get_air_supply_red",
+    ),
+    "match_user_gain_credit": (
+        "match_id", "user_id", "total_gain_cr", "start_cr", "time_elapse_cr", "time_elapse_bonus_cr",
+        "wild_dog_cr", "bat_cr", "chicken_cr", "boar_cr", "wolf_cr", "bear_cr", "raven_cr",
+        "mutant_wild_dog_cr", "mutant_bat_cr", "mutant_chicken_cr", "mutant_boar_cr", "mutant_wolf_cr",
+        "mutant_bear_cr", "mutant_raven_cr", "alpha_cr", "omega_cr", "gamma_cr", "wickline_cr",
+        "security_console_cr", "drone_cr", "kill_cr", "kill_by_team_cr", "rumi_cr", "skill_cr", "cointoss_cr",
+        "item_bounty_cr", "kill_bounty_cr", "door_console_cr",
+    ),
+    "match_user_use_credit": (
+        "match_id", "user_id", "total_used_cr", "used_revival_cr", "used_remote_drone_myself_cr",
+        "used_remote_drone_myteam_cr", "used_tactical_skill_cr", "used_tree_of_life_cr", "used_meteorite_cr",
+        "used_mythril_cr", "used_forcecore_cr", "used_blood_sample_cr", "used_escapekit_cr",
+        "used_emp_drone_cr", "used_basic_drone_cr", "used_camera_cr", "used_guillotine_cr", "used_c4_cr",
+        "used_fried_chicken_cr", "used_rumi_signiture_cr", "used_rumi_fragship_cr", "used_rumi_radial_cr",
+    ),
+    "match_user_credit_time": (
+        "match_id", "user_id", "minute", "used_credit", "gain_credit",
+    ),
+}
+
+class RowBatch:
+    """한 테이블의 행을 컬럼 순서가 고정된 튜플로 모아두는 배치
+
+    행마다 딕셔너리를 만들지 않으므로 키 문자열을 반복 저장하거나 찾을 필요가 없고,
+    db_utils.insert_batch에 그대로 넘길 수 있다.
     """
-    def none_if_zero(val):
-        # 리스트일 경우 마지막 값을 사용
-        if isinstance(val, list):
-            if not val:
-                return None
-            val = val[-1]
-        # 0 또는 "0"이면 None, 아니면 원래 값
-        return None if val == 0 or val == "0" else val
-
-    user_equipment_list = []
-    
-    for user_json in data.get("userGames", []):
-        equipment_data = user_json.get("equipment", {})
-        equip_first_log = user_json.get("equipFirstItemForLog", {})
-
-        equipment = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "equipment_weapon": none_if_zero(equipment_data.get("0")),
-            "equipment_chest": none_if_zero(equipment_data.get("1")),
-            "equipment_head": none_if_zero(equipment_data.get("2")),
-            "equipment_arm": none_if_zero(equipment_data.get("3")),
-            "equipment_leg": none_if_zero(equipment_data.get("4")),
-            "first_equipment_weapon": none_if_zero(equip_first_log.get("0", [None])),
-            "first_equipment_chest": none_if_zero(equip_first_log.get("1", [None])),
-            "first_equipment_head": none_if_zero(equip_first_log.get("2", [None])),
-            "first_equipment_arm": none_if_zero(equip_first_log.get("3", [None])),
-            "first_equipment_leg": none_if_zero(equip_first_log.get("4", [None]))
+    __slots__ = ("table", "columns", "rows")
+
+    def __init__(self, table: str, columns: tuple | None = None, rows: list | None = None):
+        """
+        Args:
+            table (str): 테이블 이름
+            columns (tuple | None, optional): 컬럼 순서. Defaults to TABLE_COLUMNS[table].
+            rows (list | None, optional): 컬럼 순서대로 값을 담은 튜플 리스트. Defaults to None.
+        """
+        self.table = table
+        self.columns = columns if columns is not None else TABLE_COLUMNS[table]
+        self.rows = rows if rows is not None else []
+
+    @classmethod
+    def from_dicts(cls, table: str, data_list: List[dict]) -> "RowBatch":
+        """딕셔너리 리스트를 첫 번째 딕셔너리의 키 순서로 배치로 변환"""
+        columns = tuple(data_list[0]) if data_list else TABLE_COLUMNS.get(table, ())
+        return cls(table, columns, [tuple(data.get(key) for key in columns) for data in data_list])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def extend(self, rows: List[tuple]) -> None:
+        self.rows.extend(rows)
+
+    def to_dicts(self) -> List[dict]:
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.rows]
+
+class MatchBatch:
+    """여러 경기의 파싱 결과를 테이블별 RowBatch로 모음"""
+    def __init__(self, extra_columns: Dict[str, tuple] | None = None):
+        """
+        Args:
+            extra_columns (Dict[str, tuple] | None, optional): 테이블별로 행 끝에 덧붙일 match_info 컬럼.
+                파티션 스키마처럼 모든 매치 테이블에 version_major가 있을 때 경기의 match_info 값으로 채운다. Defaults to None.
+        """
+        self.match_ids = []
+        extra_columns = extra_columns or {}
+        self.tables = {table: RowBatch(table, columns + extra_columns.get(table, ())) for table, columns in TABLE_COLUMNS.items()}
+        self._extra_indexes = {
+            table: tuple(TABLE_COLUMNS["match_info"].index(column) for column in columns)
+            for table, columns in extra_columns.items() if columns
         }
-        
-        user_equipment_list.append(equipment)
-    
-    return user_equipment_list
 
-def parse_match_user_stat(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 스탯을 파싱하여 딕셔너리 리스트로 반환
+    def __len__(self) -> int:
+        return len(self.match_ids)
 
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+    def add(self, match_id: int, match_rows: Dict[str, List[tuple]]) -> None:
+        """parse_match_rows의 결과를 배치에 추가
 
-    Returns:
-        List[dict]: 각 유저의 스탯 정보를 담은 딕셔너리의 리스트
-    """
-    user_stat_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_stat = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "hp": user_json["maxHp"],
-            "sp": user_json["maxSp"],
-            "hp_regen": user_json["hpRegen"],
-            "sp_regen": user_json["spRegen"],
-            "defense": user_json["defense"],
-            "attack_power": user_json["attackPower"],
-            "attack_speed": user_json["attackSpeed"],
-            "skill_amp": user_json["skillAmp"],
-            "cooldown_percent": int(user_json["coolDownReduction"]),
-            "adaptive_force": user_json["adaptiveForce"],
-            "adaptive_force_attack": user_json["adaptiveForceAttack"],
-            "adaptive_force_amp": user_json["adaptiveForceAmplify"],
-            "move_speed": float(user_json["moveSpeed"]),
-            "ooc_move_speed": float(user_json["outOfCombatMoveSpeed"]),
-            "sight_range": float(user_json["sightRange"]),
-            "attack_range": float(user_json["attackRange"]),
-            "critical_percent": int(user_json["criticalStrikeChance"]),
-            "critical_damage": int(user_json.get("criticalStrikeDamage", 0)),
-            "life_steal_percent": int(100*user_json["lifeSteal"]),
-            "normal_life_steel": int(100*user_json["normalLifeSteal"]),
-            "skill_life_steel": user_json["skillLifeSteal"]
-        }
-        
-        user_stat_list.append(user_stat)
-    
-    return user_stat_list
+        Args:
+            match_id (int): 경기 고유 ID
+            match_rows (Dict[str, List[tuple]]): 테이블 이름을 key로 하는 행 튜플 리스트
+        """
+        self.match_ids.append(match_id)
+        tables = self.tables
+        extra_indexes = self._extra_indexes
+        if extra_indexes:
+            match_info = match_rows["match_info"][0]
+        for table, rows in match_rows.items():
+            if table in extra_indexes:
+                extra = tuple(match_info[i] for i in extra_indexes[table])
+                rows = [row + extra for row in rows]
+            tables[table].extend(rows)
 
-def parse_match_user_damage(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 가한 피해량, 받은 피해량을 파싱하여 딕셔너리 리스트로 반환
+    def batches(self) -> List[RowBatch]:
+        """행이 있는 RowBatch를 적재 순서(TABLE_COLUMNS 순)대로 반환"""
+        return [batch for batch in self.tables.values() if batch.rows]
 
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 가한 피해량, 받은 피해량 정보를 담은 딕셔너리의 리스트
-    """
-    user_damage_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_damage = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "basic_damage_to_player": user_json["damageToPlayer_basic"],
-            "skill_damage_to_player": user_json["damageToPlayer_skill"],
-            "direct_damage_to_player": user_json["damageToPlayer_direct"],
-            "shield_damage_to_player": user_json["damageToPlayer_Shield"],
-            "item_damage_to_player": user_json["damageToPlayer_itemSkill"],
-            "trap_damage_to_player": user_json["damageToPlayer_trap"],
-            "basic_damage_from_player": user_json["damageFromPlayer_basic"],
-            "skill_damage_from_player": user_json["damageFromPlayer_skill"],
-            "direct_damage_from_player": user_json["damageFromPlayer_direct"],
-            "shield_damage_from_player": user_json["damageOffsetedByShield_Player"],
-            "item_damage_from_player": user_json["damageFromPlayer_itemSkill"],
-            "trap_damage_from_player": user_json["damageFromPlayer_trap"]
-        }
-        
-        user_damage_list.append(user_damage)
-    
-    return user_damage_list
-
-def parse_match_user_trait(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저가 선택한 특성을 파싱하여 틱셔너리 리스트로 반환
+MATCH_VERSION_INDEX = TABLE_COLUMNS["match_info"].index("version_major")
 
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저가 선택한 특성 ID를 담은 딕셔너리 리스트
-    """
-    user_trait_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_trait = {
-            "user_id": user_json["userNum"],
-            "match_id": user_json["gameId"],
-            "core_trait_id": user_json["traitFirstCore"],
-            "first_trait_id_one": user_json["traitFirstSub"][0],
-            "first_trait_id_two": user_json["traitFirstSub"][1],
-            "second_trait_id_one": user_json["traitSecondSub"][0],
-            "second_trait_id_two": user_json["traitSecondSub"][1]
-        }
-        
-        user_trait_list.append(user_trait)
-    
-    return user_trait_list
+def match_info_row(data: dict) -> tuple:
+    """경기 단위 정보를 TABLE_COLUMNS["match_info"] 순서의 튜플로 반환
 
-def parse_match_user_mmr(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 MMR 정보를 파싱하여 딕셔너리 리스트로 반환
+    시작 시각과 버전 등은 첫 번째 유저 레코드에서, 경기 시간은 1위 유저의 playTime에서 가져온다.
 
     Args:
         data (dict): 'userGames' 키를 포함한 매치 원본 데이터
 
-    Returns:
-        List[dict]: 각 유저의 MMR 정보를 담은 딕셔너리의 리스트
-    """
-    user_mmr_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_mmr = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "before_mmr": user_json["mmrBefore"],
-            "after_mmr": user_json["mmrAfter"],
-            "mmr_gain": user_json["mmrGain"],
-            "mmr_entry_loss": user_json["mmrLossEntryCost"]
-        }
-        
-        user_mmr_list.append(user_mmr)
-    
-    return user_mmr_list
-
-def parse_user_match_kda_detail(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 KDA 정보를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 KDA를 담은 딕셔너리의 리스트
-    """
-    user_kda_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_kda = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "kill_phase_one": user_json["killsPhaseOne"],
-            "kill_phase_two": user_json["killsPhaseTwo"],
-            "kill_phase_three": user_json["killsPhaseThree"],
-            "death_phase_one": user_json["deathsPhaseOne"],
-            "death_phase_two": user_json["deathsPhaseTwo"],
-            "death_phase_three": user_json["deathsPhaseThree"]
-        }
-        
-        user_kda_list.append(user_kda)
-    
-    return user_kda_list
-
-def parse_match_user_sight(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 시야 관련 정보를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 시야 관련 행동 정보를 담은 딕셔너리의 리스트
-    """
-    user_sight_list = []
-    
-    for user_json in data.get("userGames", []):
-        user_sight = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "sight_score": user_json["viewContribution"],
-            "camera_setup": user_json["addTelephotoCamera"],
-            "camera_remove": user_json["removeTelephotoCamera"],
-            "emp_drone_setup": user_json["useEmpDrone"],
-            "basic_drone_setup": user_json["useReconDrone"]
-        }
-        
-        user_sight_list.append(user_sight)
-    
-    return user_sight_list
-
-def parse_object(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 몬스터 및 큐브 정보를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 몬스터 및 큐브 정보를 담은 딕셔너리의 리스트
-    """
-    object_list = []
-    
-    for user_json in data.get("userGames", []):
-        kill_monsters = user_json.get("killMonsters", {})
-        
-        object_data = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "damage_to_rumi": user_json["damageToGuideRobot"],
-            "damage_to_monster": user_json["damageToMonster"],
-            "total_kill_monster": user_json["monsterKill"],
-            "kill_alpha": kill_monsters.get("8", 0),
-            "kill_omega": kill_monsters.get("9", 0),
-            "kill_gamma": kill_monsters.get("10", 0),
-            "kill_wickline": 1 if kill_monsters.get("7", 0) > 0 else 0,
-            "get_cube_red": user_json["getBuffCubeRed"],
-            "get_cube_green": user_json["getBuffCubeGreen"],
-            "get_cube_gold": user_json["getBuffCubeGold"],
-            "get_cube_purple": user_json["getBuffCubePurple"],
-            "get_cube_skyblue": user_json["getBuffCubeSkyBlue"],
-            "collect_tree_of_life": user_json["collectItemForLog"][4],
-            "collect_meteorite": user_json["collectItemForLog"][5],
-            "get_air_supply_purple": user_json["airSupplyOpenCount"][3],
-            "get_air_supply_red": user_json["airSupplyOpenCount"][5]
-        }
-        
-        object_list.append(object_data)
-    
-    return object_list
-
-def parse_match_user_gain_credit(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 크레딧 획득 경로를 파싱하여 딕셔너리 리스트로 반환
-
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+    Raises:
+        ValueError: 'userGames' 데이터가 없거나 비어 있을 때 발생
 
     Returns:
-        List[dict]: 각 유저의 크레딧 획득 경로를 담은 딕셔너리의 리스트
+        tuple: (match_id, start_dtm, match_mode, season_id, version_major, version_minor, weather_main,
+            weather_sub, match_size, match_avg_mmr, match_expire_dtm)
     """
-    user_gain_credit_list = []
-    
-    for user_json in data.get("userGames", []):
-        credit_source = user_json.get("creditSource", {})
-        
-        gain_credit = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "total_gain_cr": user_json["totalGainVFCredit"],
-            "start_cr": credit_source.get("PreliminaryPhase", 0),
-            "time_elapse_cr": credit_source.get("TimeElapsedCompensationByMiliSecond", 0),
-            "time_elapse_bonus_cr": int(credit_source.get("TimeElapsedCreditBonusByMiliSecond",0)),
-            "wild_dog_cr": credit_source.get("KillWildDog", 0),
-            "bat_cr": credit_source.get("KillBat", 0),
-            "chicken_cr": credit_source.get("KillChicken", 0),
-            "boar_cr": credit_source.get("KillBoar", 0),
-            "wolf_cr": credit_source.get("KillWolf", 0),
-            "bear_cr": credit_source.get("KillBear", 0),
-            "raven_cr": credit_source.get("KillRaven", 0),
-            "mutant_wild_dog_cr": credit_source.get("KillMutantWildDog", 0),
-            "mutant_bat_cr": credit_source.get("KillMutantBat", 0),
-            "mutant_chicken_cr": credit_source.get("KillMutantChicken", 0),
-            "mutant_boar_cr": credit_source.get("KillMutantBoar", 0),
-            "mutant_wolf_cr": credit_source.get("KillMutantWolf", 0),
-            "mutant_bear_cr": credit_source.get("KillMutantBear", 0),
-            "mutant_raven_cr": credit_source.get("KillMutantRaven", 0),
-            "alpha_cr": credit_source.get("KillAlpha",0),
-            "omega_cr": credit_source.get("KillOmega",0),
-            "gamma_cr": credit_source.get("KillGamma", 0),
-            "wickline_cr": credit_source.get("KillWickline", 0),
-            "security_console_cr": credit_source.get("GoldSecurityConsoleAccess",0),
-            "drone_cr": credit_source.get("KillDrone", 0),
-            "kill_cr": user_json["crGetKill"],
-            "kill_by_team_cr": credit_source.get("KillAssistDivideContribute",0),
-            "rumi_cr": user_json["crGetByGuideRobot"],
-            "skill_cr": credit_source.get("GetBySkill", 0),
-            "cointoss_cr": credit_source.get("TraitSkillCoinToss", 0),
-            "item_bounty_cr": credit_source.get("ItemBountyByItemCode", 0),
-            "kill_bounty_cr": credit_source.get("ItemBounty", 0),
-            "door_console_cr": credit_source.get("DoorConsoleAccess",0)
-        }
-        
-        user_gain_credit_list.append(gain_credit)
-    
-    return user_gain_credit_list
-
-def parse_match_user_use_credit(data: dict) -> List[dict]:
-    """매치 데이터에서 각 유저의 크레딧 사용 정보를 파싱하여 딕셔너리 리스트로 반환
+    user_games = data.get("userGames")
+    if not user_games:
+        raise ValueError("No user games data found in the input")
+    user_json = user_games[0]
+    start_dtm = datetime.strptime(user_json["startDtm"], "%Y-%m-%dT%H:%M:%S.%f%z")
+    play_time = min(user_games, key=lambda u: u["gameRank"])["playTime"]
+    return (
+        user_json["gameId"],
+        start_dtm,
+        user_json["matchingTeamMode"],
+        user_json["seasonId"],
+        user_json["versionMajor"],
+        user_json["versionMinor"],
+        user_json["mainWeather"],
+        user_json["subWeather"],
+        len(user_games),
+        user_json["mmrAvg"],
+        start_dtm + timedelta(seconds=play_time),
+    )
+
+def _source_expr(source: str, default) -> tuple:
+    """match_spec의 source 표기를 (컨테이너 식 | None, 값 식)으로 변환. 컨테이너 식의 자리는 "{}" """
+    if "." in source:
+        container, key = source.split(".", 1)
+        if default is REQUIRED:
+            return f"u.get({container!r}, {{}})", f"{{}}[{key!r}]"
+        return f"u.get({container!r}, {{}})", f"{{}}.get({key!r}, {default!r})"
+    if source.endswith("]"):
+        name, index = source[:-1].split("[", 1)
+        return f"u[{name!r}]", f"{{}}[{int(index)}]"
+    if default is REQUIRED:
+        return None, f"u[{source!r}]"
+    return None, f"u.get({source!r}, {default!r})"
+
+def compile_match_extractor(version: int, specs: dict = MATCH_TABLE_SPECS):
+    """match_spec의 매핑을 해당 게임 버전 전용 추출 함수로 컴파일
+
+    버전 범위에 맞는 Field만 골라 userGames를 한 번 순회하는 함수의 소스를 만들고 exec로 컴파일한다.
+    여러 번 쓰이는 필드와 하위 딕셔너리/리스트는 레코드마다 한 번만 읽어 지역 변수에 두고,
+    행은 TABLE_COLUMNS 순서의 튜플로 바로 만든다. 생성된 소스는 함수의 source 속성에 남는다.
 
     Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
-
-    Returns:
-        List[dict]: 각 유저의 크레딧 사용 정보를 담은 딕셔너리의 리스트
-    """
-    user_use_credit_list = []
-    
-    for user_json in data.get("userGames", []):
-        credit_source = user_json.get("creditSource", {})
-        item_transferred = user_json.get("itemTransferredDrone", [])
-        
-        use_credit = {
-            "match_id": user_json["gameId"],
-            "user_id": user_json["userNum"],
-            "total_used_cr": user_json["totalUseVFCredit"],
-            "used_revival_cr": user_json["transferConsoleFromRevivalUseVFCredit"],
-            "used_remote_drone_myself_cr": user_json["remoteDroneUseVFCreditMySelf"],
-            "used_remote_drone_myteam_cr": user_json["remoteDroneUseVFCreditAlly"],
-            "used_tactical_skill_cr": user_json["crUseUpgradeTacticalSkill"],
-            "used_tree_of_life_cr": user_json["crUseTreeOfLife"],
-            "used_meteorite_cr": user_json["crUseMeteorite"],
-            "used_mythril_cr": user_json["crUseMythril"],
-            "used_forcecore_cr": user_json["crUseForceCore"],
-            "used_blood_sample_cr": user_json["crUseVFBloodSample"],
-            "used_escapekit_cr": user_json["crUseRootkit"],
-            "used_emp_drone_cr": item_transferred.count(502308) * 30,
-            "used_basic_drone_cr": item_transferred.count(502208) * 20,
-            "used_camera_cr": item_transferred.count(502207) * 20,
-            "used_guillotine_cr": item_transferred.count(502405) * 100,
-            "used_c4_cr": item_transferred.count(502404) * 100,
-            "used_fried_chicken_cr": item_transferred.count(301316) * 25,
-            "used_rumi_signiture_cr": credit_source.get("GuideRobotSignature", 0),
-            "used_rumi_fragship_cr": credit_source.get("guideRobotFlagShip", 0),
-            "used_rumi_radial_cr": credit_source.get("GuideRobotRadial", 0)
-        }
-        
-        user_use_credit_list.append(use_credit)
-    
-    return user_use_credit_list
-
-def parse_match_user_credit_time(data: dict) -> List[dict]:
-    """각 유저의 1분 단위 크레딧 사용/획득량을 매치 데이터에서 추출하여 최대 20분까지 딕셔너리 리스트로 반환
+        version (int): versionMajor
+        specs (dict, optional): 테이블 이름을 key로 하는 TableSpec. Defaults to MATCH_TABLE_SPECS.
 
-    Args:
-        data (dict): 'userGames' 키를 포함한 매치 원본 데이터
+    Raises:
+        ValueError: 해당 버전에서 명세의 컬럼이 TABLE_COLUMNS와 다를 때 발생
 
     Returns:
-        List[dict]: 각 유저의 분 단위 크레딧 사용/획득 정보를 담은 딕셔너리의 리스트
+        Callable: (match_info 행 튜플, userGames 리스트)를 받아 parse_match_rows와 같은 결과를 반환하는 함수
     """
-    user_credit_time_list = []
-    
-    for user_json in data.get("userGames", []):
-        match_id = user_json["gameId"]
-        user_id = user_json["userNum"]
-        
-        for minute in range(20):  # 20 minutes maximum
-            used_credit = user_json["usedVFCredits"][minute]
-            gain_credit = user_json["totalVFCredits"][minute]
-            
-            # credit이 0이 아닌 경우에만 저장
-            if used_credit != 0 or gain_credit != 0:
-                user_credit_time = {
-                    "match_id": match_id,
-                    "user_id": user_id,
-                    "minute": minute,
-                    "used_credit": used_credit,
-                    "gain_credit": gain_credit
-                }
-                
-                user_credit_time_list.append(user_credit_time)
-    
-    return user_credit_time_list
-
-def parse_match_data(data: dict) -> Dict[str, Any]:
-    """경기와 관한 정보를 파싱하여 딕셔너리로 반환
+    expected_tables = [table for table in TABLE_COLUMNS if table != "match_info"]
+    if list(specs) != expected_tables:
+        raise ValueError(f"match spec tables {list(specs)} differ from TABLE_COLUMNS {expected_tables}")
+
+    containers = {}  # 컨테이너 식 -> 지역 변수 이름
+    values = {}      # 값 식 -> 사용 횟수 (두 번 이상이면 지역 변수로)
+
+    def value_expr(source: str, default) -> str:
+        container, value = _source_expr(source, default)
+        if container is not None:
+            value = value.format(containers.setdefault(container, f"c{len(containers)}"))
+        values[value] = values.get(value, 0) + 1
+        return value
+
+    tables = {}
+    for table, spec in specs.items():
+        fields = [field for field in spec.fields if field.applies_to(version)]
+        columns = tuple(field.column for field in fields)
+        if spec.series is not None:
+            columns += (spec.series.index_column,) + tuple(field.column for field in spec.series.fields)
+        if columns != TABLE_COLUMNS[table]:
+            raise ValueError(f"match spec for {table} (version {version}) has columns {columns}, "
+                             f"expected {TABLE_COLUMNS[table]}")
+        key = value_expr(spec.key, REQUIRED) if spec.key else None
+        row = [(value_expr(field.source, field.default), field.transform) for field in fields]
+        series = None
+        if spec.series is not None:
+            series = [(value_expr(field.source, field.default), field.transform) for field in spec.series.fields]
+        tables[table] = (key, row, series)
+
+    hoisted = {value: f"v{i}" for i, value in enumerate(value for value, count in values.items() if count > 1)}
+
+    def render(value: str, transform: str | None) -> str:
+        value = hoisted.get(value, value)
+        return transform.format(value) if transform else value
+
+    lines = ["def extract(match_info, user_games):"]
+    for table, (key, _, _) in tables.items():
+        lines.append(f"    rows_{table} = []")
+        lines.append(f"    append_{table} = rows_{table}.append")
+        if key is not None:
+            lines.append(f"    seen_{table} = set()")
+    lines.append("    for u in user_games:")
+    for container, name in containers.items():
+        lines.append(f"        {name} = {container}")
+    for value, name in hoisted.items():
+        lines.append(f"        {name} = {value}")
+    for table, (key, row, series) in tables.items():
+        values_code = ", ".join(render(value, transform) for value, transform in row)
+        if key is not None:
+            key = hoisted.get(key, key)
+            lines.append(f"        if {key} not in seen_{table}:")
+            lines.append(f"            seen_{table}.add({key})")
+            lines.append(f"            append_{table}(({values_code},))")
+        elif series is not None:
+            for i, (value, _) in enumerate(series):
+                lines.append(f"        s{i} = {hoisted.get(value, value)}")
+            lines.append(f"        for i in range({specs[table].series.length}):")
+            for i in range(len(series)):
+                lines.append(f"            a{i} = s{i}[i]")
+            row_code = ", ".join([values_code, "i"] + [
+                transform.format(f"a{i}") if transform else f"a{i}" for i, (_, transform) in enumerate(series)])
+            if specs[table].series.skip_zero:
+                lines.append(f"            if {' or '.join(f'a{i} != 0' for i in range(len(series)))}:")
+                lines.append(f"                append_{table}(({row_code}))")
+            else:
+                lines.append(f"            append_{table}(({row_code}))")
+        else:
+            lines.append(f"        append_{table}(({values_code},))")
+    lines.append("    return {")
+    lines.append('        "match_info": [match_info],')
+    for table in tables:
+        lines.append(f'        "{table}": rows_{table},')
+    lines.append("    }")
+
+    source = "\n".join(lines) + "\n"
+    namespace = {"none_if_zero": _none_if_zero}
+    exec(compile(source, f"<match extractor v{version}>", "exec"), namespace)
+    extract = namespace["extract"]
+    extract.source = source
+    return extract
+
+def get_match_extractor(version: int):
+    """게임 버전별로 한 번만 컴파일한 추출 함수를 반환"""
+    if not hasattr(get_match_extractor, "_extractors"):
+        get_match_extractor._extractors = {}
+    extractor = get_match_extractor._extractors.get(version)
+    if extractor is None:
+        extractor = get_match_extractor._extractors[version] = compile_match_extractor(version)
+    return extractor
+
+def parse_match_rows(data: dict) -> Dict[str, List[tuple]]:
+    """경기 데이터를 테이블별 행 튜플 리스트로 파싱
+
+    match_spec의 필드 매핑을 경기 버전(versionMajor)에 맞게 컴파일한 추출 함수로
+    userGames를 한 번만 순회하면서 유저 레코드마다 모든 테이블의 행을 만든다.
+    행은 TABLE_COLUMNS의 컬럼 순서를 따른다.
 
     Args:
         data (dict): 매치 원본 데이터
 
     Returns:
-        Dict[str, Any]: 매치에 관한 주요 정보를 담은 딕셔너리
+        Dict[str, List[tuple]]: 테이블 이름을 key로 하는 행 튜플 리스트
     """
-    try:
-        result = {
-            "match_info": parse_match_info(data),
-            "match_team_info": parse_match_team_info(data),
-            "match_user_basic": parse_match_user_basic(data),
-            "match_user_equipment": parse_match_user_equipment(data),
-            "match_user_stat": parse_match_user_stat(data),
-            "match_user_damage": parse_match_user_damage(data),
-            "match_user_trait": parse_match_user_trait(data),
-            "match_user_mmr": parse_match_user_mmr(data),
-            "user_match_kda_detail": parse_user_match_kda_detail(data),
-            "match_user_sight": parse_match_user_sight(data),
-            "object": parse_object(data),
-            "match_user_gain_credit": parse_match_user_gain_credit(data),
-            "match_user_use_credit": parse_match_user_use_credit(data),
-            "match_user_credit_time": parse_match_user_credit_time(data)
-        }
-        
-        return result
-    except Exception as e:
-        print(f"Error parsing match data: {e}")
-        raise
-    
+    match_info = match_info_row(data)
+    return get_match_extractor(match_info[MATCH_VERSION_INDEX])(match_info, data["userGames"])
+
 def parse_game_character(character_data: dict, levelup_data: dict) -> List[dict]:
     """캐릭터 기본 정보와 레벨업 능력치 데이터를 합쳐 캐릭터별 정보를 딕셔너리 리스트로 반환
 
@@ -700,12 +475,12 @@ def parse_txt_to_dict(txt: str) -> Dict[str, str]:
             result[key.strip()] = value.strip()
     return result
 
-def parse_trait_info(data: dict, txt_mapping: Dict[str, str]) -> List[dict]:
+def parse_trait_info(data: dict, txt_mapping: Mapping[str, str]) -> List[dict]:
     """특정 구분자(┃)로 구분된 텍스트에서 특성 관련 정보를 trait_id-trait_name 형식의 딕셔너리로 변환
 
     Args:
         data (dict): 특성 정보가 담긴 데이터
-        txt_mapping (Dict[str, str]): 특성 코드에 대응하는 이름 매핑 딕셔너리
+        txt_mapping (Mapping[str, str]): 특성 코드에 대응하는 이름 매핑 (딕셔너리 또는 l10n_index.L10nIndex)
 
     Returns:
         List[dict]: 각 특성의 ID와 이름을 담은 딕셔너리 리스트
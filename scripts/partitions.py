@@ -0,0 +1,133 @@
+import argparse
+import logging
+from typing import List
+from dotenv import load_dotenv
+from db_utils import get_db_connection
+from storage import get_storage_backend
+from known_ids import remove_index_file
+from stats import STAT_COLUMNS
+
+load_dotenv()
+
+# 파티션 스키마(db/schema_partitioned.sql)의 version_major RANGE 파티션
+# p{버전}은 version_major < 버전 + 1 인 행, p_future는 아직 파티션이 없는 이후 버전의 행을 담는다
+FUTURE_PARTITION = "p_future"
+
+def version_partitioned_tables(conn) -> List[str]:
+    """현재 데이터베이스에서 version_major로 RANGE 파티션된 테이블"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT TABLE_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND PARTITION_METHOD = 'RANGE' "
+            "AND REPLACE(PARTITION_EXPRESSION, '`', '') = 'version_major' ORDER BY TABLE_NAME"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+def version_partitions(conn, table: str) -> List[tuple]:
+    """테이블의 파티션을 (이름, 상한, 행 수 추정치) 튜플로 순서대로 반환. p_future의 상한은 None"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY PARTITION_ORDINAL_POSITION", (table,)
+        )
+        return [
+            (name, None if description == "MAXVALUE" else int(description), rows)
+            for name, description, rows in cursor.fetchall()
+        ]
+
+def add_version_partition(conn, version: int) -> List[str]:
+    """p_future를 나눠 version 파티션(p{version})을 모든 version_major 파티션 테이블에 추가
+
+    RANGE 파티션은 상한이 증가하는 순서여야 하므로 이미 더 높은 버전의 파티션이 있으면 건너뛴다
+    (그 버전의 행은 상한이 더 높은 파티션에 들어감). p_future가 비어 있으면 메타데이터만 바뀌어 바로 끝난다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        version (int): 게임 버전 (version_major)
+
+    Returns:
+        List[str]: 파티션을 추가한 테이블
+    """
+    logger = logging.getLogger(__name__)
+    added = []
+    for table in version_partitioned_tables(conn):
+        partitions = version_partitions(conn, table)
+        bounds = [bound for _, bound, _ in partitions if bound is not None]
+        if any(name == f"p{version}" for name, _, _ in partitions):
+            continue
+        if bounds and version + 1 <= max(bounds):
+            logger.warning(f"{table}: version {version} is below the last partition bound {max(bounds)}; not added")
+            continue
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} INTO ("
+                f"PARTITION p{version} VALUES LESS THAN ({version + 1}), "
+                f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE)"
+            )
+        added.append(table)
+    if added:
+        logger.info(f"Added partition p{version} to {len(added)} tables")
+    return added
+
+def drop_version_partition(conn, version: int) -> List[str]:
+    """지난 패치의 파티션(p{version})을 모든 테이블에서 삭제. 행을 하나씩 지우지 않고 파티션 파일을 바로 삭제한다
+
+    가장 낮은 파티션은 상한보다 낮은 모든 버전의 행을 담으므로 함께 삭제된다.
+    삭제한 경기의 집계 행(stat_*)도 같은 버전 범위로 지운다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        version (int): 게임 버전 (version_major)
+
+    Returns:
+        List[str]: 파티션을 삭제한 테이블
+    """
+    logger = logging.getLogger(__name__)
+    dropped = []
+    lowest = False
+    for table in version_partitioned_tables(conn):
+        partitions = version_partitions(conn, table)
+        if any(name == f"p{version}" for name, _, _ in partitions):
+            lowest = lowest or partitions[0][0] == f"p{version}"
+            with conn.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {table} DROP PARTITION p{version}")
+            dropped.append(table)
+    if dropped:
+        logger.info(f"Dropped partition p{version} from {len(dropped)} tables")
+        stat_tables = set(STAT_COLUMNS) & get_storage_backend().table_names(conn)
+        with conn.cursor() as cursor:
+            for table in sorted(stat_tables):
+                cursor.execute(f"DELETE FROM {table} WHERE version_major {'<=' if lowest else '='} %s", (version,))
+                logger.info(f"Deleted {cursor.rowcount} {table} rows of version {version}{' and below' if lowest else ''}")
+        # 삭제한 경기가 저장된 match_id 인덱스에 남지 않도록 다음 실행에서 DB로부터 다시 만듦
+        remove_index_file()
+    return dropped
+
+def ensure_version_partition(version) -> List[str]:
+    """수집 전에 호출. 파티션 스키마이면 version 파티션을 만들고, 기본 스키마이거나 MySQL이 아니면 아무것도 하지 않음"""
+    if get_storage_backend().name != "mysql":
+        return []
+    conn = get_db_connection()
+    try:
+        return add_version_partition(conn, int(version))
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="version_major 파티션 관리 (db/schema_partitioned.sql)")
+    parser.add_argument("--add", type=int, nargs="+", default=[], help="추가할 버전 (낮은 버전부터)")
+    parser.add_argument("--drop", type=int, nargs="+", default=[], help="삭제할 지난 버전")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    conn = get_db_connection()
+    try:
+        for version in sorted(args.add):
+            add_version_partition(conn, version)
+        for version in args.drop:
+            drop_version_partition(conn, version)
+        for table in version_partitioned_tables(conn):
+            partitions = ", ".join(f"{name}({rows})" for name, _, rows in version_partitions(conn, table))
+            print(f"{table}: {partitions}")
+    finally:
+        conn.close()
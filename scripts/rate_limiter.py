@@ -0,0 +1,175 @@
+import os
+import asyncio
+from collections import deque
+from time import monotonic
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", 50))
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", 32))
+
+class AdaptiveRateLimiter:
+    """초당 요청 수(토큰 버킷)와 동시 요청 수를 함께 제한하는 rate limiter
+
+    응답 지연과 오류율이 안정적이면 동시 요청 수를 1씩 늘리고(additive increase),
+    429/5xx 응답이 오면 절반으로 줄인다(multiplicative decrease).
+    초당 요청 수는 API 할당량(rate)을 넘지 않는다.
+    """
+    def __init__(self, rate: float, max_concurrency: int, min_concurrency: int = 1,
+                 initial_concurrency: int | None = None, latency_target: float = 1.0):
+        """
+        Args:
+            rate (float): 초당 최대 요청 수
+            max_concurrency (int): 동시 요청 수 상한
+            min_concurrency (int, optional): 동시 요청 수 하한. Defaults to 1.
+            initial_concurrency (int | None, optional): 시작 동시 요청 수. Defaults to max_concurrency의 1/4.
+            latency_target (float, optional): 동시 요청 수를 늘릴 수 있는 평균 응답 시간(초). Defaults to 1.0.
+        """
+        self.rate = rate
+        self.burst = max(1.0, rate)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency = initial_concurrency or max(min_concurrency, max_concurrency // 4)
+        self.latency_target = latency_target
+
+        self._tokens = self.burst
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._latency = None
+        self._error_rate = 0.0
+        self._successes = 0
+        self._last_decrease = 0.0
+
+        self._loop = None
+        self._waiters = deque()
+        self._timer = None
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0, "increase": 0, "decrease": 0}
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        """토큰이 생기거나 일시 정지가 풀릴 때까지 남은 시간(초)"""
+        delay = self._paused_until - now
+        if self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self.rate)
+        return max(delay, 0.0)
+
+    def _grant(self) -> None:
+        self._tokens -= 1
+        self._in_flight += 1
+        self.stats["requests"] += 1
+
+    def _wake(self) -> None:
+        """대기 중인 요청에 가능한 만큼 슬롯을 배정하고, 토큰이 부족하면 타이머를 건다"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = monotonic()
+        self._refill(now)
+        while self._waiters and self._in_flight < self.concurrency:
+            delay = self._delay(now)
+            if delay > 0:
+                self._timer = self._loop.call_later(delay, self._wake)
+                return
+            fut = self._waiters.popleft()
+            if fut.done():  # 취소된 대기자
+                continue
+            self._grant()
+            fut.set_result(None)
+
+    async def acquire(self) -> float:
+        """요청 슬롯을 얻을 때까지 대기
+
+        Returns:
+            float: 요청 시작 시각(monotonic). release()에 그대로 넘긴다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio.run()이 새 이벤트 루프를 만든 경우 이전 루프의 대기자는 버린다
+            self._loop = loop
+            self._waiters.clear()
+            self._timer = None
+
+        now = monotonic()
+        self._refill(now)
+        if not self._waiters and self._in_flight < self.concurrency and self._delay(now) <= 0:
+            self._grant()
+            return now
+
+        fut = loop.create_future()
+        self._waiters.append(fut)
+        self._wake()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # 슬롯을 배정받은 직후 취소된 경우 슬롯 반환
+                self._in_flight -= 1
+                self._wake()
+            raise
+        return monotonic()
+
+    def release(self, started: float, status: int | None, retry_after: float | None = None) -> None:
+        """요청 결과를 반영하고 슬롯을 반환
+
+        Args:
+            started (float): acquire()가 반환한 요청 시작 시각
+            status (int | None): HTTP 상태 코드. 네트워크 오류로 응답이 없으면 None
+            retry_after (float | None, optional): 서버가 Retry-After로 알려준 대기 시간(초)
+        """
+        self._in_flight -= 1
+        now = monotonic()
+        failed = status is None or status == 429 or status >= 500
+        self._error_rate = 0.9 * self._error_rate + 0.1 * failed
+
+        if failed:
+            self.stats["errors"] += 1
+            if status == 429:
+                # 할당량 초과: 버킷을 비우고 잠시 요청을 멈춤
+                self.stats["throttled"] += 1
+                self._tokens = 0.0
+                self._paused_until = max(self._paused_until, now + (retry_after or 1.0))
+            self._decrease(now)
+        else:
+            latency = now - started
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            self._successes += 1
+            if (self._successes >= self.concurrency
+                    and self.concurrency < self.max_concurrency
+                    and self._latency <= self.latency_target
+                    and self._error_rate < 0.05):
+                self.concurrency += 1
+                self._successes = 0
+                self.stats["increase"] += 1
+
+        if self._loop is not None and not self._loop.is_closed():
+            self._wake()
+
+    def _decrease(self, now: float) -> None:
+        # 한 번의 응답 지연 시간 안에 들어온 연속 오류는 한 번만 반영
+        if now - self._last_decrease < (self._latency or 1.0):
+            return
+        self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+        self._successes = 0
+        self._last_decrease = now
+        self.stats["decrease"] += 1
+
+    def summary(self) -> str:
+        latency = f"{self._latency:.3f}s" if self._latency is not None else "-"
+        return (f"concurrency={self.concurrency}/{self.max_concurrency}, rate={self.rate}/s, "
+                f"avg_latency={latency}, requests={self.stats['requests']}, errors={self.stats['errors']}, "
+                f"throttled={self.stats['throttled']}, increase={self.stats['increase']}, decrease={self.stats['decrease']}")
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """프로세스 전역에서 공유하는 rate limiter를 반환
+
+    Returns:
+        AdaptiveRateLimiter: 모든 API 호출이 공유하는 rate limiter
+    """
+    if not hasattr(get_rate_limiter, "_limiter"):
+        get_rate_limiter._limiter = AdaptiveRateLimiter(API_RATE_LIMIT, API_MAX_CONCURRENCY)
+    return get_rate_limiter._limiter
@@ -0,0 +1,173 @@
+import os
+import argparse
+import logging
+from time import time
+from datetime import datetime
+from multiprocessing import cpu_count
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dotenv import load_dotenv
+from tqdm import tqdm
+from archive import get_match_archive
+from decoding import decode_match, decode_with_fallback
+from static_cache import get_static_cache
+from crawler import STATIC_URLS, L10N_URL
+from parsing import parse_game_character, parse_equipment, parse_trait_info, MATCH_VERSION_INDEX
+from l10n_index import get_l10n_index
+from db_utils import get_db_connection, DB_INSERT_MODE
+from utils import setup_logger, split_into_chunks, parse_match_payload, save_matches
+from storage import get_storage_backend
+from known_ids import get_known_match_ids
+from partitions import ensure_version_partition
+from parquet_sink import get_parquet_sink, use_mysql
+
+load_dotenv()
+
+def load_cached_static_data(version) -> dict:
+    """네트워크 요청 없이 정적 데이터 캐시만 읽어 정적 테이블 데이터를 만듦
+
+    Args:
+        version: 정적 데이터 캐시의 게임 버전
+
+    Raises:
+        FileNotFoundError: 캐시에 정적 데이터가 없을 때 발생
+
+    Returns:
+        dict: 테이블 이름을 key로 하는 정적 테이블 데이터
+    """
+    cache = get_static_cache()
+    static = {}
+    for key, url in STATIC_URLS.items():
+        entry = cache.load(url, version)
+        if entry is None:
+            raise FileNotFoundError(f"Static data cache for {url} (version {version}) not found. Run a crawl once first.")
+        static[key] = entry["body"]
+    return {
+        "game_character": parse_game_character(static["character"], static["levelup"]),
+        "equipment": parse_equipment(static["armor"], static["weapon"]),
+        "trait_info": parse_trait_info(static["trait"], get_l10n_index(L10N_URL, static["l10n"])),
+    }
+
+def parse_archived_matches(match_ids) -> list:
+    """프로세스 풀에서 실행. 아카이브에서 경기를 읽어 파싱
+
+    Args:
+        match_ids (List[int]): 파싱할 경기 ID 리스트
+
+    Returns:
+        list: (match_id, 파싱된 데이터 또는 None) 리스트
+    """
+    logger = logging.getLogger(__name__)
+    archive = get_match_archive()
+    results = []
+    for match_id in match_ids:
+        try:
+            match_data, _ = decode_with_fallback(decode_match, archive.read_raw(match_id))
+        except ValueError as e:
+            logger.error(f"[DECODE ERROR] match_id {match_id}: {e}")
+            results.append((match_id, None))
+            continue
+        results.append((match_id, parse_match_payload(match_id, match_data)))
+    return results
+
+def replay(version, batch_size: int = 100, workers: int | None = None, fresh: bool = True, bulk_load: bool = False) -> tuple:
+    """아카이브에 저장된 원본 경기를 다시 파싱해 OUTPUT_SINK(MySQL, Parquet)에 적재 (네트워크 요청 없음)
+
+    Args:
+        version: 정적 데이터 캐시의 게임 버전
+        batch_size (int, optional): 프로세스 하나에 넘기는 경기 수. Defaults to 100.
+        workers (int | None, optional): 파싱 프로세스 수. Defaults to cpu_count().
+        fresh (bool, optional): True면 DB 스키마를 새로 만든 뒤 적재. Defaults to True.
+        bulk_load (bool, optional): fresh일 때 외래 키와 보조 인덱스 없이 적재한 뒤 마지막에 무결성 검사와 함께 추가.
+            Defaults to False.
+
+    Returns:
+        tuple: (성공한 경기 수, 전체 경기 수)
+    """
+    logger = logging.getLogger(__name__)
+    workers = workers or cpu_count()
+    archive = get_match_archive()
+    if archive is None:
+        raise RuntimeError("data_raw is not set; there is no archive to replay")
+    match_ids = archive.match_ids()
+    logger.info(f"Replaying {len(match_ids)} archived matches with {workers} processes")
+
+    static_tables = load_cached_static_data(version)
+    sink = get_parquet_sink()
+    if sink is not None:
+        for table, data in static_tables.items():
+            sink.write_static(table, data)
+    backend = get_storage_backend()
+    if use_mysql():
+        if fresh:
+            backend.init_schema(bulk_load=bulk_load)
+        conn = get_db_connection()
+        try:
+            for table, data in static_tables.items():
+                backend.load_static_table(conn, table, data, DB_INSERT_MODE)
+        finally:
+            conn.close()
+
+    start_time = time()
+    success_count = 0
+    failures = []
+    # 파티션 스키마이면 아카이브에 섞인 버전마다 파티션을 만든 뒤 적재 (없으면 p_future에 쌓임)
+    partitioned_versions = set()
+    batches = split_into_chunks(match_ids, batch_size)
+    progress = tqdm(total=len(match_ids), desc="Replaying matches")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        next_batch = 0
+        # 메모리 사용량을 일정하게 유지하기 위해 프로세스 수의 2배만큼만 미리 제출
+        while next_batch < len(batches) or pending:
+            while next_batch < len(batches) and len(pending) < workers * 2:
+                pending.add(executor.submit(parse_archived_matches, batches[next_batch]))
+                next_batch += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results = future.result()
+                parsed = [(match_id, parsed_data) for match_id, parsed_data in results if parsed_data is not None]
+                if use_mysql():
+                    versions = {parsed_data["match_info"][0][MATCH_VERSION_INDEX] for _, parsed_data in parsed}
+                    for match_version in sorted(versions - partitioned_versions):
+                        ensure_version_partition(match_version)
+                        partitioned_versions.add(match_version)
+                saved = save_matches(parsed) if parsed else {}
+                for match_id, _ in results:
+                    if saved.get(match_id):
+                        success_count += 1
+                    else:
+                        failures.append(match_id)
+                    progress.update(1)
+    progress.close()
+    if sink is not None:
+        sink.flush()
+    get_known_match_ids().save()
+
+    elapsed_time = time() - start_time
+    rate = len(match_ids) / elapsed_time if elapsed_time else 0.0
+    logger.info(f"Replay completed in {elapsed_time:.2f} seconds ({rate:.1f} matches/s)")
+    if use_mysql() and fresh and bulk_load:
+        start_time = time()
+        orphans = backend.finalize_schema()
+        if orphans:
+            logger.error(f"Foreign keys were not added; orphan rows: {orphans}")
+        else:
+            logger.info(f"Constraints and indexes added in {time() - start_time:.2f} seconds")
+    logger.info(f"Replay Summary: {success_count}/{len(match_ids)} matches loaded successfully")
+    if failures:
+        logger.warning(f"{len(failures)} matches failed to replay: {failures[:20]}{' ...' if len(failures) > 20 else ''}")
+    return success_count, len(match_ids)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="data_raw 아카이브의 원본 경기를 다시 파싱해 DB에 적재")
+    parser.add_argument("--version", default=os.getenv("main_version"), help="정적 데이터 캐시의 게임 버전")
+    parser.add_argument("--batch-size", type=int, default=100, help="프로세스 하나에 넘기는 경기 수")
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--keep-schema", action="store_true", help="스키마를 새로 만들지 않고 기존 DB에 적재")
+    parser.add_argument("--bulk-load", action="store_true", help="외래 키와 보조 인덱스 없이 적재한 뒤 마지막에 추가")
+    args = parser.parse_args()
+
+    logger = setup_logger(os.getenv("log_path"))
+    logger.info(f"Replay started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    replay(args.version, batch_size=args.batch_size, workers=args.workers, fresh=not args.keep_schema,
+           bulk_load=args.bulk_load)
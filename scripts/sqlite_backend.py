@@ -0,0 +1,285 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import List
+from dotenv import load_dotenv
+from storage import StorageBackend
+from known_ids import remove_index_file
+from init_db import (
+    read_schema_statements, read_foreign_keys, read_primary_keys, FOREIGN_KEY_PATTERN, CREATE_INDEX_PATTERN,
+)
+
+load_dotenv()
+
+SQLITE_PATH = os.getenv("sqlite_path", "./data/er_dataset.sqlite3")
+# 커넥션마다 사용하는 페이지 캐시 크기(MiB)
+SQLITE_CACHE_MB = int(os.getenv("SQLITE_CACHE_MB", 64))
+# WAL에서 NORMAL은 커밋마다 fsync하지 않고 체크포인트에서만 동기화한다.
+# 전원이 꺼지면 마지막 커밋이 사라질 수 있지만 데이터베이스는 손상되지 않음 (FULL이면 커밋마다 동기화)
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").upper()
+# 다른 커넥션의 쓰기 트랜잭션이 끝나기를 기다리는 최대 시간(ms)
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", 60000))
+
+CREATE_TABLE_PATTERN = re.compile(r"CREATE TABLE (\w+)\s*\((.*?)\n\)(.*)$", re.I | re.S)
+COMMENT_PATTERN = re.compile(r"\s+COMMENT\s+'[^']*'", re.I)
+
+# 타임스탬프는 pymysql(escape_datetime)과 같은 'YYYY-MM-DD HH:MM:SS[.ffffff]' 형식의 문자열로 저장.
+# pymysql처럼 시간대(+09:00)는 버리고 벽시계 시각만 남김
+sqlite3.register_adapter(
+    datetime, lambda value: value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S"))
+
+def sqlite_schema_statements(schema_path: str | None = None) -> List[str]:
+    """MySQL 스키마 파일(CREDIT_TIME_LAYOUT 적용)을 SQLite용 문으로 변환
+
+    SQLite는 ALTER TABLE로 제약을 추가할 수 없으므로 외래 키는 CREATE TABLE의 테이블 제약으로 옮기고,
+    COMMENT와 파티션 절은 뺀다. BINARY(n)은 BLOB이 되며, 나머지 MySQL 타입 이름은 SQLite가 그대로 받아
+    INTEGER/TEXT/NUMERIC 타입 친화도로 저장한다. CREATE INDEX와 CREATE VIEW는 그대로 사용한다.
+
+    Args:
+        schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+
+    Raises:
+        ValueError: 외래 키가 아닌 ALTER TABLE 문이 있을 때 발생
+
+    Returns:
+        List[str]: SQLite에서 실행할 문 리스트 (정의 순서)
+    """
+    foreign_keys = {}
+    for foreign_key in read_foreign_keys(schema_path):
+        foreign_keys.setdefault(foreign_key.table, []).append(foreign_key)
+
+    statements = []
+    for stmt in read_schema_statements(schema_path):
+        if FOREIGN_KEY_PATTERN.match(stmt):
+            continue
+        table = CREATE_TABLE_PATTERN.match(stmt)
+        if table:
+            name, body, _ = table.groups()
+            body = COMMENT_PATTERN.sub("", body)
+            body = re.sub(r"\bBINARY\(\d+\)", "BLOB", body, flags=re.I)
+            constraints = [
+                f"  CONSTRAINT {fk.name} FOREIGN KEY ({', '.join(fk.columns)}) "
+                f"REFERENCES {fk.ref_table} ({', '.join(fk.ref_columns)})"
+                for fk in foreign_keys.get(name, ())
+            ]
+            statements.append(f"CREATE TABLE {name}\n(" + ",\n".join([body.rstrip()] + constraints) + "\n)")
+        elif re.match(r"ALTER TABLE", stmt, re.I):
+            raise ValueError(f"Unsupported statement for SQLite: {stmt[:80]}")
+        else:
+            statements.append(stmt)
+    return statements
+
+@lru_cache(maxsize=None)
+def sqlite_insert_sql(table: str, columns: tuple, mode: str) -> str:
+    """insert 방식에 맞는 SQLite INSERT 문
+
+    ignore는 INSERT OR IGNORE, upsert는 기본 키 충돌 시 기본 키가 아닌 컬럼을 새 값으로 갱신하는 ON CONFLICT 절이다.
+    기본 키 컬럼만 있는 행은 갱신할 값이 없어 ignore와 같다.
+
+    Args:
+        table (str): 테이블 이름
+        columns (tuple): 컬럼 순서
+        mode (str): 중복 키 처리 방식 (db_utils.DB_INSERT_MODES)
+
+    Raises:
+        ValueError: 알 수 없는 방식이거나, ignore/upsert인데 스키마에 테이블의 기본 키가 없을 때 발생
+
+    Returns:
+        str: ? 자리표시자를 사용한 INSERT 문
+    """
+    values = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+    if mode == "insert":
+        return values
+    if mode not in ("ignore", "upsert"):
+        raise ValueError(f"Unknown insert mode {mode!r}")
+    keys = read_primary_keys().get(table)
+    if not keys:
+        raise ValueError(f"Insert mode {mode!r} needs a primary key, but {table} has none in the schema")
+    updates = [column for column in columns if column not in keys]
+    if mode == "ignore" or not updates:
+        return values.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+    return (f"{values} ON CONFLICT ({', '.join(keys)}) DO UPDATE SET "
+            + ", ".join(f"{column} = excluded.{column}" for column in updates))
+
+@lru_cache(maxsize=None)
+def _placeholders(sql: str) -> str:
+    """pymysql의 %s 자리표시자를 SQLite의 ?로 바꿈"""
+    return sql.replace("%s", "?")
+
+def _ascii(value) -> int:
+    """MySQL ASCII(): 문자열/바이너리 값의 첫 바이트 (packed 크레딧 뷰에서 사용)"""
+    return ord(value[:1]) if value else 0
+
+class SQLiteCursor:
+    """pymysql 커서처럼 with 문과 %s 자리표시자를 지원하는 sqlite3 커서"""
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, sql: str, args=None) -> int:
+        self._cursor.execute(_placeholders(sql), args or ())
+        return self._cursor.rowcount
+
+    def executemany(self, sql: str, rows) -> int:
+        self._cursor.executemany(_placeholders(sql), rows)
+        return self._cursor.rowcount
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> list:
+        return self._cursor.fetchall()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+class SQLiteConnection:
+    """pymysql 커넥션과 같은 방식으로 쓰는 sqlite3 커넥션
+
+    트랜잭션 밖의 문장은 바로 커밋(autocommit)되고, begin()은 쓰기 잠금을 바로 잡는 BEGIN IMMEDIATE로
+    트랜잭션을 시작한다 (읽기로 시작한 트랜잭션이 나중에 쓰기로 바뀌며 SQLITE_BUSY로 실패하지 않도록).
+    close()는 아무것도 하지 않으며 스레드의 커넥션은 SQLiteBackend가 재사용한다.
+    """
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(self._conn.cursor())
+
+    def begin(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        self._conn.rollback()
+
+    def close(self) -> None:
+        pass
+
+class SQLiteBackend(StorageBackend):
+    """sqlite_path의 파일 하나에 저장하는 내장 백엔드 (STORAGE_BACKEND=sqlite)
+
+    WAL 저널이라 쓰는 동안에도 다른 커넥션이 읽을 수 있고, 쓰기 트랜잭션은 한 번에 하나만 열린다.
+    경기는 write_matches가 DB_COMMIT_MATCHES개씩 트랜잭션 하나로 묶어 적재하므로 커밋 횟수가 적다.
+    """
+    name = "sqlite"
+    max_writers = 1
+
+    def __init__(self, path: str = SQLITE_PATH):
+        """
+        Args:
+            path (str, optional): 데이터베이스 파일 경로. Defaults to SQLITE_PATH.
+        """
+        self.path = path
+        self._local = threading.local()
+
+    def _open(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT / 1000, isolation_level=None)
+        for pragma in (
+            "journal_mode = WAL",
+            f"synchronous = {SQLITE_SYNCHRONOUS}",
+            f"busy_timeout = {SQLITE_BUSY_TIMEOUT}",
+            f"cache_size = {-SQLITE_CACHE_MB * 1024}",
+            "temp_store = MEMORY",
+            "mmap_size = 268435456",
+            "foreign_keys = ON",
+        ):
+            conn.execute(f"PRAGMA {pragma}")
+        conn.create_function("ASCII", 1, _ascii, deterministic=True)
+        return conn
+
+    def connect(self) -> SQLiteConnection:
+        """스레드마다 커넥션 하나를 열어 재사용. fork된 프로세스에서는 부모의 커넥션을 쓰지 않고 새로 연결"""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            local.conn = SQLiteConnection(self._open())
+            local.pid = os.getpid()
+        return local.conn
+
+    def writer_connection(self) -> SQLiteConnection:
+        return self.connect()
+
+    def init_schema(self, bulk_load: bool = False, schema_path: str | None = None) -> None:
+        """데이터베이스 파일을 지우고 변환한 스키마로 새로 만듦. bulk_load면 보조 인덱스를 finalize_schema까지 미룸
+
+        외래 키는 테이블 정의에 들어가므로 bulk_load여도 적재하는 동안 검사된다.
+        """
+        statements = sqlite_schema_statements(schema_path)
+        self._local = threading.local()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+        conn = self.connect()
+        deferred = 0
+        with conn.cursor() as cursor:
+            conn.begin()
+            for stmt in statements:
+                if bulk_load and CREATE_INDEX_PATTERN.match(stmt):
+                    deferred += 1
+                    continue
+                cursor.execute(stmt)
+            conn.commit()
+        print(f"SQLite database '{self.path}' created with {len(statements) - deferred} statements.")
+        if bulk_load:
+            print(f"Bulk-load mode: {deferred} index statements deferred. Run 'init_db.py --finalize' after loading.")
+
+        # 저장된 match_id 인덱스는 삭제한 DB 기준이므로 함께 삭제
+        remove_index_file()
+
+    def finalize_schema(self, schema_path: str | None = None) -> dict:
+        """PRAGMA foreign_key_check로 무결성을 검사하고, 통과하면 미뤄 둔 인덱스를 만듦 (이미 있는 인덱스는 건너뜀)"""
+        conn = self.connect()
+        with conn.cursor() as cursor:
+            cursor.execute("PRAGMA foreign_key_check")
+            violations = cursor.fetchall()
+            orphans = {}
+            for table, _, parent, fk_id in violations:
+                cursor.execute(f"PRAGMA foreign_key_list({table})")
+                columns = tuple(row[3] for row in cursor.fetchall() if row[0] == fk_id)
+                name = next((fk.name for fk in read_foreign_keys(schema_path)
+                             if fk.table == table and fk.columns == columns), f"{table}->{parent}")
+                orphans[name] = orphans.get(name, 0) + 1
+            if orphans:
+                print(f"[FINALIZE ABORTED] {len(orphans)} foreign keys have orphan rows; no indexes were added")
+                return orphans
+            for stmt in sqlite_schema_statements(schema_path):
+                if CREATE_INDEX_PATTERN.match(stmt):
+                    cursor.execute(re.sub(r"INDEX\s+", "INDEX IF NOT EXISTS ", stmt, count=1, flags=re.I))
+        return {}
+
+    def insert_rows(self, conn, table: str, columns: tuple, rows: List[tuple], mode: str = "insert",
+                    loader: str | None = None) -> None:
+        with conn.cursor() as cursor:
+            cursor.executemany(sqlite_insert_sql(table, tuple(columns), mode), rows)
+
+    def increment_sql(self, table: str, key_columns: tuple, value_columns: tuple) -> str:
+        columns = key_columns + value_columns
+        updates = ", ".join(f"{column} = {column} + excluded.{column}" for column in value_columns)
+        return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))}) "
+                f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}")
+
+    def table_names(self, conn) -> set:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")
+            return {row[0] for row in cursor.fetchall()}
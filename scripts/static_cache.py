@@ -0,0 +1,84 @@
+import os
+import json
+from time import time
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_PATH = os.getenv("cache_path", "./cache/")
+# 캐시가 만료되기 전까지는 네트워크 요청 없이 디스크의 데이터를 사용
+STATIC_CACHE_TTL = int(os.getenv("STATIC_CACHE_TTL", 24 * 60 * 60))
+
+class StaticDataCache:
+    """endpoint와 게임 버전을 키로 정적 데이터를 저장하는 디스크 캐시
+
+    각 항목은 {cache_dir}/{version}/{endpoint}.json 파일 하나에 응답 본문과
+    ETag / Last-Modified / 저장 시각을 함께 보관한다. TTL이 지난 항목은
+    조건부 요청(If-None-Match, If-Modified-Since)으로 재검증한다.
+    """
+    def __init__(self, cache_dir: str = CACHE_PATH, ttl: int = STATIC_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, url: str, version) -> str:
+        parsed = urlparse(url)
+        name = parsed.path.strip("/").replace("/", "_") or parsed.netloc
+        return os.path.join(self.cache_dir, str(version), f"{name}.json")
+
+    def load(self, url: str, version) -> dict | None:
+        """캐시 항목을 읽음
+
+        Args:
+            url (str): 정적 데이터 URL
+            version: 게임 버전
+
+        Returns:
+            dict | None: {"body", "etag", "last_modified", "fetched_at"}. 없거나 손상되었으면 None
+        """
+        try:
+            with open(self._path(url, version), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """캐시 항목이 TTL 안에 있는지 확인"""
+        return time() - entry.get("fetched_at", 0) < self.ttl
+
+    def store(self, url: str, version, body, etag: str | None = None, last_modified: str | None = None) -> dict:
+        """응답 본문과 검증 헤더를 캐시에 저장
+
+        임시 파일에 쓴 뒤 교체하므로 동시에 실행 중인 다른 프로세스가 쓰다 만 파일을 읽지 않는다.
+
+        Returns:
+            dict: 저장된 캐시 항목
+        """
+        entry = {"body": body, "etag": etag, "last_modified": last_modified, "fetched_at": time()}
+        path = self._path(url, version)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return entry
+
+    def touch(self, url: str, version, entry: dict) -> dict:
+        """304 Not Modified 응답을 받은 항목의 저장 시각을 갱신"""
+        return self.store(url, version, entry["body"], entry.get("etag"), entry.get("last_modified"))
+
+    def conditional_headers(self, entry: dict | None) -> dict:
+        """재검증 요청에 사용할 조건부 요청 헤더를 반환"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+def get_static_cache() -> StaticDataCache:
+    """프로세스 전역에서 공유하는 정적 데이터 캐시를 반환"""
+    if not hasattr(get_static_cache, "_cache"):
+        get_static_cache._cache = StaticDataCache()
+    return get_static_cache._cache
@@ -0,0 +1,209 @@
+import argparse
+import logging
+from collections import defaultdict
+from typing import Dict, List
+from parsing import TABLE_COLUMNS, MATCH_VERSION_INDEX, MatchBatch
+from storage import get_storage_backend
+
+# 메타 통계 집계 테이블 (db/schema.sql의 stat_*). 평균은 합계 / games로 계산
+#   stat_character: 버전 × 캐릭터 × 무기 종류별 경기 수, 승리(팀 1위), 3위 이내, 피해량/킬 합계
+#   stat_equipment: 버전 × 캐릭터 × 최종 장비별 경기 수, 승리
+#   stat_trait: 버전 × 캐릭터 × 핵심 특성별 경기 수, 승리
+STAT_COLUMNS = {
+    "stat_character": (
+        ("version_major", "character_id", "weapon_type"),
+        ("games", "wins", "top3", "total_damage", "total_kills"),
+    ),
+    "stat_equipment": (
+        ("version_major", "character_id", "equipment_id"),
+        ("games", "wins"),
+    ),
+    "stat_trait": (
+        ("version_major", "character_id", "core_trait_id"),
+        ("games", "wins"),
+    ),
+}
+
+_INFO = TABLE_COLUMNS["match_info"]
+_TEAM = TABLE_COLUMNS["match_team_info"]
+_BASIC = TABLE_COLUMNS["match_user_basic"]
+_EQUIPMENT = TABLE_COLUMNS["match_user_equipment"]
+_TRAIT = TABLE_COLUMNS["match_user_trait"]
+EQUIPMENT_SLOTS = ("equipment_weapon", "equipment_chest", "equipment_head", "equipment_arm", "equipment_leg")
+
+def stat_sql(table: str) -> str:
+    """집계 테이블에 증분을 더하는 upsert 문 (MySQL: INSERT ... ON DUPLICATE KEY UPDATE)"""
+    return get_storage_backend().increment_sql(table, *STAT_COLUMNS[table])
+
+def match_stat_rows(match_batch: MatchBatch) -> Dict[str, List[tuple]]:
+    """배치에 모인 경기들의 행 튜플에서 집계 테이블별 증분 행을 계산
+
+    Args:
+        match_batch (MatchBatch): 적재할 경기 배치
+
+    Returns:
+        Dict[str, List[tuple]]: 집계 테이블 이름 → (키 컬럼..., 증분 값...) 튜플 리스트
+    """
+    info_match, team_match, team_id, team_ranking = (
+        _INFO.index("match_id"), _TEAM.index("match_id"), _TEAM.index("team_id"), _TEAM.index("team_ranking"))
+    versions = {row[info_match]: row[MATCH_VERSION_INDEX] for row in match_batch.tables["match_info"].rows}
+    rankings = {(row[team_match], row[team_id]): row[team_ranking] for row in match_batch.tables["match_team_info"].rows}
+
+    # 유저별 (버전, 캐릭터, 승리 여부)
+    b_match, b_user, b_team, b_character, b_weapon, b_damage, b_kill = (
+        _BASIC.index(column) for column in
+        ("match_id", "user_id", "team_id", "character_id", "weapon_type", "total_damage_to_player", "total_kill"))
+    players = {}
+    character = defaultdict(lambda: [0, 0, 0, 0, 0])
+    for row in match_batch.tables["match_user_basic"].rows:
+        ranking = rankings.get((row[b_match], row[b_team]))
+        version = versions[row[b_match]]
+        win = 1 if ranking == 1 else 0
+        players[(row[b_match], row[b_user])] = (version, row[b_character], win)
+        stat = character[(version, row[b_character], row[b_weapon])]
+        stat[0] += 1
+        stat[1] += win
+        stat[2] += 1 if ranking is not None and ranking <= 3 else 0
+        stat[3] += row[b_damage]
+        stat[4] += row[b_kill]
+
+    e_match, e_user = _EQUIPMENT.index("match_id"), _EQUIPMENT.index("user_id")
+    slots = tuple(_EQUIPMENT.index(column) for column in EQUIPMENT_SLOTS)
+    equipment = defaultdict(lambda: [0, 0])
+    for row in match_batch.tables["match_user_equipment"].rows:
+        player = players.get((row[e_match], row[e_user]))
+        if player is None:
+            continue
+        version, character_id, win = player
+        for equipment_id in {row[i] for i in slots} - {None, 0}:
+            stat = equipment[(version, character_id, equipment_id)]
+            stat[0] += 1
+            stat[1] += win
+
+    t_match, t_user, t_core = _TRAIT.index("match_id"), _TRAIT.index("user_id"), _TRAIT.index("core_trait_id")
+    trait = defaultdict(lambda: [0, 0])
+    for row in match_batch.tables["match_user_trait"].rows:
+        player = players.get((row[t_match], row[t_user]))
+        if player is None or not row[t_core]:
+            continue
+        version, character_id, win = player
+        stat = trait[(version, character_id, row[t_core])]
+        stat[0] += 1
+        stat[1] += win
+
+    return {
+        table: [key + tuple(values) for key, values in stats.items()]
+        for table, stats in (("stat_character", character), ("stat_equipment", equipment), ("stat_trait", trait))
+    }
+
+def stats_enabled(conn) -> bool:
+    """집계 테이블이 있는지 여부 (프로세스마다 한 번만 확인). 예전 스키마로 만든 DB에서는 집계를 건너뜀"""
+    if not hasattr(stats_enabled, "_enabled"):
+        stats_enabled._enabled = set(STAT_COLUMNS) <= get_storage_backend().table_names(conn)
+        if not stats_enabled._enabled:
+            logging.getLogger(__name__).warning("Stat tables not found; run init_db or stats.py --rebuild after creating them")
+    return stats_enabled._enabled
+
+def add_match_stats(conn, match_batch: MatchBatch) -> None:
+    """경기 배치의 증분을 집계 테이블에 더함. 경기 행과 같은 트랜잭션(savepoint) 안에서 호출해 함께 커밋/롤백되도록 한다
+
+    적재 프로세스가 여럿이면 같은 집계 행을 동시에 갱신하므로, 테이블마다 키 순서로 정렬해
+    모든 프로세스가 같은 순서로 행 잠금을 잡도록 한다(교착 상태 방지).
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        match_batch (MatchBatch): 적재한 경기 배치
+    """
+    if not stats_enabled(conn):
+        return
+    with conn.cursor() as cursor:
+        for table, rows in match_stat_rows(match_batch).items():
+            if rows:
+                key_size = len(STAT_COLUMNS[table][0])
+                cursor.executemany(stat_sql(table), sorted(rows, key=lambda row: row[:key_size]))
+
+REBUILD_SQL = {
+    "stat_character": """
+        INSERT INTO stat_character (version_major, character_id, weapon_type, games, wins, top3, total_damage, total_kills)
+        SELECT m.version_major, b.character_id, b.weapon_type, COUNT(*), SUM(t.team_ranking = 1), SUM(t.team_ranking <= 3),
+               SUM(b.total_damage_to_player), SUM(b.total_kill)
+        FROM match_user_basic b
+        JOIN match_info m ON m.match_id = b.match_id
+        LEFT JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id
+        {where}
+        GROUP BY m.version_major, b.character_id, b.weapon_type""",
+    "stat_equipment": """
+        INSERT INTO stat_equipment (version_major, character_id, equipment_id, games, wins)
+        SELECT m.version_major, b.character_id, slot.equipment_id, COUNT(*), SUM(t.team_ranking = 1)
+        FROM match_user_basic b
+        JOIN match_info m ON m.match_id = b.match_id
+        LEFT JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id
+        JOIN (
+            SELECT DISTINCT match_id, user_id, equipment_id FROM (
+                SELECT match_id, user_id, equipment_weapon AS equipment_id FROM match_user_equipment
+                UNION ALL SELECT match_id, user_id, equipment_chest FROM match_user_equipment
+                UNION ALL SELECT match_id, user_id, equipment_head FROM match_user_equipment
+                UNION ALL SELECT match_id, user_id, equipment_arm FROM match_user_equipment
+                UNION ALL SELECT match_id, user_id, equipment_leg FROM match_user_equipment
+            ) slots WHERE equipment_id IS NOT NULL AND equipment_id <> 0
+        ) slot ON slot.match_id = b.match_id AND slot.user_id = b.user_id
+        {where}
+        GROUP BY m.version_major, b.character_id, slot.equipment_id""",
+    "stat_trait": """
+        INSERT INTO stat_trait (version_major, character_id, core_trait_id, games, wins)
+        SELECT m.version_major, b.character_id, tr.core_trait_id, COUNT(*), SUM(t.team_ranking = 1)
+        FROM match_user_basic b
+        JOIN match_info m ON m.match_id = b.match_id
+        LEFT JOIN match_team_info t ON t.match_id = b.match_id AND t.team_id = b.team_id
+        JOIN match_user_trait tr ON tr.match_id = b.match_id AND tr.user_id = b.user_id
+        WHERE tr.core_trait_id <> 0 {and_where}
+        GROUP BY m.version_major, b.character_id, tr.core_trait_id""",
+}
+
+def rebuild_stats(conn, version: int | None = None) -> None:
+    """원본 매치 테이블에서 집계 테이블을 다시 계산 (version이 주어지면 해당 버전만). 한 트랜잭션으로 교체
+
+    DB_INSERT_MODE가 ignore/upsert이면 증분 집계를 하지 않으므로 적재한 뒤 이 함수로 집계 테이블을 만든다.
+
+    Args:
+        conn (Any): 데이터베이스 연결 객체
+        version (int | None, optional): 다시 계산할 게임 버전. Defaults to None (전체).
+    """
+    logger = logging.getLogger(__name__)
+    condition = "m.version_major = %s" if version is not None else ""
+    args = (version,) if version is not None else None
+    conn.begin()
+    try:
+        with conn.cursor() as cursor:
+            for table, sql in REBUILD_SQL.items():
+                if version is not None:
+                    cursor.execute(f"DELETE FROM {table} WHERE version_major = %s", args)
+                else:
+                    cursor.execute(f"DELETE FROM {table}")
+                cursor.execute(sql.format(
+                    where=f"WHERE {condition}" if condition else "",
+                    and_where=f"AND {condition}" if condition else "",
+                ), args)
+                logger.info(f"Rebuilt {table}: {cursor.rowcount} rows")
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+if __name__ == "__main__":
+    from db_utils import get_db_connection
+
+    parser = argparse.ArgumentParser(description="메타 통계 집계 테이블 관리")
+    parser.add_argument("--rebuild", action="store_true", help="원본 매치 테이블에서 집계 테이블을 다시 계산")
+    parser.add_argument("--version", type=int, default=None, help="다시 계산할 게임 버전 (기본: 전체)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.rebuild:
+        conn = get_db_connection()
+        try:
+            rebuild_stats(conn, args.version)
+        finally:
+            conn.close()
+    else:
+        parser.print_help()
@@ -0,0 +1,130 @@
+import os
+from abc import ABC, abstractmethod
+from typing import List
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 경기/정적 데이터를 저장할 데이터베이스
+#   mysql: .env의 MySQL 서버 (db_utils.MySQLBackend)
+#   sqlite: sqlite_path의 파일 하나로 된 내장 데이터베이스 (sqlite_backend.SQLiteBackend).
+#           서버 없이 단일 노드 수집, 테스트, 벤치마크에 사용
+STORAGE_BACKENDS = ("mysql", "sqlite")
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "mysql").lower()
+
+class StorageBackend(ABC):
+    """경기 적재 코드가 사용하는 데이터베이스 백엔드 인터페이스
+
+    커넥션은 pymysql과 같은 방식(cursor()를 with로 사용, %s 자리표시자, begin/commit/rollback/close)으로 쓸 수 있어야 하며,
+    db_utils의 transaction/savepoint/write_matches와 집계·인덱스 코드는 이 커넥션으로 백엔드와 관계없이 동작한다.
+    SQL 방언이 다른 부분(대량 삽입, 중복 키 처리, 스키마 생성)만 백엔드가 구현한다.
+    """
+    name = None
+    # 동시에 쓰기 트랜잭션을 열 수 있는 커넥션 수. None이면 제한 없음 (DB 적재 프로세스 수의 상한)
+    max_writers = None
+
+    @abstractmethod
+    def connect(self):
+        """조회와 정적 데이터 저장에 쓰는 커넥션. close()하면 백엔드에 반납"""
+
+    @abstractmethod
+    def writer_connection(self):
+        """DB 적재 프로세스가 실행 내내 사용하는 커넥션"""
+
+    @abstractmethod
+    def init_schema(self, bulk_load: bool = False, schema_path: str | None = None) -> None:
+        """데이터베이스를 새로 만들고 스키마 파일의 테이블을 생성 (기존 데이터 삭제)
+
+        Args:
+            bulk_load (bool, optional): 제약/보조 인덱스를 finalize_schema까지 미룸. Defaults to False.
+            schema_path (str | None, optional): 스키마 파일 경로. Defaults to 환경 변수 schema_path.
+        """
+
+    @abstractmethod
+    def finalize_schema(self, schema_path: str | None = None) -> dict:
+        """bulk_load로 미뤄 둔 제약/인덱스를 무결성 검사 후 추가
+
+        Returns:
+            dict: 부모 행이 없는 자식 행이 있는 외래 키 → 행 수 (비어 있으면 완료)
+        """
+
+    @abstractmethod
+    def insert_rows(self, conn, table: str, columns: tuple, rows: List[tuple], mode: str, loader: str | None = None) -> None:
+        """행 튜플을 일괄 삽입
+
+        Args:
+            conn (Any): 커넥션
+            table (str): 테이블 이름
+            columns (tuple): 컬럼 순서
+            rows (List[tuple]): 컬럼 순서대로 값을 담은 튜플 리스트
+            mode (str): 중복 키 처리 방식 (db_utils.DB_INSERT_MODES)
+            loader (str | None, optional): 적재 방식 (MySQL의 db_utils.BULK_LOADERS, 다른 백엔드는 무시). Defaults to None.
+        """
+
+    @abstractmethod
+    def increment_sql(self, table: str, key_columns: tuple, value_columns: tuple) -> str:
+        """키가 같은 행이 있으면 value_columns에 새 값을 더하고, 없으면 삽입하는 SQL (%s 자리표시자)"""
+
+    @abstractmethod
+    def table_names(self, conn) -> set:
+        """데이터베이스의 테이블과 뷰 이름"""
+
+    def existing_match_ids(self, conn, match_ids) -> set:
+        """match_ids 중 match_info에 이미 있는 match_id"""
+        match_ids = list(match_ids)
+        existing = set()
+        with conn.cursor() as cursor:
+            # 자리표시자 수 제한(SQLite 기본 32766)보다 작게 나눠 조회
+            for start in range(0, len(match_ids), 10000):
+                chunk = match_ids[start:start + 10000]
+                cursor.execute(f"SELECT match_id FROM match_info WHERE match_id IN ({', '.join(['%s'] * len(chunk))})", tuple(chunk))
+                existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def is_table_empty(self, conn, table: str) -> bool:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT 1 FROM {table} LIMIT 1")
+            return cursor.fetchone() is None
+
+    def load_static_table(self, conn, table: str, data: List[dict], mode: str) -> bool:
+        """정적 테이블(캐릭터, 장비, 특성)을 트랜잭션 하나로 저장
+
+        insert 방식이면 테이블이 비어 있을 때만 저장하고, ignore/upsert 방식이면 새 패치의 항목을 추가(갱신)하도록 항상 저장한다.
+
+        Args:
+            conn (Any): 커넥션
+            table (str): 테이블 이름
+            data (List[dict]): 저장할 행 딕셔너리 리스트
+            mode (str): 중복 키 처리 방식 (db_utils.DB_INSERT_MODES)
+
+        Returns:
+            bool: 저장했으면 True, 테이블이 비어 있지 않아 건너뛰었으면 False
+        """
+        if not data or (mode == "insert" and not self.is_table_empty(conn, table)):
+            return False
+        columns = tuple(data[0])
+        conn.begin()
+        try:
+            self.insert_rows(conn, table, columns, [tuple(row.get(column) for column in columns) for row in data], mode)
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        return True
+
+def get_storage_backend() -> StorageBackend:
+    """STORAGE_BACKEND에 맞는 프로세스 전역 백엔드 (처음 호출할 때 생성)
+
+    Raises:
+        ValueError: STORAGE_BACKEND가 STORAGE_BACKENDS에 없을 때 발생
+    """
+    if not hasattr(get_storage_backend, "_backend"):
+        if STORAGE_BACKEND == "mysql":
+            from db_utils import MySQLBackend
+            get_storage_backend._backend = MySQLBackend()
+        elif STORAGE_BACKEND == "sqlite":
+            from sqlite_backend import SQLiteBackend
+            get_storage_backend._backend = SQLiteBackend()
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND {STORAGE_BACKEND!r}; expected one of {STORAGE_BACKENDS}")
+    return get_storage_backend._backend
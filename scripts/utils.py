@@ -2,19 +2,36 @@ from datetime import datetime
 import asyncio
 import logging
 import os
-from time import time, sleep
+from time import time
 from dotenv import load_dotenv
 from tqdm import tqdm
-from typing import Optional
 from multiprocessing import cpu_count
 from crawler import (
-    match_info, get_character, get_equipment, get_trait, get_l10n, 
-    get_match_ids_async, get_match_infos_async
+    get_static_data, get_match_ids_async, fetch_match_payload, L10N_URL,
 )
-from parsing import parse_match_data
-from db_utils import get_db_connection, insert_list, get_column_as_dict, is_table_empty, save_parsed_data_to_db, match_exists
+from parsing import parse_match_rows
+from rate_limiter import get_rate_limiter
+from archive import get_match_archive
+from watermark import UserWatermarks
+from parquet_sink import get_parquet_sink, use_mysql
+from db_utils import (
+    get_db_connection, write_matches, get_writer_connection, write_match_batch, DB_INSERT_MODE,
+)
+from known_ids import get_known_match_ids
+from storage import get_storage_backend
+from partitions import ensure_version_partition
 from concurrent.futures import ProcessPoolExecutor
-from parsing import parse_game_character, parse_equipment, parse_trait_info, parse_txt_to_dict
+from parsing import parse_game_character, parse_equipment, parse_trait_info
+from l10n_index import get_l10n_index
+
+load_dotenv()
+
+DB_WRITERS = int(os.getenv("DB_WRITERS", 2))
+# DB 적재 worker 하나가 한 번에 모아서 적재하는 최대 경기 수
+DB_BATCH_MATCHES = int(os.getenv("DB_BATCH_MATCHES", 50))
+# 재시도까지 실패한 경기를 같은 실행 안에서 다시 큐에 넣는 최대 횟수
+API_REQUEUE_LIMIT = int(os.getenv("API_REQUEUE_LIMIT", 2))
+FAILED_FILE_PREFIX = "failed_match_ids_"
 
 def setup_logger(LOG_DIR: str):
     """지정한 디렉토리에 로그 파일을 생성하고 파일 및 콘솔 로그를 동시에 출력하는 로거를 선언하는 함수
@@ -47,207 +64,389 @@ def split_into_chunks(lst, chunk_size):
     """
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
-def fetch_match_data_with_retry(match_id: int, max_retries: int = 1) -> Optional[dict]:
-    """_summary_
+def parse_match_payload(match_id, match_data):
+    """파이프라인의 파싱 단계. 프로세스 풀에서 실행되어 원본 경기 데이터를 파싱
 
     Args:
-        match_id (int): _description_
-        max_retries (int, optional): _description_. Defaults to 1.
+        match_id (int): 경기 고유 ID
+        match_data (dict): 경기 원본 데이터
 
     Returns:
-        Optional[dict]: _description_
+        dict | None: parse_match_rows의 테이블별 행 튜플. 건너뛰거나 파싱에 실패하면 None
     """
     logger = logging.getLogger(__name__)
-    
-    for attempt in range(max_retries):
-        raw = match_info(match_id)
-        if raw:
-            return raw
-        logger.warning(f"[RETRY] match_id {match_id} attempt {attempt+1}/{max_retries} failed.")
-        time.sleep(1 + attempt)
-    return None
-
-def process_match_batch(batch_data):
-    logger = logging.getLogger(__name__)
-    """배치 단위로 매치 데이터를 처리"""
-    results = []
-    for match_id, match_data in batch_data:
-        try:
-            result = process_match_id(match_id, match_data)
-            results.append((match_id, result))
-        except Exception as e:
-            logger.error(f"Error processing match {match_id}: {e}")
-            results.append((match_id, False))
-    return results
+    # 매치에 참여한 유저가 21명 미만일 경우 skip
+    if len(match_data["userGames"]) < 21:
+        logger.info(f"[SKIP] match_id {match_id} userGames length < 21")
+        return None
+    try:
+        return parse_match_rows(match_data)
+    except Exception as e:
+        logger.error(f"[PARSE ERROR] match_id {match_id}: {e}", exc_info=True)
+        return None
 
-def process_match_id(match_id, match_data):
-    """주어진 match_id와 match_data를 처리하여 데이터베이스에 저장
+def save_matches(items, db_writers: ProcessPoolExecutor | None = None) -> dict:
+    """파이프라인의 DB 적재 단계. 파싱된 여러 경기를 OUTPUT_SINK(MySQL / Parquet / 둘 다)에 한 번에 저장
+
+    이미 있는 경기를 저장된 match_id 인덱스(known_ids)로 DB 조회 없이 거른 뒤, 나머지 경기는 write_matches로 DB_COMMIT_MATCHES개씩
+    트랜잭션 하나에 대량 적재한다. 적재에 실패한 경기만 savepoint로 롤백되어 실패로 표시되고,
+    저장에 성공한 경기는 인덱스에 추가된다.
 
     Args:
-        match_id (str): 경기 고유 ID
-        match_data (dict): 경기 데이터 (없을 경우 None)
+        items (List[tuple]): (match_id, parse_match_rows의 결과) 리스트
+        db_writers (ProcessPoolExecutor | None, optional): 커넥션을 하나씩 소유한 DB 적재 프로세스.
+            None이면 현재 프로세스의 커넥션 풀로 적재. Defaults to None.
 
     Returns:
-        bool: 처리 성공 시 True, 실패 시 False
+        dict: match_id별 저장(또는 이미 존재) 성공 여부
     """
     logger = logging.getLogger(__name__)
+    match_ids = [match_id for match_id, _ in items]
     conn = None
     try:
-        conn = get_db_connection()
-
-        if match_exists(conn, match_id):
-            logger.info(f"[SKIP] match_id {match_id} already exists.")
-            conn.close()
-            return True
-
-        # 데이터 가져오기
-        if match_data is None:
-            raw = fetch_match_data_with_retry(match_id)
-            if raw is None:
-                logger.warning(f"[SKIP] match_id {match_id} returned None after retries.")
-                conn.close()
-                return False
-        else:
-            raw = match_data
-
-        # 매치에 참여한 유저가 21명 미만일 경우 skip
-        if len(raw["userGames"]) < 21:
-            logger.info(f"[SKIP] match_id {match_id} userGames length < 21")
-            conn.close()
-            return False
-        
-        # 파싱
-        try:
-            parsed_data = parse_match_data(raw)
-        except Exception as e:
-            logger.error(f"[PARSE ERROR] match_id {match_id}: {e}", exc_info=True)
+        results = {}
+        known = get_known_match_ids()
+        new_match_ids = set(known.filter_new(match_ids))
+        for match_id in match_ids:
+            if match_id not in new_match_ids:
+                logger.info(f"[SKIP] match_id {match_id} already exists.")
+                results[match_id] = True
+        new_items = [(match_id, match_rows) for match_id, match_rows in items if match_id in new_match_ids]
+        if use_mysql() and new_items:
+            if db_writers is not None:
+                saved = db_writers.submit(write_match_batch, new_items).result()
+            else:
+                conn = get_db_connection()
+                saved = write_matches(conn, new_items)
+            results.update(saved)
+            new_items = [(match_id, match_rows) for match_id, match_rows in new_items if saved[match_id]]
+        # MySQL에 저장된 경기만 Parquet에도 기록 (둘 다 사용할 때 두 출력이 같은 경기를 갖도록)
+        sink = get_parquet_sink()
+        if sink is not None:
+            for _, match_rows in new_items:
+                sink.add(match_rows)
+        known.add(match_id for match_id, _ in new_items)
+        for match_id, _ in new_items:
+            logger.info(f"[SUCCESS] match_id {match_id} saved.")
+            results[match_id] = True
+        return results
+    except Exception as e:
+        logger.error(f"[DB ERROR] match_ids {match_ids}: {e}")
+        return {match_id: False for match_id in match_ids}
+    finally:
+        if conn:
             conn.close()
-            return False
 
-        # 저장
-        try:
-            save_parsed_data_to_db(conn, parsed_data)
-        except Exception as e:
-            logger.error(f"[DB ERROR] match_id {match_id}: {e}")
-            conn.close()
-            return False
+def save_match(match_id, match_rows) -> bool:
+    """경기 하나를 save_matches로 저장
 
-        logger.info(f"[SUCCESS] match_id {match_id} saved.")
-        conn.close()
-        return True
+    Args:
+        match_id (int): 경기 고유 ID
+        match_rows (dict): parse_match_rows의 결과
 
-    except Exception as e:
-        logger.error(f"[FATAL ERROR] match_id {match_id} failed: {e}")
-        sleep(5.0)
-        process_match_id(match_id, match_data)
-        return False
+    Returns:
+        bool: 저장(또는 이미 존재) 시 True, 실패 시 False
+    """
+    return save_matches([(match_id, match_rows)])[match_id]
+
+async def run_match_pipeline(session, match_ids, queue_size: int, num_fetchers: int, num_parsers: int, num_writers: int,
+                             requeue_limit: int = API_REQUEUE_LIMIT, batch_matches: int = DB_BATCH_MATCHES) -> dict:
+    """fetch → parse → DB 적재 단계를 크기가 제한된 큐로 연결해 스트리밍으로 처리
+
+    각 단계는 동시에 실행되므로 수집 직후부터 경기가 DB에 적재되고,
+    data_raw가 설정되어 있으면 받은 원본 데이터는 압축 아카이브에도 저장된다.
+    뒤 단계가 느리면 큐가 가득 차서 앞 단계가 대기(backpressure)하므로
+    메모리에는 최대 queue_size * 2개 정도의 경기만 올라간다.
+    재시도 후에도 요청에 실패한 경기는 requeue_limit번까지 fetch 큐 맨 뒤에 다시 넣는다.
+
+    Args:
+        session (aiohttp.ClientSession): 실행 전체에서 공유하는 API 세션
+        match_ids (List[int]): 처리할 경기 ID 리스트
+        queue_size (int): 단계 사이 큐의 최대 크기
+        num_fetchers (int): API 요청 worker 수
+        num_parsers (int): 파싱 프로세스 수
+        num_writers (int): DB 적재 worker 수. MySQL에 저장할 때는 worker마다 커넥션 하나를 소유한 적재 프로세스를 사용
+        requeue_limit (int, optional): 실패한 경기를 다시 요청하는 최대 횟수. Defaults to API_REQUEUE_LIMIT.
+        batch_matches (int, optional): DB 적재 worker가 한 번에 적재하는 최대 경기 수. Defaults to DB_BATCH_MATCHES.
+
+    Returns:
+        dict: match_id별 처리 성공 여부
+    """
+    logger = logging.getLogger(__name__)
+    loop = asyncio.get_running_loop()
+    id_queue = asyncio.Queue()
+    for match_id in match_ids:
+        id_queue.put_nowait((match_id, 0))
+    raw_queue = asyncio.Queue(maxsize=queue_size)
+    parsed_queue = asyncio.Queue(maxsize=queue_size)
+    results = {}
+    archive = get_match_archive()
+    progress = tqdm(total=len(match_ids), desc="Processing matches")
+
+    def finish(match_id, success):
+        results[match_id] = success
+        progress.update(1)
+
+    async def fetcher(session):
+        while True:
+            match_id, requeued = await id_queue.get()
+            try:
+                try:
+                    match_data, body = await fetch_match_payload(session, match_id)
+                except Exception as e:
+                    logger.error(f"[FETCH ERROR] match_id {match_id}: {e}")
+                    match_data, body = None, None
+                if body is not None and archive is not None:
+                    # 응답 원본을 그대로 압축 아카이브에 보관 (재파싱/백필용, 디코딩에서 버린 필드와 디코딩 실패 응답 포함)
+                    try:
+                        await asyncio.to_thread(archive.append_raw, match_id, body)
+                    except Exception as e:
+                        logger.error(f"[ARCHIVE ERROR] match_id {match_id}: {e}")
+                if match_data is not None:
+                    await raw_queue.put((match_id, match_data))
+                elif body is not None:
+                    # 응답은 받았지만 JSON이 아님: 다시 요청해도 같으므로 다시 큐에 넣지 않음
+                    logger.error(f"[DECODE ERROR] match_id {match_id}: response body is not JSON")
+                    finish(match_id, False)
+                elif requeued < requeue_limit:
+                    logger.warning(f"[REQUEUE] match_id {match_id} ({requeued+1}/{requeue_limit})")
+                    id_queue.put_nowait((match_id, requeued + 1))
+                else:
+                    finish(match_id, False)
+            finally:
+                id_queue.task_done()
+
+    async def parser(executor):
+        while (item := await raw_queue.get()) is not None:
+            match_id, match_data = item
+            try:
+                parsed_data = await loop.run_in_executor(executor, parse_match_payload, match_id, match_data)
+            except Exception as e:
+                logger.error(f"[PARSE ERROR] match_id {match_id}: {e}")
+                parsed_data = None
+            if parsed_data is None:
+                finish(match_id, False)
+                continue
+            await parsed_queue.put((match_id, parsed_data))
+
+    async def writer():
+        done = False
+        while not done:
+            item = await parsed_queue.get()
+            if item is None:
+                break
+            # 큐에 이미 쌓여 있는 경기를 DB_BATCH_MATCHES개까지 모아 한 번에 적재
+            items = [item]
+            while len(items) < batch_matches and not parsed_queue.empty():
+                item = parsed_queue.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                items.append(item)
+            for match_id, success in (await asyncio.to_thread(save_matches, items, db_writers)).items():
+                finish(match_id, success)
+
+    # 파싱 프로세스는 파싱만 하고, DB 적재는 커넥션을 하나씩 소유한 num_writers개의 프로세스가 처리
+    # (코어 수와 관계없이 적재용 커넥션 수가 num_writers개로 고정). 쓰기 트랜잭션이 하나뿐인 백엔드(SQLite)는 그 수로 제한
+    db_writers = None
+    if use_mysql():
+        max_writers = get_storage_backend().max_writers or num_writers
+        db_writers = ProcessPoolExecutor(max_workers=min(num_writers, max_writers), initializer=get_writer_connection)
+    try:
+        writers = [asyncio.create_task(writer()) for _ in range(num_writers)]
+        with ProcessPoolExecutor(max_workers=num_parsers) as executor:
+            parsers = [asyncio.create_task(parser(executor)) for _ in range(num_parsers)]
+            fetchers = [asyncio.create_task(fetcher(session)) for _ in range(num_fetchers)]
+            await id_queue.join()
+            for task in fetchers:
+                task.cancel()
+            await asyncio.gather(*fetchers, return_exceptions=True)
+            for _ in parsers:
+                await raw_queue.put(None)
+            await asyncio.gather(*parsers)
+        for _ in writers:
+            await parsed_queue.put(None)
+        await asyncio.gather(*writers)
     finally:
-        if conn:
+        if db_writers is not None:
+            db_writers.shutdown()
+    progress.close()
+    return results
+
+async def process_match_ids(session, match_ids, batch_size, log_dir, start_date) -> int:
+    """경기 ID 목록을 스트리밍 파이프라인으로 처리하고, 실패한 경기 ID를 파일로 저장
+
+    Args:
+        session (aiohttp.ClientSession): 실행 전체에서 공유하는 API 세션
+        match_ids (List[int]): 처리할 경기 ID 리스트
+        batch_size (int): 단계 사이 큐의 최대 크기
+        log_dir (str): 실패 목록을 저장할 경로
+        start_date (str): 수집 시작 일자 (실패 목록 파일명에 사용)
+
+    Returns:
+        int: 처리에 성공한 경기 수
+    """
+    logger = logging.getLogger(__name__)
+    # fetch → parse → DB 적재 스트리밍 처리
+    num_parsers = cpu_count()
+    logger.info(f"Streaming {len(match_ids)} matches (queue size {batch_size}, {num_parsers} parser processes, {DB_WRITERS} DB writer processes)...")
+    results = await run_match_pipeline(
+        session,
+        match_ids,
+        queue_size=batch_size,
+        num_fetchers=get_rate_limiter().max_concurrency,
+        num_parsers=num_parsers,
+        num_writers=DB_WRITERS,
+    )
+    logger.info(f"API rate limiter: {get_rate_limiter().summary()}")
+    sink = get_parquet_sink()
+    if sink is not None:
+        # 남은 행을 파일로 기록 (중간에 종료되어도 처리한 경기는 Parquet에 남도록)
+        await asyncio.to_thread(sink.flush)
+        logger.info(f"Parquet sink: {sink.rows_written} rows written to {sink.root}")
+    # 이번에 저장한 경기까지 인덱스 파일에 기록 (다음 실행은 이후에 저장된 경기만 DB에서 읽음)
+    await asyncio.to_thread(get_known_match_ids().save)
+
+    # 처리 결과 요약
+    success_count = sum(1 for success in results.values() if success)
+    failures = [match_id for match_id, success in results.items() if not success]
+
+    # 실패 match_id 저장 (같은 실행의 여러 chunk가 한 파일에 이어서 기록)
+    if failures:
+        fail_path = os.path.join(log_dir, f"{FAILED_FILE_PREFIX}{start_date}.txt")
+        with open(fail_path, "a", encoding="utf-8") as f:
+            for mid in failures:
+                f.write(f"{mid}\n")
+        logger.warning(f"{len(failures)} matches failed and were saved to: {fail_path}")
+    return success_count
+
+def read_failed_match_ids(log_dir: str, exclude_path: str | None = None) -> tuple:
+    """log_dir의 failed_match_ids_*.txt 파일에서 실패한 경기 ID를 읽음
+
+    Args:
+        log_dir (str): 실패 목록 파일이 있는 경로
+        exclude_path (str | None, optional): 읽지 않을 파일 (현재 실행의 실패 목록)
+
+    Returns:
+        tuple: (중복이 제거된 경기 ID 리스트, 읽은 파일 경로 리스트)
+    """
+    match_ids = set()
+    paths = sorted(
+        os.path.join(log_dir, name) for name in os.listdir(log_dir)
+        if name.startswith(FAILED_FILE_PREFIX) and name.endswith(".txt")
+    )
+    paths = [path for path in paths if path != exclude_path]
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            match_ids.update(int(line) for line in f if line.strip())
+    return sorted(match_ids), paths
+
+async def resume_failed(session, batch_size, log_dir, start_date):
+    """이전 실행에서 실패한 경기만 다시 요청해 처리 (--resume-failed)
+
+    읽은 실패 목록 파일은 '.resumed'를 붙여 이름을 바꾸고,
+    이번에도 실패한 경기는 새 실패 목록 파일에 저장한다.
+
+    Returns:
+        tuple: (성공한 경기 수, 전체 경기 수)
+    """
+    logger = logging.getLogger(__name__)
+    start_time = time()
+    current_fail_path = os.path.join(log_dir, f"{FAILED_FILE_PREFIX}{start_date}.txt")
+    match_ids, paths = read_failed_match_ids(log_dir, exclude_path=current_fail_path)
+    logger.info(f"Resuming {len(match_ids)} failed match IDs from {len(paths)} files")
+
+    known = await asyncio.to_thread(get_known_match_ids)
+    match_ids = known.filter_new(match_ids)
+    logger.info(f"Drop exist match IDs in Database. {len(match_ids)} match IDs to refetch")
+
+    success_count = await process_match_ids(session, match_ids, batch_size, log_dir, start_date)
+    for path in paths:
+        os.replace(path, f"{path}.resumed")
+
+    elapsed_time = time() - start_time
+    logger.info(f"Resume completed in {elapsed_time:.2f} seconds")
+    logger.info(f"Successfully processed {success_count} out of {len(match_ids)} matches")
+    return success_count, len(match_ids)
+
+async def load_static_data(session, version):
+    """정적 데이터(캐릭터, 장비, 특성)를 가져와 해당 테이블이 비어 있으면 저장
+
+    Args:
+        session (aiohttp.ClientSession): 실행 전체에서 공유하는 API 세션
+        version: 게임 버전 (정적 데이터 캐시 키)
+    """
+    logger = logging.getLogger(__name__)
+    # 정적 데이터 가져오기 (디스크 캐시가 유효하면 네트워크 요청 없음)
+    logger.info("Fetching static data...")
+    static = await get_static_data(session, version)
+    # l10n 버전별로 한 번만 만든 mmap 인덱스에서 특성 이름 조회
+    txt_mapping = await asyncio.to_thread(get_l10n_index, L10N_URL, static["l10n"])
+
+    # 정적 데이터 파싱 및 저장
+    logger.info("Parsing and saving static data...")
+    result = {
+        "game_character": parse_game_character(static["character"], static["levelup"]),
+        "equipment": parse_equipment(static["armor"], static["weapon"]),
+        "trait_info": parse_trait_info(static["trait"], txt_mapping),
+    }
+
+    def save(result):
+        sink = get_parquet_sink()
+        if sink is not None:
+            for key, data in result.items():
+                sink.write_static(key, data)
+        if not use_mysql():
+            return
+        backend = get_storage_backend()
+        conn = get_db_connection()
+        try:
+            for key, data in result.items():
+                # ignore/upsert 방식이면 테이블이 비어 있지 않아도 그대로 써서 새 패치의 항목을 추가(갱신)
+                if backend.load_static_table(conn, key, data, DB_INSERT_MODE):
+                    logger.info(f"Wrote {len(data)} records into {key} (insert mode {DB_INSERT_MODE})")
+                else:
+                    logger.info(f"Skipping {key}: table is not empty")
+        finally:
             conn.close()
-            
-def collect_data(users, main_version, batch_size, log_dir, start_date):
+
+    await asyncio.to_thread(save, result)
+
+async def collect_data(session, users, main_version, batch_size, log_dir, start_date, use_watermarks: bool = True):
     """
     사용자 게임 데이터를 수집하고 처리
     
     Args:
+        session: 실행 전체에서 공유하는 API 세션 (crawler.create_session)
         user_count: 수집할 상위 사용자 수
         main_version: 게임 버전
         batch_size: 배치 처리 크기
         log_dir: 로그 저장 경로
         start_date: 수집 시작 일자
+        use_watermarks: False면 watermark를 무시하고 패치 버전 시작까지 전체 기록을 탐색 (watermark는 갱신)
     """
     logger = logging.getLogger(__name__)
     start_time = time()
     logger.info(f"Starting data collection with {len(users)} users")
     
-    # 정적 데이터 먼저 처리
-    conn = get_db_connection()
-    
-    # DB에 이미 있는 match_id 가져오기(중복 제거용)
-    exist_match_ids = get_column_as_dict(conn, "match_info", ["match_id", "version_major"])
-    exist_match_ids = exist_match_ids["match_id"]
-    
-    try:
-        # 정적 데이터 가져오기
-        logger.info("Fetching static data...")
-        character_data, levelup_data = get_character()
-        l10n = get_l10n()
-        txt_mapping = parse_txt_to_dict(l10n)
-        armor, weapon = get_equipment()
-        trait = get_trait()
-
-        # 정적 데이터 파싱 및 저장
-        logger.info("Parsing and saving static data...")
-        result = {
-            "game_character": parse_game_character(character_data, levelup_data),
-            "equipment": parse_equipment(armor, weapon),
-            "trait_info": parse_trait_info(trait, txt_mapping),
-        }
-
-        for key, data in result.items():
-            if is_table_empty(conn, key):
-                logger.info(f"Inserting {len(data)} records into {key} (table is empty)")
-                insert_list(conn, key, data)
-            else:
-                logger.info(f"Skipping {key}: table is not empty")
-    finally:
-        conn.close()
+    # 이미 저장된 match_id 인덱스 (인덱스 파일 + 지난 실행 이후에 저장된 경기만 DB에서 읽음, 중복 제거용)
+    known = await asyncio.to_thread(get_known_match_ids)
+    if use_mysql():
+        # 파티션 스키마이면 수집할 버전의 파티션을 미리 만듦 (기본 스키마이면 아무것도 하지 않음)
+        await asyncio.to_thread(ensure_version_partition, main_version)
     
-    # 비동기로 매치 ID 수집
+    # 비동기로 매치 ID 수집 (유저별 watermark에 도달하면 탐색 종료)
     logger.info(f"Collecting match IDs for {len(users)} users...")
-    match_ids = asyncio.run(get_match_ids_async(users, main_version))
+    watermarks = UserWatermarks(main_version)
+    match_ids = await get_match_ids_async(users, main_version, session=session, watermarks=watermarks,
+                                          use_watermarks=use_watermarks)
     logger.info(f"Collected {len(match_ids)} unique match IDs")
-    match_ids = list(set(match_ids) - set(exist_match_ids))
+    match_ids = known.filter_new(set(match_ids))
     logger.info(f"Drop exist match IDs in Database. {len(match_ids)} unique match IDs")
     
-    # 비동기로 매치 데이터 수집
-    logger.info(f"Fetching match data in batches of {batch_size}...")
-    match_data_dict = asyncio.run(get_match_infos_async(match_ids, batch_size))
-    logger.info(f"Successfully fetched {len(match_data_dict)} match data")
-    
-    # 처리를 위한 배치 생성
-    batches = []
-    current_batch = []
-    
-    for match_id in match_ids:
-        match_data = match_data_dict.get(match_id)
-        current_batch.append((match_id, match_data))
-        
-        if len(current_batch) >= batch_size:
-            batches.append(current_batch)
-            current_batch = []
-    
-    if current_batch:  # 남은 배치 처리
-        batches.append(current_batch)
-
-    async def process_batches_async(batches):
-        loop = asyncio.get_running_loop()
-        results = []
-        with ProcessPoolExecutor(max_workers=cpu_count()) as executor:
-            tasks = [
-                loop.run_in_executor(executor, process_match_batch, batch)
-                for batch in batches
-            ]
-            for f in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Processing batches"):
-                result = await f
-                results.append(result)
-        return results
-
-    logger.info(f"Processing {len(batches)} batches with {cpu_count()} processes (async)...")
-    results = asyncio.run(process_batches_async(batches))    
-    
-    # 처리 결과 요약
-    flat_results = [item for sublist in results for item in sublist]
-    success_count = sum(1 for _, success in flat_results if success)
-    failures = [match_id for match_id, success in flat_results if not success]
-
-    # 실패 match_id 저장
-    if failures:
-        fail_path = os.path.join(log_dir, f"failed_match_ids_{start_date}.txt")
-        with open(fail_path, "w", encoding="utf-8") as f:
-            for mid in failures:
-                f.write(f"{mid}\n")
-        logger.warning(f"{len(failures)} matches failed and were saved to: {fail_path}")
+    success_count = await process_match_ids(session, match_ids, batch_size, log_dir, start_date)
+    # 처리가 끝난 뒤에 watermark 저장 (실패한 경기는 실패 목록 파일로 --resume-failed에서 다시 처리)
+    watermarks.save()
 
     # 소요 시간 계산
     elapsed_time = time() - start_time
@@ -0,0 +1,59 @@
+import os
+import json
+from dotenv import load_dotenv
+
+load_dotenv()
+
+WATERMARK_PATH = os.getenv("watermark_path", "./data/watermarks.json")
+
+class UserWatermarks:
+    """유저별로 지난 수집에서 본 가장 최근 gameId(watermark)를 게임 버전별로 저장
+
+    파일 형식: {"46": {"<userNum>": <gameId>, ...}, ...}
+    유저 게임 목록은 최신 경기부터 내려오므로 watermark 이하의 gameId가 나오면
+    그 뒤는 이미 수집한 경기이고 탐색을 멈춰도 된다.
+    """
+    def __init__(self, version, path: str = WATERMARK_PATH):
+        """
+        Args:
+            version: 수집 대상 게임 버전 (main_version)
+            path (str, optional): watermark 파일 경로. Defaults to WATERMARK_PATH.
+        """
+        self.version = str(version)
+        self.path = path
+        self._all = self._read()
+        self.marks = {int(user): int(game_id) for user, game_id in self._all.get(self.version, {}).items()}
+
+    def _read(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def get(self, user_num: int) -> int | None:
+        return self.marks.get(int(user_num))
+
+    def update(self, user_num: int, game_id: int) -> None:
+        """더 최근 gameId일 때만 watermark를 갱신"""
+        user_num = int(user_num)
+        if game_id > self.marks.get(user_num, 0):
+            self.marks[user_num] = game_id
+
+    def save(self) -> None:
+        """watermark 파일을 원자적으로 저장
+
+        파일에 저장된 watermark와 합쳐 유저마다 더 최근 gameId를 남기므로,
+        유저를 나눠 수집한 다른 청크(또는 다른 실행)가 저장한 watermark를 지우지 않는다.
+        """
+        self._all = self._read()
+        stored = self._all.setdefault(self.version, {})
+        for user, game_id in self.marks.items():
+            if game_id > stored.get(str(user), 0):
+                stored[str(user)] = game_id
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._all, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,58 @@
+"""테스트 공통 설정
+
+scripts/와 benchmarks/의 모듈을 그대로 import 한다. 모듈은 import할 때 .env 설정을 읽으므로
+import 전에 저장소를 임시 디렉토리의 SQLite 백엔드로 맞춘다. MySQL 서버는 필요 없다.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = tempfile.mkdtemp(prefix="er_test_")
+os.environ.update({
+    "STORAGE_BACKEND": "sqlite",
+    "sqlite_path": os.path.join(TEST_DIR, "test.sqlite3"),
+    "known_ids_path": os.path.join(TEST_DIR, "known_match_ids.bin"),
+    "schema_path": os.path.join(ROOT, "db", "schema.sql"),
+    "DB_INSERT_MODE": "insert",
+    "CREDIT_TIME_LAYOUT": "rows",
+})
+sys.path[:0] = [os.path.join(ROOT, "scripts"), os.path.join(ROOT, "benchmarks")]
+
+from payloads import synthetic_match  # noqa: E402
+from parsing import parse_match_rows  # noqa: E402
+from storage import get_storage_backend  # noqa: E402
+from db_utils import get_db_connection  # noqa: E402
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+def match_items(match_ids, version: int = 46) -> list:
+    """가짜 경기들의 (match_id, parse_match_rows 결과) 리스트 (write_matches 입력)"""
+    return [(match_id, parse_match_rows(synthetic_match(match_id, version=version))) for match_id in match_ids]
+
+def table_counts(conn, match_id: int, tables) -> dict:
+    """테이블별로 경기 하나의 행 수"""
+    counts = {}
+    with conn.cursor() as cursor:
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE match_id = %s", (match_id,))
+            counts[table] = cursor.fetchone()[0]
+    return counts
+
+@pytest.fixture
+def conn(tmp_path):
+    """테스트마다 새로 만든 SQLite 데이터베이스의 커넥션
+
+    정적 테이블(캐릭터, 장비, 특성)은 비워 두므로 외래 키 검사를 끈다 (benchmarks/bench_storage.py와 같음).
+    """
+    backend = get_storage_backend()
+    backend.path = str(tmp_path / "er.sqlite3")
+    backend.init_schema()
+    conn = get_db_connection()
+    with conn.cursor() as cursor:
+        cursor.execute("PRAGMA foreign_keys = OFF")
+    yield conn
+    conn.close()
@@ -0,0 +1,75 @@
+import pytest
+import init_db
+import db_utils
+import credit_timeline
+from conftest import match_items
+from parsing import RowBatch, TABLE_COLUMNS
+from storage import get_storage_backend
+from db_utils import get_db_connection, write_matches
+from credit_timeline import (
+    CREDIT_MINUTES, CREDIT_TIME_TABLE, CREDIT_TIMELINE_TABLE, expand_credit_batch, pack_credit_batch, pack_credits, unpack_credits,
+)
+
+@pytest.fixture
+def packed_conn(monkeypatch, conn):
+    """conn 픽스처의 임시 데이터베이스를 CREDIT_TIME_LAYOUT=packed 스키마로 다시 만든 커넥션"""
+    monkeypatch.setattr(credit_timeline, "CREDIT_TIME_LAYOUT", "packed")
+    monkeypatch.setattr(init_db, "CREDIT_TIME_LAYOUT", "packed")
+    # 스키마에서 읽어 프로세스에 캐시한 컬럼/기본 키는 테스트가 끝나면 원래대로 되돌림
+    monkeypatch.delattr(db_utils.get_denormalized_columns, "_columns", raising=False)
+    monkeypatch.delattr(db_utils.get_primary_keys, "_keys", raising=False)
+    get_storage_backend().init_schema()
+    conn = get_db_connection()
+    with conn.cursor() as cursor:
+        cursor.execute("PRAGMA foreign_keys = OFF")
+    return conn
+
+def test_packed_credit_view_round_trip(packed_conn):
+    """packed 방식으로 적재한 분 단위 크레딧을 원래 이름의 뷰와 expand_credit_batch로 읽으면 파싱한 행과 같다"""
+    items = match_items(range(1, 4))
+    assert all(write_matches(packed_conn, items).values())
+    expected = sorted(row for _, match_rows in items for row in match_rows[CREDIT_TIME_TABLE])
+    assert expected
+
+    columns = TABLE_COLUMNS[CREDIT_TIME_TABLE]
+    with packed_conn.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {CREDIT_TIME_TABLE}")
+        assert sorted(cursor.fetchall()) == expected
+        cursor.execute(f"SELECT COUNT(*) FROM {CREDIT_TIMELINE_TABLE}")
+        assert cursor.fetchone()[0] == len({row[:2] for row in expected})
+
+        timeline_columns = ("match_id", "user_id", "used_credits", "gain_credits")
+        cursor.execute(f"SELECT {', '.join(timeline_columns)} FROM {CREDIT_TIMELINE_TABLE}")
+        packed = RowBatch(CREDIT_TIMELINE_TABLE, timeline_columns, cursor.fetchall())
+    assert sorted(expand_credit_batch(packed).rows) == expected
+
+def with_credits(match_rows: dict, values: list) -> dict:
+    """match_user_credit_time 앞쪽 행의 used_credit/gain_credit을 values로 바꾼 경기 행"""
+    columns = TABLE_COLUMNS[CREDIT_TIME_TABLE]
+    used, gain = columns.index("used_credit"), columns.index("gain_credit")
+    rows = list(match_rows[CREDIT_TIME_TABLE])
+    for i, value in enumerate(values):
+        row = list(rows[i])
+        row[used] = row[gain] = value
+        rows[i] = tuple(row)
+    return {**match_rows, CREDIT_TIME_TABLE: rows}
+
+def test_packed_credits_keep_smallint_range(packed_conn):
+    """행 방식의 SMALLINT처럼 음수와 범위 끝 값을 그대로 저장하고, 범위를 벗어난 경기만 명확한 오류로 실패한다"""
+    (first_id, first_rows), (second_id, second_rows) = match_items([1, 2])
+    signed = with_credits(first_rows, [-1, -32768, 32767, 12])
+    out_of_range = with_credits(second_rows, [40000])
+    assert write_matches(packed_conn, [(first_id, signed), (second_id, out_of_range)]) == {first_id: True, second_id: False}
+
+    columns = TABLE_COLUMNS[CREDIT_TIME_TABLE]
+    with packed_conn.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {CREDIT_TIME_TABLE}")
+        assert sorted(cursor.fetchall()) == sorted(signed[CREDIT_TIME_TABLE])
+
+    batch = RowBatch(CREDIT_TIME_TABLE, columns, out_of_range[CREDIT_TIME_TABLE])
+    with pytest.raises(ValueError, match="outside the SMALLINT range"):
+        pack_credit_batch(batch)
+
+def test_packed_credits_round_floats():
+    """실수 크레딧은 MySQL의 SMALLINT 변환처럼 0에서 먼 쪽으로 반올림한다"""
+    assert unpack_credits(pack_credits([2.5, -2.5, 3.0] + [0] * (CREDIT_MINUTES - 3)))[:3] == (3, -3, 3)
@@ -0,0 +1,37 @@
+import pytest
+from pymysql.converters import escape_datetime
+from conftest import match_items
+from parsing import TABLE_COLUMNS
+from storage import StorageBackend, get_storage_backend
+from db_utils import write_matches
+
+def test_static_table_insert_modes(conn):
+    """insert는 비어 있는 테이블에만 저장하고, ignore는 기존 행을 두고 새 행만, upsert는 기존 행을 갱신한다"""
+    backend = get_storage_backend()
+    assert backend.load_static_table(conn, "trait_info", [{"trait_id": 1, "trait_name": "insert"}], "insert")
+    assert not backend.load_static_table(conn, "trait_info", [{"trait_id": 1, "trait_name": "skipped"}], "insert")
+    backend.load_static_table(conn, "trait_info", [{"trait_id": 1, "trait_name": "ignore"}, {"trait_id": 2, "trait_name": "ignore"}], "ignore")
+    backend.load_static_table(conn, "trait_info", [{"trait_id": 2, "trait_name": "upsert"}], "upsert")
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT trait_id, trait_name FROM trait_info ORDER BY trait_id")
+        assert cursor.fetchall() == [(1, "insert"), (2, "upsert")]
+
+def test_timestamps_stored_like_pymysql(conn):
+    """TIMESTAMP 컬럼은 pymysql이 MySQL에 보내는 것과 같은 문자열(시간대 없음)로 저장된다"""
+    (match_id, match_rows), = match_items([1])
+    write_matches(conn, [(match_id, match_rows)])
+    info = dict(zip(TABLE_COLUMNS["match_info"], match_rows["match_info"][0]))
+    assert info["start_dtm"].utcoffset() is not None
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT start_dtm, match_expire_dtm FROM match_info WHERE match_id = %s", (match_id,))
+        stored = cursor.fetchone()
+    assert stored == tuple(escape_datetime(info[column]).strip("'") for column in ("start_dtm", "match_expire_dtm"))
+
+def test_backend_must_implement_interface():
+    """StorageBackend의 추상 메서드를 구현하지 않은 백엔드는 만들 수 없다"""
+    class PartialBackend(StorageBackend):
+        def connect(self):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialBackend()
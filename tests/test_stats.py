@@ -0,0 +1,45 @@
+import pytest
+from conftest import match_items
+from parsing import MatchBatch
+from db_utils import write_matches, save_match_batch, transaction, savepoint, get_denormalized_columns
+from stats import STAT_COLUMNS, rebuild_stats
+
+def stat_tables(conn) -> dict:
+    tables = {}
+    with conn.cursor() as cursor:
+        for table, (keys, _) in STAT_COLUMNS.items():
+            cursor.execute(f"SELECT * FROM {table} ORDER BY {', '.join(keys)}")
+            tables[table] = cursor.fetchall()
+    return tables
+
+def test_incremental_stats_match_rebuild(conn):
+    """적재하면서 더한 증분 집계가 원본 매치 테이블에서 다시 계산한 집계(stats.py --rebuild)와 같다
+
+    경기마다 다시 적재하는 경로(실패한 경기가 섞인 배치)와 버전이 다른 경기도 포함한다.
+    """
+    items = [item for version in (45, 46) for item in match_items(range(version * 100, version * 100 + 8), version=version)]
+    write_matches(conn, items[:6])
+    # 이미 저장된 경기가 섞여 경기마다 다시 적재하는 배치: 저장한 경기의 증분만 더해져야 함
+    saved = write_matches(conn, items[4:])
+    assert sum(saved.values()) == len(items) - 6
+
+    incremental = stat_tables(conn)
+    assert all(incremental.values())
+    rebuild_stats(conn)
+    assert stat_tables(conn) == incremental
+
+def test_rolled_back_match_leaves_no_increments(conn):
+    """집계 증분은 경기 행과 같은 savepoint에서 더해지므로 경기를 롤백하면 증분도 남지 않는다"""
+    (match_id, match_rows), = match_items([1])
+    with pytest.raises(RuntimeError):
+        with transaction(conn):
+            with savepoint(conn, "match"):
+                match_batch = MatchBatch(get_denormalized_columns())
+                match_batch.add(match_id, match_rows)
+                save_match_batch(conn, match_batch)
+                assert all(stat_tables(conn).values())
+                raise RuntimeError("fail after the match rows and increments were written")
+    assert not any(stat_tables(conn).values())
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM match_info")
+        assert cursor.fetchone()[0] == 0
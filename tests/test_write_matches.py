@@ -0,0 +1,19 @@
+from conftest import match_items, table_counts
+from parsing import TABLE_COLUMNS
+from db_utils import write_matches
+
+def test_failed_match_rolls_back_to_its_savepoint(conn):
+    """한 경기의 적재가 중간 테이블에서 실패하면 그 경기의 행만 모두 롤백되고 나머지 경기는 같은 트랜잭션으로 저장된다"""
+    items = match_items(range(1, 6))
+    # 마지막 테이블에 같은 행을 한 번 더 넣어 match_info 등 앞 테이블을 쓴 뒤 기본 키 충돌이 나게 함
+    bad_id, bad_rows = items[2]
+    last_table = next(table for table in reversed(TABLE_COLUMNS) if bad_rows.get(table))
+    bad_rows[last_table] = bad_rows[last_table] + bad_rows[last_table][:1]
+
+    saved = write_matches(conn, items, commit_matches=len(items))
+
+    assert saved == {1: True, 2: True, 3: False, 4: True, 5: True}
+    assert set(table_counts(conn, bad_id, TABLE_COLUMNS).values()) == {0}
+    for match_id, match_rows in items:
+        if match_id != bad_id:
+            assert table_counts(conn, match_id, match_rows) == {table: len(rows) for table, rows in match_rows.items()}